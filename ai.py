@@ -0,0 +1,56 @@
+"""
+Ryklių AI tvarkaraštis pagal detalumo lygį (LOD)
+"""
+from constants import *
+
+
+class SharkScheduler:
+    """Paskirsto ryklių atnaujinimus pagal atstumą iki blizgės
+    
+    Visi rykliai žingsnyje naudoja tą patį now_ms. Rykliai ne toliau nei
+    near_radius atnaujinami pilnai kiekvieną žingsnį (Shark.update). Toliau
+    esantys aktyvioje srityje kiekvieną žingsnį tik juda (Shark.move), o
+    sprendimą (Shark.think) priima kas SHARK_AI_THINK_INTERVAL žingsnių,
+    paeiliui pagal indeksą. Už aktyvios srities ryklys atnaujinamas visas kas
+    UW_FAR_UPDATE_INTERVAL žingsnių. Atstumas imamas iš paskutinio sprendimo;
+    near_radius gerokai didesnis už SHARK_ATTACK_RANGE, todėl tarp sprendimų
+    ryklys nespėja nepastebėtas priartėti iki puolimo atstumo. Burbulo
+    sulėtinimą Shark.move tikrina kiekvieną kartą, todėl jis veikia iš karto
+    visuose lygiuose.
+    """
+    def __init__(self, near_radius=SHARK_AI_NEAR_RADIUS, think_interval=SHARK_AI_THINK_INTERVAL,
+                 far_interval=UW_FAR_UPDATE_INTERVAL):
+        self.near_radius = near_radius
+        self.think_interval = think_interval
+        self.far_interval = far_interval
+        self.counts = {'near': 0, 'mid': 0, 'far': 0}  # paskutinio žingsnio statistika
+    
+    def update(self, sharks, tick, player_x, player_y, riklys_a_frames, riklys_b_frames, now_ms, active_range):
+        """Atnaujina ryklius vienam žingsniui; grąžina pajudėjusių sąrašą"""
+        lo, hi = active_range
+        near_radius = self.near_radius
+        think_interval, far_interval = self.think_interval, self.far_interval
+        think_slot, far_slot = tick % think_interval, tick % far_interval
+        
+        moved = []
+        near = mid = far = 0
+        for i, shark in enumerate(sharks):
+            if not lo <= shark.x <= hi:
+                if i % far_interval != far_slot:
+                    continue
+                shark.update(player_x, player_y, riklys_a_frames, riklys_b_frames, now_ms, far_interval)
+                far += 1
+            elif shark.lure_dist <= near_radius:
+                shark.update(player_x, player_y, riklys_a_frames, riklys_b_frames, now_ms)
+                near += 1
+            else:
+                shark.prev_x, shark.prev_y = shark.x, shark.y
+                if i % think_interval == think_slot:
+                    shark.think(player_x, player_y, now_ms, think_interval)
+                shark.move(now_ms)
+                mid += 1
+            moved.append(shark)
+        
+        counts = self.counts
+        counts['near'], counts['mid'], counts['far'] = near, mid, far
+        return moved
@@ -1,9 +1,20 @@
 """
 Žaidimo išteklių (paveikslėlių, garsų) užkrovimas
+
+Paveikslėliai dekoduojami ir keičiamas jų mastelis gijų telkinyje; pagrindinėje
+gijoje atliekamas tik convert/convert_alpha. Paruošti kadrai išsaugomi disko
+keše (ASSET_CACHE_DIR), kurio raktas - šaltinių mtime/dydis ir mastelio
+parametrai, todėl pakartotinis paleidimas dekodavimo ir mastelio nebekartoja.
 """
 import pygame
 import os
+import struct
+import hashlib
+import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from constants import *
+from atlas import load_atlas
 
 
 # --- Kelio nustatymai ---
@@ -11,54 +22,81 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 IMAGES_DIR = os.path.join(BASE_DIR, "images")
 SOUNDS_DIR = os.path.join(BASE_DIR, "sounds")
 
+# --- Kešo formatas ---
+CACHE_MAGIC = b"KATC"
+CACHE_VERSION = 1
+CACHE_ENTRY = struct.Struct("<IIBI")  # plotis, aukštis, režimas, baitų skaičius
 
-def safe_load(path, convert_alpha=False, size=None, fill_color=(255, 0, 255, 128)):
-    """Saugiai užkrauna paveikslėlį, arba sukuria placeholder"""
+# Kaip paruoštą paveikslėlį konvertuoti pagrindinėje gijoje
+MODE_RAW = 0     # placeholder - paliekamas toks, koks yra
+MODE_OPAQUE = 1  # convert()
+MODE_ALPHA = 2   # convert_alpha()
+
+# Viso ekrano fonai į atlasą nededami
+SCREEN_KEYS = ('background', 'background2', 'dugnas')
+
+
+# --- Dekodavimas ir mastelis (be convert - saugu vykdyti gijose) ---
+def placeholder(size, color=(255, 0, 255), width=3):
+    """Permatomas placeholder su rėmeliu"""
+    surf = pygame.Surface(size, pygame.SRCALPHA)
+    surf.fill((0, 0, 0, 0))
+    pygame.draw.rect(surf, color, surf.get_rect(), width)
+    return surf
+
+
+def decode_image(path, mode=MODE_ALPHA, size=None):
+    """Dekoduoja paveikslėlį (pakeičia dydį), arba grąžina placeholder"""
     try:
         img = pygame.image.load(path)
-        img = img.convert_alpha() if convert_alpha else img.convert()
         if size is not None:
             img = pygame.transform.scale(img, size)
-        return img
+        return [(img, mode)]
     except Exception:
-        w, h = size if size else (128, 128)
-        surf = pygame.Surface((w, h), pygame.SRCALPHA)
-        surf.fill((0, 0, 0, 0))
-        pygame.draw.rect(surf, (255, 0, 255), surf.get_rect(), 3)
-        return surf
+        return [(placeholder(size if size else (128, 128)), MODE_RAW)]
 
 
-def load_sprite_sheet(sheet_path, frame_width, frame_height, num_frames, scale):
-    """Užkrauna sprite sheet ir grąžina kadrų sąrašą"""
+def decode_scaled_image(path, factor, fallback):
+    """Dekoduoja paveikslėlį ir padidina factor kartų; nepavykus - fallback()"""
+    try:
+        img = pygame.image.load(path)
+        w, h = img.get_size()
+        return [(pygame.transform.scale(img, (int(w * factor), int(h * factor))), MODE_ALPHA)]
+    except Exception:
+        return [(fallback(), MODE_RAW)]
+
+
+def decode_sprite_sheet(sheet_path, frame_width, frame_height, num_frames, scale):
+    """Supjausto sprite sheet į num_frames vienodų kadrų"""
     frames = []
     try:
-        sprite_sheet = pygame.image.load(sheet_path).convert_alpha()
+        sprite_sheet = pygame.image.load(sheet_path)
     except Exception:
         sprite_sheet = None
-
+    
     for i in range(num_frames):
+        mode = MODE_RAW
         if sprite_sheet:
             sheet_w = sprite_sheet.get_width()
             if (i + 1) * frame_width <= sheet_w:
                 frame = sprite_sheet.subsurface((i * frame_width, 0, frame_width, frame_height))
+                mode = MODE_ALPHA
             else:
-                frame = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-                pygame.draw.rect(frame, (255, 0, 255), frame.get_rect(), 2)
+                frame = placeholder((frame_width, frame_height), width=2)
         else:
-            frame = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-            pygame.draw.rect(frame, (255, 0, 255), frame.get_rect(), 2)
+            frame = placeholder((frame_width, frame_height), width=2)
         
-        frame = pygame.transform.scale(frame, (frame_width * scale, frame_height * scale))
-        frames.append(frame)
+        frame = pygame.transform.scale(frame, (int(frame_width * scale), int(frame_height * scale)))
+        frames.append((frame, mode))
     
     return frames
 
 
-def build_sheet_frames(path, frames_count=8, scale=3):
-    """Sukuria kadrus iš sprite sheet (naudojama rykliams)"""
+def decode_sheet_frames(path, frames_count=8, scale=3):
+    """Supjausto sheet į frames_count kadrų, praleidžia tuščius (magenta) kadrus"""
     frames = []
     try:
-        sheet = pygame.image.load(path).convert_alpha()
+        sheet = pygame.image.load(path)
         sheet_w, sheet_h = sheet.get_width(), sheet.get_height()
         frame_w = max(1, sheet_w // frames_count)
         for i in range(frames_count):
@@ -72,266 +110,504 @@ def build_sheet_frames(path, frames_count=8, scale=3):
                 except Exception:
                     pass
                 sub = pygame.transform.scale(sub, (int(frame_w * scale), int(sheet_h * scale)))
-                frames.append(sub)
+                frames.append((sub, MODE_ALPHA))
     except Exception:
         pass
     return frames
 
 
-def load_assets():
-    """Užkrauna visus žaidimo išteklius"""
-    assets = {}
-    
-    # --- Pagrindiniai paveikslėliai ---
-    bg_path = os.path.join(IMAGES_DIR, "ezeras.png")
-    assets['background'] = safe_load(bg_path, convert_alpha=False, size=(WIDTH, HEIGHT))
-    assets['bg_width'], assets['bg_height'] = assets['background'].get_size()
-    
-    # Antro lygio fonas
-    bg2_path = os.path.join(IMAGES_DIR, "background2.png")
-    assets['background2'] = safe_load(bg2_path, convert_alpha=False, size=(WIDTH, HEIGHT))
-    assets['bg2_width'], assets['bg2_height'] = assets['background2'].get_size()
-    
-    assets['dugnas'] = safe_load(os.path.join(IMAGES_DIR, "dugnas.png"), 
-                                  convert_alpha=False, size=(WIDTH, HEIGHT))
-    assets['meniu_img'] = safe_load(os.path.join(IMAGES_DIR, "meniu.png"), 
-                                     convert_alpha=True)
-    
-    # --- Animacijos ---
-    assets['frames'] = load_sprite_sheet(
-        os.path.join(IMAGES_DIR, "valtis_anim.png"),
-        FRAME_WIDTH, FRAME_HEIGHT, NUM_FRAMES, SCALE
-    )
+def decode_strip(path, frame_w, frame_h, frames_count, scale, fallback):
+    """Supjausto kadrų juostą; nepavykus - vienas fallback() kadras"""
+    try:
+        strip = pygame.image.load(path)
+        frames = []
+        for i in range(frames_count):
+            sub = strip.subsurface((i * frame_w, 0, frame_w, frame_h)).copy()
+            sub = pygame.transform.scale(sub, (int(frame_w * scale), int(frame_h * scale)))
+            frames.append((sub, MODE_ALPHA))
+        return frames
+    except Exception:
+        return [(fallback(), MODE_RAW)]
+
+
+def decode_hp_images(hp_dir, scale):
+    """HP ikonos 1hp..5hp"""
+    images = []
+    for i in range(1, 6):
+        images += decode_scaled_image(
+            os.path.join(hp_dir, f"{i}hp.png"), scale,
+            lambda: placeholder((64 * int(scale), 16 * int(scale)), (255, 0, 0), 2))
+    return images
+
+
+def decode_dead_icon(path, factor):
+    """Dead ikona (ir placeholder padidinamas)"""
+    (img, mode), = decode_image(path)
+    w, h = img.get_size()
+    return [(pygame.transform.scale(img, (int(w * factor), int(h * factor))), mode)]
+
+
+def coin_placeholder():
+    size = 32 // RENDER_SCALE
+    ph = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(ph, (255, 220, 0), (size // 2, size // 2), 12 // RENDER_SCALE)
+    pygame.draw.circle(ph, (200, 160, 0), (size // 2, size // 2), 12 // RENDER_SCALE, 3 // RENDER_SCALE or 1)
+    return ph
+
+
+def coin_icon_placeholder():
+    ph = pygame.Surface((32, 32), pygame.SRCALPHA)
+    pygame.draw.circle(ph, (255, 220, 0), (16, 16), 12)
+    return ph
+
+
+def bubble_placeholder():
+    size = 8 * 3 // RENDER_SCALE
+    ph = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(ph, (180, 220, 255), (size // 2, size // 2), 10 // RENDER_SCALE, 2 // RENDER_SCALE or 1)
+    return ph
+
+
+def platform_placeholder():
+    return placeholder((128 // RENDER_SCALE, 128 // RENDER_SCALE))
+
+
+def art_scale(scale):
+    """Pasaulio sprite'o mastelis, kai pasaulis piešiamas RENDER_SCALE kartų mažesnis"""
+    scale = scale / RENDER_SCALE
+    return int(scale) if scale == int(scale) else scale
+
+
+def sprite_size(surface):
+    """Pasaulio sprite'o dydis lango pikseliais (kolizijoms ir išdėstymui)"""
+    return surface.get_width() * RENDER_SCALE, surface.get_height() * RENDER_SCALE
+
+
+def sprite_mask(surface):
+    """Kolizijų kaukė lango pikseliais (kaip sprite_size)"""
+    mask = pygame.mask.from_surface(surface)
+    if RENDER_SCALE != 1:
+        mask = mask.scale(sprite_size(surface))
+    return mask
+
+
+def image_spec(name, mode=MODE_ALPHA, size=None):
+    path = os.path.join(IMAGES_DIR, name)
+    return decode_image, (path, mode, size), [path]
+
+
+def sheet_spec(name, *args):
+    path = os.path.join(IMAGES_DIR, name)
+    return decode_sprite_sheet, (path,) + args, [path]
+
+
+def auto_sheet_spec(name, *args):
+    path = os.path.join(IMAGES_DIR, name)
+    return decode_sheet_frames, (path,) + args, [path]
+
+
+def strip_spec(name, *args):
+    path = os.path.join(IMAGES_DIR, name)
+    return decode_strip, (path,) + args, [path]
+
+
+def scaled_image_spec(name, *args):
+    path = os.path.join(IMAGES_DIR, name)
+    return decode_scaled_image, (path,) + args, [path]
+
+
+def asset_specs():
+    """Paveikslėlių receptai: raktas -> (dekoderis, argumentai, šaltinių failai)
     
-    assets['varna_frames'] = load_sprite_sheet(
-        os.path.join(IMAGES_DIR, "varna_Sheet.png"),
-        VARNA_FRAME_WIDTH, VARNA_FRAME_HEIGHT, VARNA_NUM_FRAMES, VARNA_SCALE
-    )
+    Pasaulio sprite'ų mastelis dalinamas iš RENDER_SCALE (art_scale); HUD
+    ištekliai (press-E, HP, ikonos, meniu) visada pilnos raiškos.
+    """
+    hp_dir = os.path.join(IMAGES_DIR, "hp")
+    screen_size = (WIDTH // RENDER_SCALE, HEIGHT // RENDER_SCALE)
+    zuva_scale = art_scale(ZUVA_SCALE)
+    zuva_size = (int(ZUVYS_FRAME_WIDTH * zuva_scale), int(ZUVYS_FRAME_HEIGHT * zuva_scale))
+    blizge_size = (int(ZUVYS_FRAME_WIDTH * zuva_scale * BLIZGE_SCALE),
+                   int(ZUVYS_FRAME_HEIGHT * zuva_scale * BLIZGE_SCALE))
+    return {
+        'background': image_spec("ezeras.png", MODE_OPAQUE, screen_size),
+        'background2': image_spec("background2.png", MODE_OPAQUE, screen_size),
+        'dugnas': image_spec("dugnas.png", MODE_OPAQUE, screen_size),
+        'meniu_img': image_spec("meniu.png"),
+        'frames': sheet_spec("valtis_anim.png", FRAME_WIDTH, FRAME_HEIGHT, NUM_FRAMES, art_scale(SCALE)),
+        'varna_frames': sheet_spec("varna_Sheet.png", VARNA_FRAME_WIDTH, VARNA_FRAME_HEIGHT,
+                                   VARNA_NUM_FRAMES, art_scale(VARNA_SCALE)),
+        'zuvys_frames': sheet_spec("zuvys_sheet.png", ZUVYS_FRAME_WIDTH, ZUVYS_FRAME_HEIGHT,
+                                   ZUVYS_NUM_FRAMES, art_scale(ZUVYS_SCALE)),
+        'press_e_frames': sheet_spec("press_e_Sheet.png", PRESS_E_FRAME_WIDTH, PRESS_E_FRAME_HEIGHT,
+                                     PRESS_E_NUM_FRAMES, PRESS_E_SCALE),
+        'uzmesti_frames': sheet_spec("uzmesti_Sheet.png", UZM_FRAME_WIDTH, UZM_FRAME_HEIGHT,
+                                     UZM_NUM_FRAMES, art_scale(UZM_SCALE)),
+        'zuvis_a_frames': auto_sheet_spec("Zuvis_A.png", 8, zuva_scale),
+        'zuvis_a_fallback': image_spec("Zuvis_A.png", MODE_ALPHA, zuva_size),
+        'blizge_img': image_spec("blizge.png", MODE_ALPHA, blizge_size),
+        'riklys_a_frames': auto_sheet_spec("riklys_a.png", RIKLYS_SHEET_FRAMES, art_scale(RIKLYS_SCALE)),
+        'riklys_b_frames': auto_sheet_spec("riklys_b.png", RIKLYS_SHEET_FRAMES, art_scale(RIKLYS_SCALE)),
+        'hp_images': (decode_hp_images, (hp_dir, HP_SCALE),
+                      [os.path.join(hp_dir, f"{i}hp.png") for i in range(1, 6)]),
+        'dead_img': (decode_dead_icon, (os.path.join(IMAGES_DIR, "dead.png"), DEAD_ICON_SCALE),
+                     [os.path.join(IMAGES_DIR, "dead.png")]),
+        'coin_frames': strip_spec("pinigas.png", 16, 16, 8, art_scale(COIN_SCALE), coin_placeholder),
+        'pinigas_icon': scaled_image_spec("pinigas_ikona.png", ICON_SCALE, coin_icon_placeholder),
+        'platform_img': (image_spec("platforma.png") if RENDER_SCALE == 1 else
+                         scaled_image_spec("platforma.png", art_scale(1), platform_placeholder)),
+        'burbulai_frames': strip_spec("burbulai.png", 8, 8, 10, art_scale(BUBBLE_SCALE), bubble_placeholder),
+    }
+
+
+# --- Disko kešas ---
+def spec_digest(key, decoder, args, sources):
+    """Recepto žymė; keičiasi pasikeitus šaltiniams ar parametrams"""
+    stamp = []
+    for path in sources:
+        try:
+            st = os.stat(path)
+            stamp.append((path, st.st_mtime_ns, st.st_size))
+        except OSError:
+            stamp.append((path, None, None))
+    params = repr((CACHE_VERSION, key, decoder.__name__,
+                   [getattr(a, '__name__', a) for a in args], stamp))
+    return hashlib.sha1(params.encode("utf-8")).hexdigest()[:16]
+
+
+def cache_path(key, decoder, args, sources):
+    """Kešo failo kelias (None, jei kešas išjungtas)"""
+    if not ASSET_CACHE_DIR:
+        return None
+    return os.path.join(ASSET_CACHE_DIR, f"{key}-{spec_digest(key, decoder, args, sources)}.bin")
+
+
+def atlas_stamp():
+    """Atlaso žymė: visų į atlasą dedamų receptų žymės"""
+    digests = [(key, spec_digest(key, *spec))
+               for key, spec in sorted(asset_specs().items()) if key not in SCREEN_KEYS]
+    return hashlib.sha1(repr((CACHE_VERSION, digests)).encode("utf-8")).hexdigest()[:16]
+
+
+def read_cache(path):
+    """Nuskaito kadrus iš kešo (None, jei kešo nėra ar jis sugadintas)"""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    try:
+        if data[:4] != CACHE_MAGIC:
+            return None
+        count, = struct.unpack_from("<I", data, 4)
+        offset = 8
+        view = memoryview(data)
+        items = []
+        for _ in range(count):
+            w, h, mode, length = CACHE_ENTRY.unpack_from(data, offset)
+            offset += CACHE_ENTRY.size
+            fmt = "RGB" if mode == MODE_OPAQUE else "RGBA"
+            # frombuffer nekopijuoja; convert() pagrindinėje gijoje sukurs kopiją
+            surf = pygame.image.frombuffer(view[offset:offset + length], (w, h), fmt)
+            offset += length
+            items.append((surf.copy() if mode == MODE_RAW else surf, mode))
+        return items
+    except (struct.error, ValueError):
+        return None
+
+
+def write_cache(path, items):
+    """Išsaugo kadrus kešo faile (klaidos ignoruojamos - kešas neprivalomas)"""
+    chunks = [CACHE_MAGIC, struct.pack("<I", len(items))]
+    for surf, mode in items:
+        fmt = "RGB" if mode == MODE_OPAQUE else "RGBA"
+        raw = pygame.image.tobytes(surf, fmt)
+        w, h = surf.get_size()
+        chunks.append(CACHE_ENTRY.pack(w, h, mode, len(raw)))
+        chunks.append(raw)
     
-    assets['zuvys_frames'] = load_sprite_sheet(
-        os.path.join(IMAGES_DIR, "zuvys_sheet.png"),
-        ZUVYS_FRAME_WIDTH, ZUVYS_FRAME_HEIGHT, ZUVYS_NUM_FRAMES, ZUVYS_SCALE
-    )
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        prefix = os.path.basename(path).rsplit("-", 1)[0] + "-"
+        for name in os.listdir(os.path.dirname(path)):
+            if name.startswith(prefix) and name != os.path.basename(path):
+                os.remove(os.path.join(os.path.dirname(path), name))
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(b"".join(chunks))
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def prepare(key, spec):
+    """Paruošia vieno rakto kadrus (iš kešo arba dekoduojant); vykdoma gijoje"""
+    decoder, args, sources = spec
+    path = cache_path(key, decoder, args, sources)
+    if path is not None:
+        items = read_cache(path)
+        if items is not None:
+            return items
+    items = decoder(*args)
+    if path is not None:
+        write_cache(path, items)
+    return items
+
+
+def finish(items):
+    """convert/convert_alpha pagrindinėje gijoje"""
+    out = []
+    for surf, mode in items:
+        if mode == MODE_ALPHA:
+            surf = surf.convert_alpha()
+        elif mode == MODE_OPAQUE:
+            surf = surf.convert()
+        out.append(surf)
+    return out
+
+
+# --- Senesnės pagalbinės funkcijos (viena gija) ---
+def safe_load(path, convert_alpha=False, size=None, fill_color=(255, 0, 255, 128)):
+    """Saugiai užkrauna paveikslėlį, arba sukuria placeholder"""
+    return finish(decode_image(path, MODE_ALPHA if convert_alpha else MODE_OPAQUE, size))[0]
+
+
+def flip_frames(frames):
+    """Grąžina horizontaliai apverstų kadrų sąrašą (kuriama vieną kartą)"""
+    return [pygame.transform.flip(frame, True, False) for frame in frames]
+
+
+def oriented(assets, key, facing_left):
+    """Grąžina kadrus (arba paveikslėlį) pagal žiūrėjimo kryptį"""
+    return assets[key + '_left'] if facing_left else assets[key]
+
+
+def load_sprite_sheet(sheet_path, frame_width, frame_height, num_frames, scale):
+    """Užkrauna sprite sheet ir grąžina kadrų sąrašą"""
+    return finish(decode_sprite_sheet(sheet_path, frame_width, frame_height, num_frames, scale))
+
+
+def build_sheet_frames(path, frames_count=8, scale=3):
+    """Sukuria kadrus iš sprite sheet (naudojama rykliams)"""
+    return finish(decode_sheet_frames(path, frames_count, scale))
+
+
+def load_atlas_page(path):
+    """Atlaso puslapis per disko kešą (dekoduotas PNG nebekartojamas)"""
+    key = "atlas-" + os.path.splitext(os.path.basename(path))[0]
+    return finish(prepare(key, (decode_image, (path, MODE_ALPHA, None), [path])))[0]
+
+
+# Vieno paveikslėlio (ne kadrų sąrašo) ištekliai
+SINGLE_KEYS = ('background', 'background2', 'dugnas', 'meniu_img', 'blizge_img',
+               'dead_img', 'pinigas_icon', 'platform_img')
+
+# Išvestiniai ištekliai: raktas -> receptai, iš kurių jie gaunami
+DERIVED_KEYS = {
+    'bg_width': ('background',),
+    'bg_height': ('background',),
+    'bg2_width': ('background2',),
+    'bg2_height': ('background2',),
+    'zuvis_a_img': ('zuvis_a_frames', 'zuvis_a_fallback'),
+    'frames_left': ('frames',),
+    'uzmesti_frames_left': ('uzmesti_frames',),
+    'zuvis_a_frames_left': ('zuvis_a_frames',),
+    'riklys_a_frames_left': ('riklys_a_frames',),
+    'riklys_b_frames_left': ('riklys_b_frames', 'riklys_a_frames'),
+    'zuvis_a_img_left': ('zuvis_a_frames', 'zuvis_a_fallback'),
+    'blizge_img_left': ('blizge_img',),
+}
+
+# Kolizijų kaukės (raktas 'mask_' + sprite'o raktas; kadrų sąrašui - kaukių sąrašas)
+MASKED_KEYS = ('blizge_img', 'blizge_img_left', 'zuvis_a_frames', 'zuvis_a_frames_left', 'zuvis_a_img',
+               'zuvis_a_img_left', 'riklys_a_frames', 'riklys_a_frames_left', 'riklys_b_frames',
+               'riklys_b_frames_left', 'coin_frames')
+DERIVED_KEYS.update({'mask_' + key: DERIVED_KEYS.get(key, (key,)) for key in MASKED_KEYS})
+
+# --- Išteklių grupės (išankstiniam užkrovimui) ---
+STARTUP_KEYS = ('background', 'bg_width', 'frames', 'frames_left', 'varna_frames', 'zuvys_frames',
+                'press_e_frames', 'hp_images', 'dead_img', 'pinigas_icon')
+CASTING_KEYS = ('uzmesti_frames', 'uzmesti_frames_left')
+UNDERWATER_KEYS = ('dugnas', 'zuvis_a_frames', 'zuvis_a_frames_left', 'zuvis_a_img', 'zuvis_a_img_left',
+                   'blizge_img', 'blizge_img_left', 'riklys_a_frames', 'riklys_a_frames_left',
+                   'riklys_b_frames', 'riklys_b_frames_left', 'coin_frames', 'platform_img',
+                   'burbulai_frames') + tuple('mask_' + key for key in MASKED_KEYS)
+LEVEL2_KEYS = ('background2', 'bg2_width')
+
+
+class AssetRegistry(Mapping):
+    """Ištekliai, užkraunami pirmą kartą paprašius
     
-    assets['press_e_frames'] = load_sprite_sheet(
-        os.path.join(IMAGES_DIR, "press_e_Sheet.png"),
-        PRESS_E_FRAME_WIDTH, PRESS_E_FRAME_HEIGHT, PRESS_E_NUM_FRAMES, PRESS_E_SCALE
-    )
+    prefetch() paleidžia dekodavimą ir mastelį gijų telkinyje iš anksto; pats
+    convert ir išvestiniai ištekliai (apversti kadrai ir pan.) atliekami
+    pagrindinėje gijoje pirmą kartą pasiekus raktą. load_ms - kiek kiekvienas
+    raktas užtruko pagrindinėje gijoje.
+    """
+    def __init__(self, workers=None, use_atlas=True):
+        self.specs = asset_specs()
+        self.values = {}
+        self.pending = {}
+        self.load_ms = {}
+        self.pool = ThreadPoolExecutor(max_workers=workers or ASSET_WORKERS)
+        self.use_atlas = use_atlas
+        self.atlas = None
+        self.atlas_checked = False
+        self.key_list = [k for k in self.specs if k != 'zuvis_a_fallback'] + list(DERIVED_KEYS)
     
-    assets['uzmesti_frames'] = load_sprite_sheet(
-        os.path.join(IMAGES_DIR, "uzmesti_Sheet.png"),
-        UZM_FRAME_WIDTH, UZM_FRAME_HEIGHT, UZM_NUM_FRAMES, UZM_SCALE
-    )
+    def __len__(self):
+        return len(self.key_list)
     
-    # --- Povandenės žuvys ---
-    zuvis_a_path = os.path.join(IMAGES_DIR, "Zuvis_A.png")
-    zuvis_a_frames = []
-    try:
-        zuvis_a_sheet = pygame.image.load(zuvis_a_path).convert_alpha()
-        SHEET_FRAMES = 8
-        sheet_w = zuvis_a_sheet.get_width()
-        sheet_h = zuvis_a_sheet.get_height()
-        frame_w = max(1, sheet_w // SHEET_FRAMES)
-        frame_h = sheet_h
-        
-        for i in range(SHEET_FRAMES):
-            x = i * frame_w
-            if x + frame_w <= sheet_w and frame_h <= sheet_h:
-                sub = zuvis_a_sheet.subsurface((x, 0, frame_w, frame_h)).copy()
-                try:
-                    px = sub.get_at((frame_w // 2, frame_h // 2))
-                    if (px.r, px.g, px.b) == (255, 0, 255):
-                        continue
-                except Exception:
-                    pass
-                sub = pygame.transform.scale(sub, (int(frame_w * ZUVA_SCALE), int(frame_h * ZUVA_SCALE)))
-                zuvis_a_frames.append(sub)
-    except Exception:
-        pass
+    def __iter__(self):
+        return iter(self.key_list)
     
-    if not zuvis_a_frames:
-        zuvis_a_img = safe_load(zuvis_a_path, convert_alpha=True, 
-                                size=(int(ZUVYS_FRAME_WIDTH * ZUVA_SCALE), 
-                                      int(ZUVYS_FRAME_HEIGHT * ZUVA_SCALE)))
-    else:
-        zuvis_a_img = zuvis_a_frames[0]
+    def __contains__(self, key):
+        return key in self.specs or key in DERIVED_KEYS
     
-    assets['zuvis_a_frames'] = zuvis_a_frames
-    assets['zuvis_a_img'] = zuvis_a_img
+    def __getitem__(self, key):
+        try:
+            return self.values[key]
+        except KeyError:
+            pass
+        if key not in self:
+            raise KeyError(key)
+        start = time.perf_counter()
+        value = self.load(key)
+        self.values[key] = value
+        self.load_ms[key] = (time.perf_counter() - start) * 1000.0
+        return value
     
-    # --- Blizgė (povandeninis žaidėjas) ---
-    assets['blizge_img'] = safe_load(
-        os.path.join(IMAGES_DIR, "blizge.png"),
-        convert_alpha=True,
-        size=(int(ZUVYS_FRAME_WIDTH * ZUVA_SCALE * BLIZGE_SCALE),
-              int(ZUVYS_FRAME_HEIGHT * ZUVA_SCALE * BLIZGE_SCALE))
-    )
+    def is_loaded(self, key):
+        """Ar raktas jau užkrautas"""
+        return key in self.values
     
-    # --- Rykliai ---
-    assets['riklys_a_frames'] = build_sheet_frames(
-        os.path.join(IMAGES_DIR, "riklys_a.png"),
-        RIKLYS_SHEET_FRAMES, RIKLYS_SCALE
-    )
-    assets['riklys_b_frames'] = build_sheet_frames(
-        os.path.join(IMAGES_DIR, "riklys_b.png"),
-        RIKLYS_SHEET_FRAMES, RIKLYS_SCALE
-    )
+    def get_atlas(self):
+        """Atlasas (tikrinamas ir užkraunamas vieną kartą); None, jei jo nėra"""
+        if not self.atlas_checked:
+            self.atlas_checked = True
+            if self.use_atlas:
+                self.atlas = load_atlas(atlas_stamp(), page_loader=load_atlas_page)
+        return self.atlas
     
-    # Fallback placeholders
-    if not assets['riklys_a_frames']:
-        placeholder = pygame.Surface((32 * RIKLYS_SCALE, 16 * RIKLYS_SCALE), pygame.SRCALPHA)
-        pygame.draw.rect(placeholder, (200, 200, 200), placeholder.get_rect(), 2)
-        assets['riklys_a_frames'] = [placeholder]
-    if not assets['riklys_b_frames']:
-        assets['riklys_b_frames'] = assets['riklys_a_frames'].copy()
+    def sources(self, key):
+        """Receptai, kurių reikia raktui"""
+        return DERIVED_KEYS.get(key, (key,))
     
-    # --- HP ikonos ---
-    hp_images = []
-    HP_DIR = os.path.join(IMAGES_DIR, "hp")
-    for i in range(1, 6):
-        hp_path = os.path.join(HP_DIR, f"{i}hp.png")
-        try:
-            img = pygame.image.load(hp_path).convert_alpha()
-            w, h = img.get_size()
-            img = pygame.transform.scale(img, (int(w * HP_SCALE), int(h * HP_SCALE)))
-            hp_images.append(img)
-        except Exception:
-            placeholder = pygame.Surface((64 * int(HP_SCALE), 16 * int(HP_SCALE)), pygame.SRCALPHA)
-            pygame.draw.rect(placeholder, (255, 0, 0), placeholder.get_rect(), 2)
-            hp_images.append(placeholder)
-    assets['hp_images'] = hp_images
+    def prefetch(self, keys):
+        """Paleidžia raktų dekodavimą fone (jei jie dar neužkrauti)"""
+        atlas = self.get_atlas()
+        for key in keys:
+            if key in self.values or (atlas is not None and key in atlas):
+                continue
+            for source in self.sources(key):
+                if source in self.specs and source not in self.pending and source not in self.values:
+                    self.pending[source] = self.pool.submit(prepare, source, self.specs[source])
     
-    # --- Dead ikona ---
-    dead_img = safe_load(os.path.join(IMAGES_DIR, "dead.png"), convert_alpha=True)
-    try:
-        dead_img = pygame.transform.scale(dead_img, 
-                                          (int(dead_img.get_width() * DEAD_ICON_SCALE),
-                                           int(dead_img.get_height() * DEAD_ICON_SCALE)))
-    except Exception:
-        pass
-    assets['dead_img'] = dead_img
+    def load_spec(self, key):
+        """Recepto kadrai (iš fono užduoties arba užkraunant dabar)"""
+        future = self.pending.pop(key, None)
+        items = future.result() if future is not None else prepare(key, self.specs[key])
+        frames = finish(items)
+        
+        # --- Rykliai: fallback placeholders ---
+        if key == 'riklys_a_frames' and not frames:
+            frames = [placeholder((int(32 * art_scale(RIKLYS_SCALE)), int(16 * art_scale(RIKLYS_SCALE))),
+                                  (200, 200, 200), 2)]
+        elif key == 'riklys_b_frames' and not frames:
+            frames = self['riklys_a_frames'].copy()
+        return frames[0] if key in SINGLE_KEYS else frames
     
-    # --- Monetos ---
-    coin_frames = []
-    try:
-        coin_sheet = pygame.image.load(os.path.join(IMAGES_DIR, "pinigas.png")).convert_alpha()
-        frame_w, frame_h, frames_count = 16, 16, 8
-        for i in range(frames_count):
-            sub = coin_sheet.subsurface((i * frame_w, 0, frame_w, frame_h)).copy()
-            sub = pygame.transform.scale(sub, (frame_w * COIN_SCALE, frame_h * COIN_SCALE))
-            coin_frames.append(sub)
-    except Exception:
-        ph = pygame.Surface((32, 32), pygame.SRCALPHA)
-        pygame.draw.circle(ph, (255, 220, 0), (16, 16), 12)
-        pygame.draw.circle(ph, (200, 160, 0), (16, 16), 12, 3)
-        coin_frames = [ph]
-    assets['coin_frames'] = coin_frames
+    def load(self, key):
+        """Užkrauna vieną raktą"""
+        atlas = self.get_atlas()
+        if atlas is not None and key in atlas:
+            return atlas[key]
+        if key in self.specs:
+            return self.load_spec(key)
+        
+        # --- Išvestiniai ---
+        if key in ('bg_width', 'bg_height', 'bg2_width', 'bg2_height'):
+            # Lango pikseliais (fonas gali būti RENDER_SCALE kartų mažesnis)
+            w, h = sprite_size(self['background' if key.startswith('bg_') else 'background2'])
+            return w if key.endswith('width') else h
+        if key == 'zuvis_a_img':
+            frames = self['zuvis_a_frames']
+            return frames[0] if frames else self.load_spec('zuvis_a_fallback')
+        if key.startswith('mask_'):
+            base = self[key[len('mask_'):]]
+            if isinstance(base, list):
+                return [sprite_mask(frame) for frame in base]
+            return sprite_mask(base)
+        base = self[key[:-len('_left')]]
+        if isinstance(base, list):
+            return flip_frames(base)
+        return pygame.transform.flip(base, True, False)
     
-    # Monetos ikona HUD
+    def close(self):
+        """Sustabdo fono užduotis: nepradėtos atšaukiamos (jų raktai vėliau kraunami iš karto)"""
+        for key, future in list(self.pending.items()):
+            if future.cancel():
+                del self.pending[key]
+        self.pool.shutdown(wait=False)
+
+
+def load_assets(workers=None, use_atlas=True):
+    """Užkrauna visus žaidimo išteklius iš karto (sprite'ai - iš atlaso, jei jis aktualus)"""
+    registry = AssetRegistry(workers, use_atlas)
+    registry.prefetch(list(registry))
+    assets = dict(registry)
+    registry.close()
+    return assets
+
+
+def init_mixer():
+    """Inicializuoja mikserį vieną kartą; grąžina ar pavyko"""
     try:
-        pinigas_icon = pygame.image.load(os.path.join(IMAGES_DIR, "pinigas_ikona.png")).convert_alpha()
-        iw, ih = pinigas_icon.get_size()
-        pinigas_icon = pygame.transform.scale(pinigas_icon, (int(iw * ICON_SCALE), int(ih * ICON_SCALE)))
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
+        return True
     except Exception:
-        pinigas_icon = pygame.Surface((32, 32), pygame.SRCALPHA)
-        pygame.draw.circle(pinigas_icon, (255, 220, 0), (16, 16), 12)
-    assets['pinigas_icon'] = pinigas_icon
-    
-    # --- Platforma ---
-    assets['platform_img'] = safe_load(os.path.join(IMAGES_DIR, "platforma.png"), 
-                                        convert_alpha=True)
-    
-    # --- Burbulai ---
-    burbulai_frames = []
+        return False
+
+
+def load_sound(path, volume):
+    """Dekoduoja garsą (None, jei failo nėra ar nepavyko); galima vykdyti gijoje"""
+    if not os.path.exists(path):
+        return None
     try:
-        burb_sheet = pygame.image.load(os.path.join(IMAGES_DIR, "burbulai.png")).convert_alpha()
-        frame_w, frame_h, frames_count = 8, 8, 10
-        for i in range(frames_count):
-            sub = burb_sheet.subsurface((i * frame_w, 0, frame_w, frame_h)).copy()
-            sub = pygame.transform.scale(sub, (frame_w * BUBBLE_SCALE, frame_h * BUBBLE_SCALE))
-            burbulai_frames.append(sub)
+        sound = pygame.mixer.Sound(path)
+        sound.set_volume(volume)
+        return sound
     except Exception:
-        ph = pygame.Surface((8 * 3, 8 * 3), pygame.SRCALPHA)
-        pygame.draw.circle(ph, (180, 220, 255), (12, 12), 10, 2)
-        burbulai_frames = [ph]
-    assets['burbulai_frames'] = burbulai_frames
-    
-    return assets
+        return None
 
 
-def load_sounds():
+def load_sounds(workers=None):
     """Užkrauna visus žaidimo garsus"""
     sounds = {}
+    mixer_ready = init_mixer()
     
-    # --- Foninė muzika ---
+    # --- Foninė muzika (srautinė, iš anksto nedekoduojama) ---
     music_path = os.path.join(SOUNDS_DIR, "littlefishes.mp3")
-    try:
-        if os.path.exists(music_path):
-            try:
-                pygame.mixer.init()
-            except Exception:
-                pass
-            try:
-                pygame.mixer.music.load(music_path)
-                pygame.mixer.music.set_volume(0.5)
-                pygame.mixer.music.play(-1)
-            except Exception:
-                pass
-    except Exception:
-        pass
+    if mixer_ready and os.path.exists(music_path):
+        try:
+            pygame.mixer.music.load(music_path)
+            pygame.mixer.music.set_volume(0.5)
+            pygame.mixer.music.play(-1)
+        except Exception:
+            pass
     
-    # --- Hurt sound ---
-    hurt_sound = None
-    try:
-        hurt_path = os.path.join(SOUNDS_DIR, "hurt.mp3")
-        if os.path.exists(hurt_path):
-            try:
-                pygame.mixer.init()
-            except Exception:
-                pass
-            try:
-                hurt_sound = pygame.mixer.Sound(hurt_path)
-                hurt_sound.set_volume(0.7)
-            except Exception:
-                hurt_sound = None
-    except Exception:
-        hurt_sound = None
-    sounds['hurt_sound'] = hurt_sound
+    # --- Efektai (dekoduojami lygiagrečiai) ---
+    effects = {
+        'hurt_sound': "hurt.mp3",
+        'reelin_sound': "reelin.mp3",
+        'coin_sound': "coins.mp3",
+    }
+    if not mixer_ready:
+        return {key: None for key in effects}
     
-    # --- Reelin sound ---
-    reelin_sound = None
-    try:
-        reelin_path = os.path.join(SOUNDS_DIR, "reelin.mp3")
-        if os.path.exists(reelin_path):
-            try:
-                pygame.mixer.init()
-            except Exception:
-                pass
-            try:
-                reelin_sound = pygame.mixer.Sound(reelin_path)
-                reelin_sound.set_volume(0.7)
-            except Exception:
-                reelin_sound = None
-    except Exception:
-        reelin_sound = None
-    sounds['reelin_sound'] = reelin_sound
-    
-    # --- Coin sound ---
-    coin_sound = None
-    try:
-        coin_path = os.path.join(SOUNDS_DIR, "coins.mp3")
-        if os.path.exists(coin_path):
-            try:
-                pygame.mixer.init()
-            except Exception:
-                pass
-            try:
-                coin_sound = pygame.mixer.Sound(coin_path)
-                coin_sound.set_volume(0.7)
-            except Exception:
-                coin_sound = None
-    except Exception:
-        coin_sound = None
-    sounds['coin_sound'] = coin_sound
+    with ThreadPoolExecutor(max_workers=workers or ASSET_WORKERS) as pool:
+        futures = {key: pool.submit(load_sound, os.path.join(SOUNDS_DIR, name), 0.7)
+                   for key, name in effects.items()}
+        for key, future in futures.items():
+            sounds[key] = future.result()
     
     return sounds
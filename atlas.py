@@ -0,0 +1,145 @@
+"""
+Sprite atlasas: visi paruošti (pakeisto mastelio ir apversti) kadrai keliuose puslapiuose
+
+Atlasas kuriamas atskiru žingsniu:
+
+    python atlas.py
+
+assets.load_assets jį naudoja, jei indekso žymė sutampa su dabartiniais
+šaltiniais ir parametrais; kitaip ištekliai užkraunami įprastai.
+"""
+import argparse
+import json
+import os
+import pygame
+from constants import *
+
+INDEX_NAME = "atlas.json"
+ATLAS_VERSION = 1
+ATLAS_PADDING = 1
+
+
+def shelf_pack(sizes, page_size, padding=ATLAS_PADDING):
+    """Lentynų (shelf) pakavimas; sizes - [(w, h)], grąžina [(puslapis, x, y)]"""
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    places = [None] * len(sizes)
+    page, x, y, shelf_h = 0, 0, 0, 0
+    for i in order:
+        w, h = sizes[i]
+        if w + padding > page_size or h + padding > page_size:
+            raise ValueError("kadras %dx%d netelpa į %d px atlaso puslapį" % (w, h, page_size))
+        if x + w + padding > page_size:
+            x, y, shelf_h = 0, y + shelf_h, 0
+        if y + h + padding > page_size:
+            page, x, y, shelf_h = page + 1, 0, 0, 0
+        places[i] = (page, x, y)
+        x += w + padding
+        shelf_h = max(shelf_h, h + padding)
+    return places
+
+
+def atlas_surfaces(assets, skip=()):
+    """Grąžina {raktas: (ar vienas paveikslėlis, [Surface])} atlasui tinkamiems ištekliams"""
+    found = {}
+    for key, value in assets.items():
+        if key in skip:
+            continue
+        if isinstance(value, pygame.Surface):
+            found[key] = (True, [value])
+        elif isinstance(value, list) and all(isinstance(v, pygame.Surface) for v in value):
+            found[key] = (False, list(value))
+    return found
+
+
+def build_atlas(assets, stamp, out_dir=ATLAS_DIR, page_size=ATLAS_PAGE_SIZE, skip=()):
+    """Supakuoja išteklius į atlaso puslapius ir įrašo indeksą; grąžina indeksą"""
+    entries = atlas_surfaces(assets, skip)
+    
+    # Tas pats Surface (pvz. zuvis_a_img == zuvis_a_frames[0]) dedamas vieną kartą
+    unique, slots = [], {}
+    for single, surfaces in entries.values():
+        for surf in surfaces:
+            if id(surf) not in slots:
+                slots[id(surf)] = len(unique)
+                unique.append(surf)
+    
+    places = shelf_pack([s.get_size() for s in unique], page_size)
+    page_count = max((p[0] for p in places), default=-1) + 1
+    pages = [pygame.Surface((page_size, page_size), pygame.SRCALPHA) for _ in range(page_count)]
+    for page in pages:
+        page.fill((0, 0, 0, 0))
+    for surf, (page, x, y) in zip(unique, places):
+        pages[page].blit(surf, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+    
+    # Nepanaudotas puslapio apačios plotas nukerpamas
+    page_names = []
+    os.makedirs(out_dir, exist_ok=True)
+    for n, page in enumerate(pages):
+        used_h = max(y + s.get_height() for s, (p, x, y) in zip(unique, places) if p == n)
+        name = "atlas_%d.png" % n
+        pygame.image.save(page.subsurface((0, 0, page_size, used_h)), os.path.join(out_dir, name))
+        page_names.append(name)
+    
+    index = {
+        'version': ATLAS_VERSION,
+        'stamp': stamp,
+        'pages': page_names,
+        'entries': {},
+    }
+    for key, (single, surfaces) in entries.items():
+        rects = []
+        for surf in surfaces:
+            page, x, y = places[slots[id(surf)]]
+            rects.append([page, x, y, surf.get_width(), surf.get_height()])
+        index['entries'][key] = {'single': single, 'rects': rects}
+    
+    with open(os.path.join(out_dir, INDEX_NAME), "w", encoding="utf-8") as f:
+        json.dump(index, f)
+    return index
+
+
+def load_page(path):
+    """Užkrauna atlaso puslapį"""
+    return pygame.image.load(path).convert_alpha()
+
+
+def load_atlas(stamp, atlas_dir=ATLAS_DIR, page_loader=load_page):
+    """Užkrauna atlasą ir grąžina {raktas: subsurface arba jų sąrašas}; None, jei atlasas netinka"""
+    try:
+        with open(os.path.join(atlas_dir, INDEX_NAME), encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if index.get('version') != ATLAS_VERSION or index.get('stamp') != stamp:
+        return None
+    
+    try:
+        pages = [page_loader(os.path.join(atlas_dir, name)) for name in index['pages']]
+        assets = {}
+        for key, entry in index['entries'].items():
+            frames = [pages[page].subsurface((x, y, w, h)) for page, x, y, w, h in entry['rects']]
+            assets[key] = frames[0] if entry['single'] else frames
+        return assets
+    except (pygame.error, ValueError, KeyError, IndexError):
+        return None
+
+
+def main():
+    from headless import init_headless
+    from assets import load_assets, atlas_stamp, SCREEN_KEYS
+    
+    parser = argparse.ArgumentParser(description="Sukuria sprite atlasą iš paruoštų kadrų")
+    parser.add_argument("--out", default=ATLAS_DIR, help="atlaso katalogas")
+    parser.add_argument("--page-size", type=int, default=ATLAS_PAGE_SIZE)
+    args = parser.parse_args()
+    
+    init_headless()
+    assets = load_assets(use_atlas=False)
+    index = build_atlas(assets, atlas_stamp(), args.out, args.page_size, SCREEN_KEYS)
+    frames = sum(len(e['rects']) for e in index['entries'].values())
+    print("Atlasas: %d puslapiai, %d raktai, %d kadrai -> %s" % (
+        len(index['pages']), len(index['entries']), frames, args.out))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Mokymosi aplinkos pralaidumas: aplinkos žingsnių per sekundę (vienas procesas ir procesų telkinys)
+
+Veiksmai - atsitiktiniai (fiksuota sėkla), rezultatai išvedami JSON formatu:
+
+    python bench/bench_env.py
+    python bench/bench_env.py --envs 16 --workers 4 --steps 2000 --out env.json
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # stdout - tik JSON
+
+DEFAULT_STEPS = 5000
+
+
+def bench_single(steps, seed):
+    """Viena aplinka šiame procese; grąžina žingsnių per sekundę"""
+    from env import UnderwaterEnv, ACTION_COUNT
+    
+    env = UnderwaterEnv()
+    env.reset(seed=seed)
+    rng = random.Random(seed)
+    actions = [rng.randrange(ACTION_COUNT) for _ in range(steps)]
+    start = time.perf_counter()
+    for action in actions:
+        _, _, terminated, truncated, _ = env.step(action)
+        if terminated or truncated:
+            env.reset()
+    return steps / (time.perf_counter() - start)
+
+
+def bench_vector(num_envs, workers, steps, seed):
+    """num_envs aplinkų workers procesuose; grąžina aplinkos žingsnių per sekundę"""
+    from env import VecUnderwaterEnv, ACTION_COUNT
+    
+    rng = random.Random(seed)
+    with VecUnderwaterEnv(num_envs, workers) as envs:
+        envs.reset(seed=seed)
+        batches = [[rng.randrange(ACTION_COUNT) for _ in range(num_envs)] for _ in range(steps)]
+        start = time.perf_counter()
+        for actions in batches:
+            envs.step(actions)
+        return steps * num_envs / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mokymosi aplinkos pralaidumo testai")
+    parser.add_argument("--steps", type=int, default=DEFAULT_STEPS, help="žingsnių skaičius (kiekvienai aplinkai)")
+    parser.add_argument("--envs", type=int, default=8, help="aplinkų skaičius vektorizuotam variantui")
+    parser.add_argument("--workers", type=int, default=None, help="procesų skaičius (numatyta - CPU skaičius)")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--out", help="rezultatų JSON failas (kitaip - stdout)")
+    args = parser.parse_args()
+    
+    workers = args.workers or os.cpu_count() or 1
+    single = bench_single(args.steps, args.seed)
+    print("1 aplinka: %.0f žingsnių/s" % single, file=sys.stderr)
+    vector = bench_vector(args.envs, workers, args.steps // 4, args.seed)
+    print("%d aplinkos, %d procesai: %.0f žingsnių/s" % (args.envs, workers, vector), file=sys.stderr)
+    
+    text = json.dumps({
+        'benchmark': 'env',
+        'cpu_count': os.cpu_count(),
+        'single_steps_per_s': single,
+        'vector': {'envs': args.envs, 'workers': workers, 'steps_per_s': vector},
+    }, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
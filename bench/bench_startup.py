@@ -0,0 +1,86 @@
+"""
+Paleidimo laiko testai: laikas iki pirmo kadro su tingiais ir iš karto kraunamais ištekliais
+
+Kiekvienas paleidimas - atskiras procesas (game.py --headless --startup-report).
+"Šaltas" paleidimas naudoja tuščią kadrų podėlio katalogą:
+
+    python bench/bench_startup.py
+    python bench/bench_startup.py --runs 5 --out startup.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_RUNS = 3
+
+
+def run_game(eager, cache_dir):
+    """Paleidžia žaidimą vienam kadrui; grąžina (proceso laikas ms, startup ataskaita)"""
+    env = dict(os.environ)
+    env["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    env["KATINUKAS_EAGER_ASSETS"] = "1" if eager else "0"
+    if cache_dir is not None:
+        env["KATINUKAS_ASSET_CACHE"] = cache_dir
+    start = time.perf_counter()
+    out = subprocess.run(
+        [sys.executable, os.path.join(ROOT_DIR, "game.py"), "--headless", "--frames", "1",
+         "--startup-report"],
+        cwd=ROOT_DIR, env=env, check=True, capture_output=True, text=True).stdout
+    wall_ms = (time.perf_counter() - start) * 1000.0
+    return wall_ms, json.loads(out.strip().splitlines()[-1])
+
+
+def run_case(eager, cold, runs):
+    """Kelis kartus paleidžia vieną atvejį; grąžina medianas"""
+    walls, firsts = [], []
+    for _ in range(runs):
+        if cold:
+            with tempfile.TemporaryDirectory() as cache_dir:
+                wall_ms, report = run_game(eager, cache_dir)
+        else:
+            wall_ms, report = run_game(eager, None)
+        walls.append(wall_ms)
+        firsts.append(report['first_frame_ms'])
+    return {
+        'eager': eager,
+        'cold': cold,
+        'process_ms': sorted(walls)[len(walls) // 2],
+        'first_frame_ms': sorted(firsts)[len(firsts) // 2],
+        'assets_loaded': report['assets_loaded'],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Paleidimo laiko testai")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="paleidimų skaičius kiekvienam atvejui")
+    parser.add_argument("--out", help="rezultatų JSON failas")
+    args = parser.parse_args()
+    
+    # Šiltas podėlis paruošiamas vienu paleidimu
+    run_game(True, None)
+    
+    results = []
+    for cold in (True, False):
+        for eager in (True, False):
+            result = run_case(eager, cold, args.runs)
+            results.append(result)
+            print("%-5s %-6s  pirmas kadras %7.1f ms  procesas %7.1f ms  ištekliai %d" % (
+                "cold" if cold else "warm", "eager" if eager else "lazy",
+                result['first_frame_ms'], result['process_ms'], result['assets_loaded']),
+                file=sys.stderr)
+    
+    text = json.dumps({'results': results}, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+"""
+Povandeninio žaidimo našumo testai (headless, su scenarijaus įvestimi)
+
+Kiekvienas scenarijus paleidžiamas atskirame procese (kad peak RSS būtų tikslus),
+rezultatai išvedami JSON formatu:
+
+    python bench/bench_underwater.py --out results.json
+    python bench/bench_underwater.py --counts 6 100 --frames 300
+    python bench/bench_underwater.py --counts 1000 --screens 10
+    python bench/bench_underwater.py --compare baseline.json results.json
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # stdout - tik JSON
+
+DEFAULT_COUNTS = (6, 100, 1000, 10000)
+DEFAULT_FRAMES = 240
+WARMUP_FRAMES = 20
+ALLOC_FRAMES = 60
+REGRESSION_THRESHOLD = 0.15  # +15 % prie p50 laiko laikoma regresija
+CATCH_EVERY = 8  # gaudymo (SPACE) dažnis kadrais
+
+
+def scripted_keys(frame_no):
+    """Deterministinė įvestis: plaukia pirmyn/atgal, nyra ir kyla, leidžia burbulus, gaudo
+    
+    Blizgė grimzta (be W) 120 kadrų - iki žuvų juostos ir dugno, kitus 120
+    kadrų kyla trumpais W paspaudimais. Gaudoma kas CATCH_EVERY kadrų, kad
+    gaudymas ir žuvų grąžinimas į telkinį būtų matuojami, bet per testą
+    sugautų žuvų būtų tik nedidelė dalis.
+    """
+    import pygame
+    from inputs import KeyState
+    
+    pressed = set()
+    pressed.add(pygame.K_d if (frame_no // 90) % 2 == 0 else pygame.K_a)
+    if (frame_no // 120) % 2 == 1 and frame_no % 20 < 3:
+        pressed.add(pygame.K_w)
+    if frame_no % CATCH_EVERY == 0:
+        pressed.add(pygame.K_SPACE)
+    if frame_no % 3 == 0:
+        pressed.add(pygame.K_f)
+    return KeyState(pressed)
+
+
+def percentile(values, q):
+    """Grąžina q procentilį (0..1) iš reikšmių sąrašo"""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def summarize(values):
+    """Laikų (ms) santrauka"""
+    return {
+        'mean': sum(values) / len(values),
+        'p50': percentile(values, 0.5),
+        'p95': percentile(values, 0.95),
+        'max': max(values),
+    }
+
+
+def peak_rss_kb():
+    """Proceso peak RSS kilobaitais (None, jei platforma nepalaiko)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS grąžina baitais, Linux - kilobaitais
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+
+def make_game(assets, count, seed, screens=1):
+    """Sukuria povandeninį žaidimą su count žuvų ir count ryklių (išbarstytų per screens ekranų lygį)"""
+    from constants import WIDTH, HEIGHT
+    from headless import silent_sounds
+    from timing import ManualClock
+    from underwater import UnderwaterGame
+    
+    random.seed(seed)
+    clock = ManualClock()
+    game = UnderwaterGame(assets, silent_sounds(), clock, level_width=WIDTH * screens)
+    game.initialize(WIDTH // 2, HEIGHT // 2 - 100)
+    game.spawn_fish(count)
+    game.spawn_sharks(count, x_min=20, x_max=game.level_width - 200)
+    return game, clock
+
+
+def step(game, clock, frame_no, lives_state):
+    """Vienas simuliacijos žingsnis (kaip Game.update_underwater, be mirties)"""
+    from constants import SIM_STEP_MS
+    
+    keys = scripted_keys(frame_no)
+    game.update(keys)
+    game.collect_coins()
+    _, lives_state[1], _ = game.check_shark_collision(lives_state[0], lives_state[1])
+    clock.advance(SIM_STEP_MS)
+
+
+def run_scenario(count, frames, seed, screens=1):
+    """Paleidžia vieną scenarijų šiame procese ir grąžina rezultatų žodyną"""
+    import pygame
+    from constants import WIDTH, HEIGHT
+    from headless import load_headless_assets
+    
+    assets = load_headless_assets()
+    screen = pygame.Surface((WIDTH, HEIGHT))
+    game, clock = make_game(assets, count, seed, screens)
+    lives_state = [10 ** 9, 0]
+    
+    for frame_no in range(WARMUP_FRAMES):
+        step(game, clock, frame_no, lives_state)
+        game.draw(screen)
+    
+    # --- Laikai (be tracemalloc, kad nematuotume jo paties) ---
+    update_ms, draw_ms = [], []
+    gc_before = gc.get_stats()[0]['collections']
+    for frame_no in range(WARMUP_FRAMES, WARMUP_FRAMES + frames):
+        t0 = time.perf_counter()
+        step(game, clock, frame_no, lives_state)
+        t1 = time.perf_counter()
+        game.draw(screen)
+        t2 = time.perf_counter()
+        update_ms.append((t1 - t0) * 1000.0)
+        draw_ms.append((t2 - t1) * 1000.0)
+    gc_collections = gc.get_stats()[0]['collections'] - gc_before
+    
+    # --- Alokacijos (atskiras praėjimas su tracemalloc) ---
+    # reset_peak() yra tik nuo Python 3.9; senesnėse sekimas pradedamas iš naujo kiekvienam kadrui
+    can_reset_peak = hasattr(tracemalloc, "reset_peak")
+    tracemalloc.start()
+    transient_bytes, net_blocks = [], []
+    frame_no = WARMUP_FRAMES + frames
+    for frame_no in range(frame_no, frame_no + ALLOC_FRAMES):
+        if can_reset_peak:
+            tracemalloc.reset_peak()
+        else:
+            tracemalloc.stop()
+            tracemalloc.start()
+        blocks_before = sys.getallocatedblocks()
+        before, _ = tracemalloc.get_traced_memory()
+        step(game, clock, frame_no, lives_state)
+        game.draw(screen)
+        _, peak = tracemalloc.get_traced_memory()
+        transient_bytes.append(peak - before)
+        net_blocks.append(sys.getallocatedblocks() - blocks_before)
+    tracemalloc.stop()
+    
+    return {
+        'count': count,
+        'screens': screens,
+        'frames': frames,
+        'entities': {'fish': len(game.fish), 'sharks': len(game.sharks), 'bubbles': len(game.bubbles)},
+        'caught': game.caught_count,
+        'update_ms': summarize(update_ms),
+        'draw_ms': summarize(draw_ms),
+        'frame_ms': summarize([u + d for u, d in zip(update_ms, draw_ms)]),
+        'alloc': {
+            'transient_bytes_per_frame': sum(transient_bytes) / len(transient_bytes),
+            'net_blocks_per_frame': sum(net_blocks) / len(net_blocks),
+            'gc_gen0_per_frame': gc_collections / frames,
+        },
+        'peak_rss_kb': peak_rss_kb(),
+    }
+
+
+def run_isolated(count, frames, seed, screens=1):
+    """Paleidžia scenarijų atskirame procese, grąžina jo JSON rezultatą"""
+    cmd = [sys.executable, os.path.abspath(__file__), "--scenario", str(count),
+           "--frames", str(frames), "--seed", str(seed), "--screens", str(screens)]
+    out = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def environment_info():
+    """Aplinkos informacija, kad būtų galima palyginti rezultatus"""
+    import pygame
+    from constants import VECTORIZED
+    from soa import NUMPY_AVAILABLE
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR,
+                                capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'platform': platform.platform(),
+        'commit': commit,
+        'vectorized': VECTORIZED and NUMPY_AVAILABLE,
+    }
+
+
+def compare(baseline_path, current_path, threshold=REGRESSION_THRESHOLD):
+    """Palygina du rezultatų failus; grąžina regresijų sąrašą"""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {r['count']: r for r in json.load(f)['results']}
+    with open(current_path, encoding="utf-8") as f:
+        current = {r['count']: r for r in json.load(f)['results']}
+    
+    regressions = []
+    for count, cur in sorted(current.items()):
+        base = baseline.get(count)
+        if base is None:
+            continue
+        # Kitoks sugautų žuvų skaičius - kitas darbo kiekis (arba pakeista žaidimo logika)
+        if base.get('caught') is not None and base['caught'] != cur.get('caught'):
+            print("%6d sugauta %d -> %s žuvų" % (count, base['caught'], cur.get('caught')))
+        for metric in ('update_ms', 'draw_ms', 'frame_ms'):
+            old, new = base[metric]['p50'], cur[metric]['p50']
+            change = (new - old) / old if old else 0.0
+            print("%6d %-10s p50 %8.3f -> %8.3f ms (%+.1f %%)" % (count, metric, old, new, change * 100))
+            if change > threshold:
+                regressions.append((count, metric, change))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Povandeninio žaidimo našumo testai")
+    parser.add_argument("--counts", type=int, nargs="+", default=list(DEFAULT_COUNTS),
+                        help="žuvų ir ryklių skaičiai (kiekvieno)")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES, help="matuojamų kadrų skaičius")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--screens", type=int, default=1, help="lygio plotis ekranais")
+    parser.add_argument("--out", help="rezultatų JSON failas (kitaip - stdout)")
+    parser.add_argument("--scenario", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CURRENT"),
+                        help="palyginti du rezultatų failus (išeina su 1, jei yra regresija)")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    args = parser.parse_args()
+    
+    if args.compare:
+        regressions = compare(args.compare[0], args.compare[1], args.threshold)
+        for count, metric, change in regressions:
+            print("REGRESIJA: %d objektų, %s +%.1f %%" % (count, metric, change * 100))
+        sys.exit(1 if regressions else 0)
+    
+    if args.scenario is not None:
+        print(json.dumps(run_scenario(args.scenario, args.frames, args.seed, args.screens)))
+        return
+    
+    report = {
+        'benchmark': 'underwater',
+        'env': environment_info(),
+        'seed': args.seed,
+        'results': [],
+    }
+    for count in args.counts:
+        result = run_isolated(count, args.frames, args.seed, args.screens)
+        report['results'].append(result)
+        print("%6d: update p50 %.3f ms, draw p50 %.3f ms, sugauta %d, RSS %s KB" % (
+            count, result['update_ms']['p50'], result['draw_ms']['p50'], result['caught'],
+            result['peak_rss_kb']),
+            file=sys.stderr)
+    
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
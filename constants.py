@@ -1,12 +1,64 @@
 """
 Žaidimo konstantos ir konfigūracija
 """
+import math
+import os
 
 # --- Lango nustatymai ---
 WIDTH, HEIGHT = 1280, 720
 
+# --- Simuliacijos nustatymai ---
+SIM_HZ = 60  # Simuliacijos žingsnių per sekundę (visi greičiai - per žingsnį)
+SIM_STEP_MS = 1000 / SIM_HZ
+MAX_SIM_STEPS_PER_FRAME = 5  # Daugiau žingsnių per kadrą nedaroma (lėtiems kompiuteriams)
+MAX_RENDER_FPS = 144  # 0 - neribojama
+# Žaidimo laiko greitis (2 - dvigubai greičiau, 0 - kiek leidžia kompiuteris; QA ir balansavimui)
+TIME_SCALE = float(os.environ.get("KATINUKAS_TIME_SCALE", "1"))
+if not (math.isfinite(TIME_SCALE) and TIME_SCALE >= 0):
+    raise ValueError("KATINUKAS_TIME_SCALE turi būti baigtinis skaičius >= 0: %r" % TIME_SCALE)
+FAST_FORWARD_RENDER_FPS = 30  # Kai laikas pagreitintas, kadrai piešiami ne dažniau (kiti praleidžiami)
+# Žuvis, ryklius ir burbulus atnaujinti NumPy masyvais (jei NumPy įdiegtas)
+VECTORIZED = os.environ.get("KATINUKAS_NUMPY", "0") == "1"
+
+# --- Ištekliai ---
+ASSET_WORKERS = min(8, os.cpu_count() or 1)  # Gijų skaičius dekodavimui ir masteliui
+# Paruoštų kadrų kešas diske (KATINUKAS_ASSET_CACHE= - išjungti)
+ASSET_CACHE_DIR = os.environ.get(
+    "KATINUKAS_ASSET_CACHE", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "assets"))
+# Ištekliai kraunami pirmą kartą prireikus (KATINUKAS_EAGER_ASSETS=1 - visi iš karto)
+LAZY_ASSETS = os.environ.get("KATINUKAS_EAGER_ASSETS", "0") != "1"
+# Sprite atlasas (kuriamas: python atlas.py); nesant aktualaus - kadrai kraunami atskirai
+ATLAS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "images", "atlas")
+ATLAS_PAGE_SIZE = 2048
+
+# --- Piešimo nustatymai ---
+# Pasaulis piešiamas RENDER_SCALE kartų mažesniame paviršiuje su tiek pat kartų mažesniais
+# sprite'ais ir vienu transform.scale padidinamas iki lango; HUD - pilna raiška (1 - išjungta).
+# Lango matmenys turi dalytis iš RENDER_SCALE, kad padidinimas būtų sveikas (1, 2, 4, 5, 8, ...)
+RENDER_SCALE = max(1, int(os.environ.get("KATINUKAS_RENDER_SCALE", "1")))
+if WIDTH % RENDER_SCALE or HEIGHT % RENDER_SCALE:
+    raise ValueError("KATINUKAS_RENDER_SCALE=%d: %dx%d langas iš jo nesidalija (tinka %s)" % (
+        RENDER_SCALE, WIDTH, HEIGHT,
+        ", ".join(str(k) for k in range(1, HEIGHT + 1) if WIDTH % k == 0 and HEIGHT % k == 0)))
+# Paviršiuje atnaujinti tik pasikeitusias ekrano sritis (silpniems kompiuteriams)
+DIRTY_RECTS = os.environ.get("KATINUKAS_DIRTY_RECTS", "0") == "1"
+
+# --- Profiliavimas ---
+# F3 įjungia kadro fazių laikų perdangą; KATINUKAS_PROFILE=1 - įjungta nuo pradžių,
+# KATINUKAS_PROFILE_OUT=failas.csv|failas.jsonl - rašyti kiekvieno kadro laikus
+PROFILE_ENABLED = os.environ.get("KATINUKAS_PROFILE", "0") == "1"
+PROFILE_OUTPUT = os.environ.get("KATINUKAS_PROFILE_OUT") or None
+PROFILE_WINDOW = 240  # Kiek paskutinių kadrų naudoti procentiliams
+
 # --- Pasaulio nustatymai ---
-WORLD_WIDTH = 6000
+WORLD_WIDTH = float("inf")  # Paviršius begalinis: generuojamas gabalais (world.py)
+SURFACE_CHUNK_WIDTH = 1024  # Paviršiaus gabalo plotis (px)
+SURFACE_CHUNKS_AHEAD = 1  # Kiek gabalų laikyti už matomos srities priekyje
+SURFACE_CHUNKS_BEHIND = 1  # ... ir už nugaros
+SURFACE_CHUNK_CROWS = 2  # Varnų skaičius gabale
+SURFACE_SPOT_MARGIN = 100  # Telkinio atstumas nuo gabalo kraštų
+# Paviršiaus pasaulio sėkla (nenurodžius - atsitiktinė kiekvienam žaidimui)
+WORLD_SEED = int(os.environ["KATINUKAS_WORLD_SEED"]) if os.environ.get("KATINUKAS_WORLD_SEED") else None
 
 # --- Animacijų nustatymai ---
 FRAME_WIDTH = 128
@@ -52,6 +104,8 @@ SHARK_ATTACK_SPEED = 2.4
 SHARK_ATTACK_RANGE = 140
 SHARK_PATROL_TURN_CHANCE = 0.01
 SHARK_SLOW_MS = 2000
+SHARK_AI_NEAR_RADIUS = 2 * SHARK_ATTACK_RANGE  # Arčiau blizgės ryklys atnaujinamas pilnai kas žingsnį
+SHARK_AI_THINK_INTERVAL = 4  # Toliau esantis ryklys sprendžia kas tiek žingsnių (juda kiekvieną)
 
 # --- Žaidėjo gyvybės ---
 MAX_LIVES = 5
@@ -73,14 +127,39 @@ UW_SPEED = 3.0
 GRAVITY = 0.35
 PLATFORM_TOP_COLLIDE_H = 20
 
+# --- Povandeninis lygis ---
+# Lygio plotis ekranais (kamera seka žaidėją); turinys (žuvys, rykliai, platformos) - kiekvienam ekranui
+UW_LEVEL_SCREENS = max(1, int(os.environ.get("KATINUKAS_UW_SCREENS", "1")))
+UW_LEVEL_WIDTH = WIDTH * UW_LEVEL_SCREENS
+UW_ACTIVE_MARGIN = WIDTH // 2  # Už tiek nuo matomos srities žuvys ir rykliai atnaujinami retiau
+UW_FAR_UPDATE_INTERVAL = 4  # Toli esantis objektas atnaujinamas kas tiek žingsnių (tiek žingsnių iš karto)
+
+# --- Kolizijų tinklelis ---
+GRID_CELL_SIZE = 128  # Erdvinio tinklelio langelio dydis (px)
+
 # --- Burbulai ---
 BUBBLE_SCALE = 3
 BUBBLE_SPEED = 6.0
 BUBBLE_LIFETIME_MS = 1500
 BUBBLE_COOLDOWN_MS = 120
+BUBBLE_POOL_SIZE = BUBBLE_LIFETIME_MS // BUBBLE_COOLDOWN_MS + 1  # Daugiau vienu metu nebūna
+
+# --- UI ---
+TEXT_CACHE_SIZE = 128  # Kiek atvaizduotų tekstų laikyti kešuose (LRU)
 
 # --- Žvejybos nustatymai ---
 PROXIMITY_THRESHOLD = 140
 
 # --- Lygių sistema ---
 SPOTS_PER_LEVEL = 3  # Kiek telkinių reikia sugaudyti, kad pereiti į kitą lygį
+LEVEL_BANNER_MS = 3000  # Kiek žaidimo laiko rodomas naujo lygio pranešimas
+
+# --- Mokymosi aplinka (env.py) ---
+ENV_MAX_STEPS = 3600  # Epizodas nutraukiamas po tiek žingsnių (1 min. žaidimo laiko)
+ENV_OBS_FISH = 6  # Kiek artimiausių žuvų, ryklių, monetų ir platformų patenka į stebėjimą
+ENV_OBS_SHARKS = 4
+ENV_OBS_COINS = 4
+ENV_OBS_PLATFORMS = 2
+ENV_REWARD_FISH = 1.0
+ENV_REWARD_COIN = 0.1
+ENV_PENALTY_HIT = 1.0
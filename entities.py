@@ -5,14 +5,18 @@ import pygame
 import random
 import math
 from constants import *
+from assets import flip_frames, sprite_size
+from timing import lerp
 
 
 class Player:
     """Žaidėjas (valtis)"""
-    def __init__(self, frames):
+    def __init__(self, frames, frames_left=None):
         self.frames = frames
+        self.frames_left = frames_left if frames_left is not None else flip_frames(frames)
         self.x = (WIDTH - FRAME_WIDTH * SCALE) // 2
         self.y = (HEIGHT - FRAME_HEIGHT * SCALE) // 2 + 100
+        self.prev_x = self.x
         self.current_frame = 0
         self.facing_left = False
         self.moving = False
@@ -22,6 +26,7 @@ class Player:
         """Atnaujina žaidėjo poziciją"""
         self.moving = False
         old_x = self.x
+        self.prev_x = self.x
         
         if keys[pygame.K_a]:
             self.facing_left = True
@@ -49,12 +54,11 @@ class Player:
         
         return scroll_x
     
-    def draw(self, screen):
-        """Nupiešia žaidėją"""
-        frame = self.frames[int(self.current_frame)]
-        if self.facing_left:
-            frame = pygame.transform.flip(frame, True, False)
-        screen.blit(frame, (self.x, self.y))
+    def draw(self, screen, alpha=1.0):
+        """Nupiešia žaidėją (alpha - interpoliacija tarp simuliacijos žingsnių)"""
+        frames = self.frames_left if self.facing_left else self.frames
+        frame = frames[int(self.current_frame)]
+        screen.blit(frame, (int(lerp(self.prev_x, self.x, alpha)), self.y))
     
     def get_world_x(self, scroll_x):
         """Grąžina žaidėjo poziciją pasaulio koordinatėse"""
@@ -70,39 +74,53 @@ class Player:
 
 class Varna:
     """Varnos (paukščiai)"""
-    def __init__(self, x, y):
+    def __init__(self, x, y, rng=random, x_range=(0, WIDTH - VARNA_FRAME_WIDTH * VARNA_SCALE)):
         self.x = x
         self.y = y
-        self.dx = random.choice([-1, 1]) * random.uniform(0.5, 1.5)
-        self.dy = random.choice([-1, 1]) * random.uniform(0.2, 0.7)
+        self.prev_x, self.prev_y = x, y
+        self.min_x, self.max_x = x_range  # Skraido tarp šių x (pasaulio koordinatės)
+        self.dx = rng.choice([-1, 1]) * rng.uniform(0.5, 1.5)
+        self.dy = rng.choice([-1, 1]) * rng.uniform(0.2, 0.7)
     
     def update(self):
         """Atnaujina varnos poziciją"""
+        self.prev_x, self.prev_y = self.x, self.y
         self.x += self.dx
         self.y += self.dy
         
-        # Atsimušti nuo ekrano kraštų
-        if self.x < 0 or self.x > WIDTH - VARNA_FRAME_WIDTH * VARNA_SCALE:
+        # Atsimušti nuo savo srities kraštų
+        if self.x < self.min_x or self.x > self.max_x:
             self.dx *= -1
         if self.y < 0 or self.y > 300:
             self.dy *= -1
     
-    def draw(self, screen, frame, scroll_x):
+    def blit_args(self, frame, scroll_x, alpha=1.0):
+        """Grąžina (paveikslėlis, pozicija) piešimui (vienam fblits sluoksniui)"""
+        x = lerp(self.prev_x, self.x, alpha)
+        y = lerp(self.prev_y, self.y, alpha)
+        return frame, (int(x + scroll_x), int(y))
+    
+    def draw(self, screen, frame, scroll_x, alpha=1.0):
         """Nupiešia varną"""
-        screen.blit(frame, (int(self.x + scroll_x), int(self.y)))
+        screen.blit(*self.blit_args(frame, scroll_x, alpha))
 
 
 class FishingSpot:
     """Žvejybos taškas"""
-    def __init__(self, x, y):
+    def __init__(self, x, y, key=None):
         self.x = x
         self.y = y
+        self.key = key  # (gabalas, nr.) - pagal jį įsimenami sugauti telkiniai
         self.disabled = False
     
+    def blit_args(self, frame, scroll_x):
+        """Grąžina (paveikslėlis, pozicija) piešimui (išjungtumo netikrina)"""
+        return frame, (int(self.x + scroll_x), self.y)
+    
     def draw(self, screen, frame, scroll_x):
         """Nupiešia žvejybos tašką"""
         if not self.disabled:
-            screen.blit(frame, (int(self.x + scroll_x), self.y))
+            screen.blit(*self.blit_args(frame, scroll_x))
     
     def get_center(self):
         """Grąžina taško centro koordinates"""
@@ -111,23 +129,84 @@ class FishingSpot:
         return center_x, center_y
 
 
+class PlayerBody:
+    """Blizgės (žaidėjo po vandeniu) kolizijų stačiakampiai
+    
+    Stačiakampiai sukuriami vieną kartą ir tik perkeliami. hitbox - dabartinė
+    vieta, prev_box - vieta žingsnio pradžioje, hurt_box - nepermatoma
+    sprite'o dalis (žalos paieškai), sweep - prev_box ir hitbox sąjunga
+    (visa per žingsnį nukeliauta sritis).
+    """
+    def __init__(self):
+        self.hitbox = pygame.Rect(0, 0, 0, 0)
+        self.prev_box = pygame.Rect(0, 0, 0, 0)
+        self.hurt_box = pygame.Rect(0, 0, 0, 0)
+        self.sweep = pygame.Rect(0, 0, 0, 0)
+        self.hurt_offset = (0, 0)
+    
+    def set_shape(self, size, hurt_rect=None):
+        """Nustato dydį; hurt_rect - žalos sritis sprite'o koordinatėmis (numatyta - visas)"""
+        self.hitbox.size = size
+        self.prev_box.size = size
+        hurt_rect = hurt_rect or pygame.Rect((0, 0), size)
+        self.hurt_box.size = hurt_rect.size
+        self.hurt_offset = hurt_rect.topleft
+    
+    def place(self, center_x, top_y):
+        """Perkelia kūną be judėjimo (prev_box - toje pačioje vietoje)"""
+        self.move_to(center_x, top_y)
+        self.begin_step()
+    
+    def begin_step(self):
+        """Įsimena vietą žingsnio pradžioje"""
+        self.prev_box.topleft = self.hitbox.topleft
+        self.sweep.update(self.hitbox)
+    
+    def move_to(self, center_x, top_y):
+        """Perkelia kūną (centras x, viršus y) ir atnaujina išvestinius stačiakampius"""
+        hitbox = self.hitbox
+        hitbox.topleft = (int(center_x - hitbox.width // 2), int(top_y))
+        self.hurt_box.topleft = (hitbox.x + self.hurt_offset[0], hitbox.y + self.hurt_offset[1])
+        self.sweep.update(self.prev_box)
+        self.sweep.union_ip(hitbox)
+    
+    def landing_x(self, surface_y):
+        """Centro x tą žingsnio akimirką, kai apačia kerta surface_y (None, jei nekerta)"""
+        prev_box, hitbox = self.prev_box, self.hitbox
+        if not prev_box.bottom <= surface_y <= hitbox.bottom:
+            return None
+        fall = hitbox.bottom - prev_box.bottom
+        t = (surface_y - prev_box.bottom) / fall if fall else 1.0
+        return prev_box.centerx + (hitbox.centerx - prev_box.centerx) * t
+
+
 class UnderwaterFish:
     """Povandenė žuvis (gaudoma)"""
-    def __init__(self, zuvis_a_img):
-        self.x = random.randint(100, WIDTH - 100)
-        self.y = random.randint(HEIGHT//2 + 20, HEIGHT - 120)
-        self.dx = random.choice([-1, 1]) * random.uniform(1.0, 2.2)
-        self.rect = pygame.Rect(self.x, self.y, zuvis_a_img.get_width(), zuvis_a_img.get_height())
+    def __init__(self, zuvis_a_img, level_width=WIDTH, rng=random):
+        self.rect = pygame.Rect((0, 0), sprite_size(zuvis_a_img))
+        self.level_width = level_width
+        self.rng = rng
+        self.reset()
+    
+    def reset(self):
+        """Naujai nustato žuvį (naudojama ir telkinyje)"""
+        rng = self.rng
+        self.x = rng.randint(100, self.level_width - 100)
+        self.y = rng.randint(HEIGHT//2 + 20, HEIGHT - 120)
+        self.dx = rng.choice([-1, 1]) * rng.uniform(1.0, 2.2)
+        self.prev_x = self.x
+        self.rect.topleft = (self.x, self.y)
         self.frame_idx = 0
         self.frame_tick = 0
         self.caught = False
     
-    def update(self, platforms, zuvis_a_frames):
-        """Atnaujina žuvies poziciją"""
-        self.x += self.dx
+    def update(self, platforms, zuvis_a_frames, steps=1):
+        """Atnaujina žuvies poziciją (steps - kiek žingsnių atnaujinama iš karto)"""
+        self.prev_x = self.x
+        self.x += self.dx * steps
         
-        # Atsimušti nuo ekrano kraštų
-        if self.x <= 10 or self.x >= WIDTH - self.rect.width - 10:
+        # Atsimušti nuo lygio kraštų
+        if self.x <= 10 or self.x >= self.level_width - self.rect.width - 10:
             self.dx *= -1
         
         self.rect.x = int(self.x)
@@ -147,53 +226,73 @@ class UnderwaterFish:
         
         # Animacija
         if zuvis_a_frames:
-            self.frame_tick += 1
+            self.frame_tick += steps
             if self.frame_tick >= 8:
-                self.frame_tick = 0
+                self.frame_tick -= 8
                 self.frame_idx = (self.frame_idx + 1) % len(zuvis_a_frames)
     
-    def draw(self, screen, zuvis_a_frames, zuvis_a_img):
-        """Nupiešia žuvį"""
-        if zuvis_a_frames:
-            img = zuvis_a_frames[self.frame_idx]
-        else:
-            img = zuvis_a_img
-        
+    def frame(self, zuvis_a_frames, zuvis_a_img, zuvis_a_frames_left, zuvis_a_img_left):
+        """Dabartinis kadras pagal kryptį (tinka ir kadrų kaukėms)"""
         if self.dx < 0:
-            img = pygame.transform.flip(img, True, False)
+            zuvis_a_frames, zuvis_a_img = zuvis_a_frames_left, zuvis_a_img_left
         
-        screen.blit(img, (int(self.x), int(self.y)))
+        if zuvis_a_frames:
+            return zuvis_a_frames[self.frame_idx]
+        return zuvis_a_img
+    
+    def blit_args(self, zuvis_a_frames, zuvis_a_img, zuvis_a_frames_left, zuvis_a_img_left,
+                  uw_scroll_x=0, alpha=1.0):
+        """Grąžina (paveikslėlis, pozicija) piešimui"""
+        img = self.frame(zuvis_a_frames, zuvis_a_img, zuvis_a_frames_left, zuvis_a_img_left)
+        return img, (int(lerp(self.prev_x, self.x, alpha) - uw_scroll_x), int(self.y))
+    
+    def draw(self, screen, zuvis_a_frames, zuvis_a_img, zuvis_a_frames_left, zuvis_a_img_left,
+             uw_scroll_x=0, alpha=1.0):
+        """Nupiešia žuvį"""
+        screen.blit(*self.blit_args(zuvis_a_frames, zuvis_a_img, zuvis_a_frames_left,
+                                    zuvis_a_img_left, uw_scroll_x, alpha))
 
 
 class Shark:
     """Ryklys (priešas)"""
-    def __init__(self, riklys_a_frames):
-        self.x = random.randint(200, 1000)
-        self.y = random.randint(HEIGHT // 2 + 10, HEIGHT - 120)
-        self.dx = random.choice([-1, 1]) * SHARK_PATROL_SPEED
+    def __init__(self, riklys_a_frames, level_width=WIDTH, rng=random):
+        self.level_width = level_width
+        self.rng = rng
+        self.x = rng.randint(200, 1000)
+        self.y = rng.randint(HEIGHT // 2 + 10, HEIGHT - 120)
+        self.prev_x, self.prev_y = self.x, self.y
+        self.dx = rng.choice([-1, 1]) * SHARK_PATROL_SPEED
         self.state = "patrol"
         self.frame_idx = 0
         self.frame_tick = 0
         
         if riklys_a_frames:
-            w = riklys_a_frames[0].get_width()
-            h = riklys_a_frames[0].get_height()
+            w, h = sprite_size(riklys_a_frames[0])
         else:
             w, h = 32, 16
         
         self.rect = pygame.Rect(self.x, self.y, w, h)
         self.slow_until = 0
+        self.speed_factor = 1.0  # sulėtinimas, su kuriuo apskaičiuotas dx
+        self.lure_dist = 0.0  # atstumas iki žaidėjo per paskutinį sprendimą
     
-    def update(self, player_x, player_y, riklys_a_frames, riklys_b_frames):
-        """Atnaujina ryklio poziciją ir būseną"""
-        now_ms = pygame.time.get_ticks()
+    def update(self, player_x, player_y, riklys_a_frames, riklys_b_frames, now_ms, steps=1):
+        """Atnaujina ryklio poziciją ir būseną (steps - kiek žingsnių atnaujinama iš karto)"""
+        self.prev_x, self.prev_y = self.x, self.y
+        self.think(player_x, player_y, now_ms, steps)
+        self.move(now_ms, steps)
+    
+    def think(self, player_x, player_y, now_ms, steps=1):
+        """AI sprendimas: būsena, kryptis ir supimasis (steps žingsnių laikotarpiui)"""
         slow_active = now_ms < self.slow_until
         speed_factor = 0.5 if slow_active else 1.0
+        self.speed_factor = speed_factor
         
         # Atstumas iki žaidėjo
         dxp = (player_x - self.x)
         dyp = (player_y - self.y)
         dist = (dxp * dxp + dyp * dyp) ** 0.5
+        self.lure_dist = dist
         
         # Būsenos sprendimas
         if dist <= SHARK_ATTACK_RANGE:
@@ -204,61 +303,85 @@ class Shark:
         else:
             if self.state != "patrol":
                 self.state = "patrol"
-                self.dx = random.choice([-1, 1]) * (SHARK_PATROL_SPEED * speed_factor)
+                self.dx = self.rng.choice([-1, 1]) * (SHARK_PATROL_SPEED * speed_factor)
             
-            if random.random() < SHARK_PATROL_TURN_CHANCE:
+            if self.rng.random() < SHARK_PATROL_TURN_CHANCE * steps:
                 self.dx = -self.dx
             
-            self.y += math.sin(pygame.time.get_ticks() / 600.0 + self.x) * 0.2
+            self.y += math.sin(now_ms / 600.0 + self.x) * 0.2 * steps
         
         if self.state == "patrol":
             self.dx = math.copysign(SHARK_PATROL_SPEED * speed_factor, self.dx)
+    
+    def move(self, now_ms, steps=1):
+        """Judėjimas ir animacija pagal paskutinį sprendimą
         
-        # Judėjimas
-        self.x += self.dx
+        Sulėtinimas tikrinamas kiekvieną kartą: burbulo pataikytas ryklys
+        sulėtėja iš karto, nelaukdamas kito sprendimo.
+        """
+        speed_factor = 0.5 if now_ms < self.slow_until else 1.0
+        if speed_factor != self.speed_factor:
+            self.dx *= speed_factor / self.speed_factor
+            self.speed_factor = speed_factor
+        
+        self.x += self.dx * steps
         if self.x < 10:
             self.x = 10
             self.dx *= -1
-        if self.x > WIDTH - self.rect.width - 10:
-            self.x = WIDTH - self.rect.width - 10
+        if self.x > self.level_width - self.rect.width - 10:
+            self.x = self.level_width - self.rect.width - 10
             self.dx *= -1
         
         self.rect.x = int(self.x)
         self.rect.y = int(self.y)
         
         # Animacija
-        self.frame_tick += 1
+        self.frame_tick += steps
         if self.frame_tick >= 8:
-            self.frame_tick = 0
+            self.frame_tick -= 8
             self.frame_idx = (self.frame_idx + 1) % RIKLYS_SHEET_FRAMES
     
-    def draw(self, screen, riklys_a_frames, riklys_b_frames, uw_scroll_x):
-        """Nupiešia ryklį"""
-        if self.state == "attack":
-            img = riklys_b_frames[self.frame_idx % len(riklys_b_frames)]
-        else:
-            img = riklys_a_frames[self.frame_idx % len(riklys_a_frames)]
-        
+    def frame(self, riklys_a_frames, riklys_b_frames, riklys_a_frames_left, riklys_b_frames_left):
+        """Dabartinis kadras pagal kryptį ir būseną (tinka ir kadrų kaukėms)"""
         if self.dx < 0:
-            img = pygame.transform.flip(img, True, False)
+            riklys_a_frames, riklys_b_frames = riklys_a_frames_left, riklys_b_frames_left
         
-        screen.blit(img, (int(self.x - uw_scroll_x), int(self.y)))
+        frames = riklys_b_frames if self.state == "attack" else riklys_a_frames
+        return frames[self.frame_idx % len(frames)]
+    
+    def blit_args(self, riklys_a_frames, riklys_b_frames, uw_scroll_x,
+                  riklys_a_frames_left, riklys_b_frames_left, alpha=1.0):
+        """Grąžina (paveikslėlis, pozicija) piešimui"""
+        img = self.frame(riklys_a_frames, riklys_b_frames, riklys_a_frames_left, riklys_b_frames_left)
+        x = lerp(self.prev_x, self.x, alpha)
+        y = lerp(self.prev_y, self.y, alpha)
+        return img, (int(x - uw_scroll_x), int(y))
+    
+    def draw(self, screen, riklys_a_frames, riklys_b_frames, uw_scroll_x,
+             riklys_a_frames_left, riklys_b_frames_left, alpha=1.0):
+        """Nupiešia ryklį"""
+        screen.blit(*self.blit_args(riklys_a_frames, riklys_b_frames, uw_scroll_x,
+                                    riklys_a_frames_left, riklys_b_frames_left, alpha))
 
 
 class Bubble:
     """Burbulas (sulėtina ryklius)"""
-    def __init__(self, x, y, facing_left, burbulai_frames):
+    def __init__(self, x, y, facing_left, burbulai_frames, now_ms):
+        bw, bh = sprite_size(burbulai_frames[0])
+        self.rect = pygame.Rect(0, 0, bw, bh)
+        self.reset(x, y, facing_left, now_ms)
+    
+    def reset(self, x, y, facing_left, now_ms):
+        """Naujai nustato burbulą (naudojama ir telkinyje)"""
         self.x = float(x)
         self.y = float(y)
+        self.prev_x, self.prev_y = self.x, self.y
         self.vx = -BUBBLE_SPEED if facing_left else BUBBLE_SPEED
         self.vy = -0.5
-        self.born_ms = pygame.time.get_ticks()
+        self.born_ms = now_ms
         self.frame_idx = 0
         self.frame_tick = 0
-        
-        bw = burbulai_frames[0].get_width()
-        bh = burbulai_frames[0].get_height()
-        self.rect = pygame.Rect(int(x), int(y), bw, bh)
+        self.rect.topleft = (int(x), int(y))
     
     def update(self):
         """Atnaujina burbulo poziciją"""
@@ -267,32 +390,42 @@ class Bubble:
             self.frame_tick = 0
             self.frame_idx = (self.frame_idx + 1)
         
+        self.prev_x, self.prev_y = self.x, self.y
         self.x += self.vx
         self.y += self.vy
         self.rect.x = int(self.x)
         self.rect.y = int(self.y)
     
-    def is_expired(self):
+    def is_expired(self, now_ms):
         """Patikrina ar burbulas pasenęs"""
-        return pygame.time.get_ticks() - self.born_ms >= BUBBLE_LIFETIME_MS
+        return now_ms - self.born_ms >= BUBBLE_LIFETIME_MS
     
-    def draw(self, screen, burbulai_frames, uw_scroll_x):
-        """Nupiešia burbulą"""
+    def blit_args(self, burbulai_frames, uw_scroll_x, alpha=1.0):
+        """Grąžina (paveikslėlis, pozicija) piešimui"""
         img_b = burbulai_frames[self.frame_idx % len(burbulai_frames)]
-        screen.blit(img_b, (int(self.x - uw_scroll_x), int(self.y)))
+        x = lerp(self.prev_x, self.x, alpha)
+        y = lerp(self.prev_y, self.y, alpha)
+        return img_b, (int(x - uw_scroll_x), int(y))
+    
+    def draw(self, screen, burbulai_frames, uw_scroll_x, alpha=1.0):
+        """Nupiešia burbulą"""
+        screen.blit(*self.blit_args(burbulai_frames, uw_scroll_x, alpha))
 
 
 class Coin:
     """Moneta (surenkama povandeniniame žaidime)"""
     def __init__(self, x, y, coin_frames):
+        cw, ch = sprite_size(coin_frames[0])
+        self.rect = pygame.Rect(0, 0, cw, ch)
+        self.reset(x, y)
+    
+    def reset(self, x, y):
+        """Naujai nustato monetą (naudojama ir telkinyje)"""
         self.x = x
         self.y = y
         self.frame_idx = 0
         self.frame_tick = 0
-        
-        cw = coin_frames[0].get_width()
-        ch = coin_frames[0].get_height()
-        self.rect = pygame.Rect(x, y, cw, ch)
+        self.rect.topleft = (x, y)
     
     def update(self):
         """Atnaujina monetos animaciją"""
@@ -301,7 +434,14 @@ class Coin:
             self.frame_tick = 0
             self.frame_idx = (self.frame_idx + 1)
     
+    def frame(self, coin_frames):
+        """Dabartinis kadras (tinka ir kadrų kaukėms)"""
+        return coin_frames[self.frame_idx % len(coin_frames)]
+    
+    def blit_args(self, coin_frames, uw_scroll_x):
+        """Grąžina (paveikslėlis, pozicija) piešimui"""
+        return self.frame(coin_frames), (int(self.x - uw_scroll_x), int(self.y))
+    
     def draw(self, screen, coin_frames, uw_scroll_x):
         """Nupiešia monetą"""
-        coin_img = coin_frames[self.frame_idx % len(coin_frames)]
-        screen.blit(coin_img, (int(self.x - uw_scroll_x), int(self.y)))
+        screen.blit(*self.blit_args(coin_frames, uw_scroll_x))
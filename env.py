@@ -0,0 +1,261 @@
+"""
+Povandeninis žaidimas kaip mokymosi su stiprinimu aplinka (gym stiliaus reset/step)
+
+Veiksmas - bitų kaukė (ACTION_LEFT | ACTION_RIGHT | ACTION_SWIM | ACTION_CATCH |
+ACTION_BUBBLE), t.y. skaičius 0..ACTION_COUNT-1. Stebėjimas - fiksuoto ilgio
+skaičių sąrašas (NumPy float32 masyvas, jei NumPy įdiegtas): blizgės būsena ir
+artimiausios žuvys, rykliai, monetos bei platformos (koordinatės - santykinės
+su blizge, padalintos iš lango matmenų; trūkstamos vietos užpildomos nuliais).
+
+    env = UnderwaterEnv()
+    obs, info = env.reset(seed=1)
+    obs, reward, terminated, truncated, info = env.step(ACTION_RIGHT | ACTION_CATCH)
+
+VecUnderwaterEnv vykdo N nepriklausomų aplinkų keliuose procesuose; pasibaigusi
+aplinka iš karto pradedama iš naujo (galutinis stebėjimas - info['final_observation']).
+"""
+import multiprocessing
+import random
+import pygame
+from constants import *
+from headless import load_headless_assets, silent_sounds
+from inputs import KeyState
+from rng import RandomStreams, new_seed
+from timing import ManualClock
+from underwater import UnderwaterGame
+
+try:
+    import numpy as np
+except ImportError:  # NumPy neprivalomas: stebėjimai tada - sąrašai
+    np = None
+
+# --- Veiksmai (bitai) ---
+ACTION_LEFT = 1
+ACTION_RIGHT = 2
+ACTION_SWIM = 4
+ACTION_CATCH = 8
+ACTION_BUBBLE = 16
+ACTION_COUNT = 32
+
+ACTION_KEYS = ((ACTION_LEFT, pygame.K_a), (ACTION_RIGHT, pygame.K_d), (ACTION_SWIM, pygame.K_w),
+               (ACTION_CATCH, pygame.K_SPACE), (ACTION_BUBBLE, pygame.K_f))
+# Klavišų būsenos kiekvienam veiksmui (sukuriamos vieną kartą)
+ACTION_KEYSTATES = tuple(KeyState(key for bit, key in ACTION_KEYS if action & bit)
+                         for action in range(ACTION_COUNT))
+
+# --- Stebėjimo sandara: (objektų skaičius, reikšmių skaičius vienam) ---
+OBS_PLAYER_SIZE = 6    # x, y, vy, kryptis, gyvybės, nepažeidžiamumo likutis
+OBS_FISH_SIZE = 4      # yra, dx, dy, greitis
+OBS_SHARK_SIZE = 6     # yra, dx, dy, greitis, puola, sulėtintas
+OBS_COIN_SIZE = 3      # yra, dx, dy
+OBS_PLATFORM_SIZE = 5  # yra, dx, dy, plotis, aukštis
+OBSERVATION_SIZE = (OBS_PLAYER_SIZE + ENV_OBS_FISH * OBS_FISH_SIZE + ENV_OBS_SHARKS * OBS_SHARK_SIZE +
+                    ENV_OBS_COINS * OBS_COIN_SIZE + ENV_OBS_PLATFORMS * OBS_PLATFORM_SIZE)
+
+
+def nearest(objects, count, x, y):
+    """count artimiausių objektų (pagal rect centrą) iki taško"""
+    return sorted(objects, key=lambda obj: (obj.rect.centerx - x) ** 2 + (obj.rect.centery - y) ** 2)[:count]
+
+
+class UnderwaterEnv:
+    """Viena povandeninė sesija su reset(seed) ir step(action)
+    
+    Apdovanojimas: ENV_REWARD_FISH už pagautą žuvį, ENV_REWARD_COIN už monetą,
+    -ENV_PENALTY_HIT už prarastą gyvybę. Epizodas baigiasi (terminated), kai
+    pagautos visos žuvys arba baigėsi gyvybės; nutraukiamas (truncated) po
+    max_steps žingsnių. frame_skip - kiek simuliacijos žingsnių kartojamas
+    vienas veiksmas.
+    """
+    def __init__(self, assets=None, max_steps=ENV_MAX_STEPS, lives=MAX_LIVES, frame_skip=1,
+                 vectorized=False, hook=(WIDTH // 2, HEIGHT // 2 - 100)):
+        self.assets = assets if assets is not None else load_headless_assets()
+        self.max_steps = max_steps
+        self.start_lives = lives
+        self.frame_skip = frame_skip
+        self.vectorized = vectorized
+        self.hook = hook
+        self.seeds = None  # epizodų sėklų seka (nustatoma reset(seed))
+        self.game = None
+    
+    def reset(self, seed=None):
+        """Pradeda naują epizodą; grąžina (stebėjimas, info)"""
+        if seed is not None:
+            self.seeds = random.Random(seed)
+        self.seed = self.seeds.getrandbits(32) if self.seeds is not None else new_seed()
+        
+        self.clock = ManualClock()
+        self.game = UnderwaterGame(self.assets, silent_sounds(), self.clock, vectorized=self.vectorized,
+                                   rng=RandomStreams(self.seed))
+        self.game.initialize(*self.hook)
+        self.lives = self.start_lives
+        self.invuln_until = 0
+        self.coins = 0
+        self.steps = 0
+        return self.observe(), self.info()
+    
+    def step(self, action):
+        """Atlieka veiksmą; grąžina (stebėjimas, apdovanojimas, terminated, truncated, info)"""
+        game = self.game
+        keys = ACTION_KEYSTATES[action]
+        caught_before, lives_before, coins = game.caught_count, self.lives, 0
+        for _ in range(self.frame_skip):
+            game.update(keys)
+            coins += game.collect_coins()
+            self.lives, self.invuln_until, _ = game.check_shark_collision(self.lives, self.invuln_until)
+            self.clock.advance(SIM_STEP_MS)
+            self.steps += 1
+            if self.lives <= 0 or game.can_return():
+                break
+        self.coins += coins
+        
+        reward = (ENV_REWARD_FISH * (game.caught_count - caught_before) + ENV_REWARD_COIN * coins -
+                  ENV_PENALTY_HIT * (lives_before - self.lives))
+        terminated = self.lives <= 0 or game.can_return()
+        truncated = not terminated and self.steps >= self.max_steps
+        return self.observe(), reward, terminated, truncated, self.info()
+    
+    def observe(self):
+        """Stebėjimas: blizgė ir artimiausi objektai (santykinės koordinatės)"""
+        game = self.game
+        px, py = game.body.hitbox.center
+        now_ms = self.clock.now_ms()
+        obs = [px / game.level_width, py / HEIGHT, game.player_vy / 10.0, -1.0 if game.facing_left else 1.0,
+               self.lives / self.start_lives, max(0, self.invuln_until - now_ms) / INVULN_MS]
+        
+        found = nearest(game.fish, ENV_OBS_FISH, px, py)
+        for fish in found:
+            cx, cy = fish.rect.center
+            obs += (1.0, (cx - px) / WIDTH, (cy - py) / HEIGHT, fish.dx / UW_SPEED)
+        obs += [0.0] * (OBS_FISH_SIZE * (ENV_OBS_FISH - len(found)))
+        
+        found = nearest(game.sharks, ENV_OBS_SHARKS, px, py)
+        for shark in found:
+            cx, cy = shark.rect.center
+            obs += (1.0, (cx - px) / WIDTH, (cy - py) / HEIGHT, shark.dx / UW_SPEED,
+                    1.0 if shark.state == "attack" else 0.0, 1.0 if now_ms < shark.slow_until else 0.0)
+        obs += [0.0] * (OBS_SHARK_SIZE * (ENV_OBS_SHARKS - len(found)))
+        
+        found = nearest(game.coins, ENV_OBS_COINS, px, py)
+        for coin in found:
+            cx, cy = coin.rect.center
+            obs += (1.0, (cx - px) / WIDTH, (cy - py) / HEIGHT)
+        obs += [0.0] * (OBS_COIN_SIZE * (ENV_OBS_COINS - len(found)))
+        
+        found = sorted(game.platforms, key=lambda plat: abs(plat.centerx - px))[:ENV_OBS_PLATFORMS]
+        for plat in found:
+            obs += (1.0, (plat.centerx - px) / WIDTH, (plat.top - py) / HEIGHT, plat.width / WIDTH,
+                    plat.height / HEIGHT)
+        obs += [0.0] * (OBS_PLATFORM_SIZE * (ENV_OBS_PLATFORMS - len(found)))
+        
+        return np.asarray(obs, dtype=np.float32) if np is not None else obs
+    
+    def info(self):
+        """Epizodo statistika"""
+        return {
+            'seed': self.seed,
+            'steps': self.steps,
+            'caught': self.game.caught_count,
+            'coins': self.coins,
+            'lives': self.lives,
+        }
+    
+    def render(self, surface=None):
+        """Nupiešia dabartinę būseną į surface (numatyta - naujas lango dydžio Surface)"""
+        if surface is None:
+            surface = pygame.Surface((WIDTH, HEIGHT))
+        self.game.draw(surface)
+        return surface
+
+
+def _worker(conn, count, env_kwargs):
+    """Proceso darbas: laiko count aplinkų ir vykdo komandas iš conn"""
+    assets = load_headless_assets()
+    envs = [UnderwaterEnv(assets, **env_kwargs) for _ in range(count)]
+    try:
+        while True:
+            command, data = conn.recv()
+            if command == 'step':
+                results = []
+                for env, action in zip(envs, data):
+                    obs, reward, terminated, truncated, info = env.step(action)
+                    if terminated or truncated:
+                        info['final_observation'] = obs
+                        obs, _ = env.reset()
+                    results.append((obs, reward, terminated, truncated, info))
+                conn.send(results)
+            elif command == 'reset':
+                conn.send([env.reset(seed) for env, seed in zip(envs, data)])
+            else:
+                break
+    finally:
+        conn.close()
+
+
+class VecUnderwaterEnv:
+    """N nepriklausomų UnderwaterEnv, vykdomų workers procesuose
+    
+    Kiekvienas procesas laiko dalį aplinkų ir jas žingsniuoja paeiliui, todėl
+    vienas step() - vienas pranešimas kiekvienam procesui. reset(seed) i-tai
+    aplinkai duoda sėklą seed + i. Pasibaigusi aplinka iš karto pradedama iš
+    naujo. env_kwargs perduodami kiekvienai UnderwaterEnv.
+    """
+    def __init__(self, num_envs, workers=None, **env_kwargs):
+        self.num_envs = num_envs
+        workers = max(1, min(workers or multiprocessing.cpu_count(), num_envs))
+        sizes = [num_envs // workers + (1 if i < num_envs % workers else 0) for i in range(workers)]
+        
+        # spawn - vaikiniai procesai nepaveldi tėvo pygame/SDL būsenos
+        context = multiprocessing.get_context("spawn")
+        self.conns, self.processes, self.slices = [], [], []
+        start = 0
+        for size in sizes:
+            parent_conn, child_conn = context.Pipe()
+            process = context.Process(target=_worker, args=(child_conn, size, env_kwargs), daemon=True)
+            process.start()
+            child_conn.close()
+            self.conns.append(parent_conn)
+            self.processes.append(process)
+            self.slices.append(slice(start, start + size))
+            start += size
+    
+    def reset(self, seed=None):
+        """Pradeda visas aplinkas iš naujo; grąžina (stebėjimai, info sąrašas)"""
+        for conn, part in zip(self.conns, self.slices):
+            conn.send(('reset', [None if seed is None else seed + i for i in range(part.start, part.stop)]))
+        results = [result for conn in self.conns for result in conn.recv()]
+        observations, infos = zip(*results)
+        return self.stack(observations), list(infos)
+    
+    def step(self, actions):
+        """Atlieka po veiksmą kiekvienoje aplinkoje; grąžina
+        (stebėjimai, apdovanojimai, terminated, truncated, info sąrašas)"""
+        actions = [int(action) for action in actions]
+        for conn, part in zip(self.conns, self.slices):
+            conn.send(('step', actions[part]))
+        results = [result for conn in self.conns for result in conn.recv()]
+        observations, rewards, terminated, truncated, infos = zip(*results)
+        if np is not None:
+            return (self.stack(observations), np.array(rewards, dtype=np.float32),
+                    np.array(terminated), np.array(truncated), list(infos))
+        return list(observations), list(rewards), list(terminated), list(truncated), list(infos)
+    
+    def stack(self, observations):
+        return np.stack(observations) if np is not None else list(observations)
+    
+    def close(self):
+        """Sustabdo procesus"""
+        for conn in self.conns:
+            try:
+                conn.send(('close', None))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self.processes:
+            process.join(timeout=5)
+        self.conns, self.processes = [], []
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
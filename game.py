@@ -2,21 +2,29 @@
 Katinuko žvejyba - Pagrindinis žaidimo failas
 """
 import pygame
-import random
+import time
+import json
+import argparse
 from constants import *
-from assets import load_assets, load_sounds
-from entities import Player, Varna, FishingSpot
+from assets import (AssetRegistry, load_assets, load_sounds, oriented, sprite_size,
+                    STARTUP_KEYS, CASTING_KEYS, UNDERWATER_KEYS, LEVEL2_KEYS)
+from entities import Player
+from world import SurfaceWorld
 from underwater import UnderwaterGame
 from ui import UI
+from render import DirtyRectRenderer, LowResTarget
+from timing import SystemClock, ManualClock, FixedTimestep, check_time_scale, lerp
+from inputs import KeyboardInput, InputFrame
+from headless import init_headless, silent_sounds
+from rng import RandomStreams, check_seed, new_seed
+from replay import InputLogWriter, ReplayInput, check_replay_settings, log_settings, read_input_log
+from profiler import FrameProfiler, NULL_PROFILER
 
 
 def draw_bg_tiled(screen, background, bg_width, scroll_x):
     """Nupiešia kartojamą foną"""
     start_x = -(abs(int(scroll_x)) % bg_width)
-    x = start_x
-    while x < WIDTH:
-        screen.blit(background, (x, 0))
-        x += bg_width
+    screen.fblits([(background, (x, 0)) for x in range(start_x, WIDTH, bg_width)])
 
 
 def get_current_background(assets, level):
@@ -27,400 +35,625 @@ def get_current_background(assets, level):
         return assets['background'], assets['bg_width']
 
 
-def ensure_surface_spot_ahead(fishing_spots, cat_world_x, min_dx=600, max_dx=1100):
-    """Užtikrina, kad yra žvejybos vieta priekyje"""
-    for spot in fishing_spots:
-        if not spot.disabled and spot.x > cat_world_x:
-            return
+def get_hand_pos(player):
+    """Grąžina kabliuko (katinuko rankos) poziciją ekrane"""
+    HAND_REL_X_RIGHT = 0.5
+    HAND_REL_X_LEFT = 0.5
+    HAND_REL_Y = 0.5
     
-    nx = int(min(cat_world_x + random.randint(min_dx, max_dx), WORLD_WIDTH - 200))
-    ny = HEIGHT // 2 + 150
-    fishing_spots.append(FishingSpot(nx, ny))
+    if player.facing_left:
+        hand_x = player.x + int(HAND_REL_X_LEFT * FRAME_WIDTH * SCALE)
+    else:
+        hand_x = player.x + int(HAND_REL_X_RIGHT * FRAME_WIDTH * SCALE)
+    hand_y = player.y + int(HAND_REL_Y * FRAME_HEIGHT * SCALE)
+    return hand_x, hand_y
 
 
-def main():
-    """Pagrindinis žaidimo ciklas"""
-    pygame.init()
-    pygame.font.init()
-    
-    # --- Lango nustatymai ---
-    screen = pygame.display.set_mode((WIDTH, HEIGHT))
-    pygame.display.set_caption("Katinuko žvejyba")
-    clock = pygame.time.Clock()
-    
-    # --- Užkrauti išteklius ---
-    assets = load_assets()
-    sounds = load_sounds()
-    
-    # --- UI ---
-    ui = UI(assets)
-    
-    # --- Žaidėjas ---
-    player = Player(assets['frames'])
-    
-    # --- Varnos ---
-    varnas = []
-    for pos in [(300, 100), (700, 150), (1100, 80), (1600, 120)]:
-        varnas.append(Varna(pos[0], pos[1]))
-    varna_anim_frame = 0
-    
-    # --- Žvejybos taškai ---
-    fishing_spots = [FishingSpot(WIDTH // 2 - 100, HEIGHT // 2 + 150)]
-    zuvys_anim_frame = 0
-    
-    # --- Press-E animacija ---
-    press_e_anim_frame = 0.0
+class Game:
+    """Viso žaidimo būsena: paviršius, povandeninis žaidimas, meniu, game over
     
-    # --- Casting animacija ---
-    casting = False
-    uzmesti_anim_frame = 0.0
-    
-    # --- Povandeninis žaidimas ---
-    underwater_game = UnderwaterGame(assets, sounds)
-    show_dugnas = False
-    current_fishing_spot = None
-    
-    # --- Žaidėjo būsena ---
-    player_lives = 5
-    player_invuln_until = 0
-    coins_collected = 0
-    caught_count = 0
-    
-    # --- Lygių sistema ---
-    current_level = 1
-    spots_completed = 0  # Kiek telkinių sugauta šiame lygyje
-    level_transition_timer = 0  # Laikmatis lygio perėjimui
-    show_level_message = False
+    update() tik keičia būseną pagal InputFrame ir laikrodį, draw() tik piešia,
+    todėl žaidimą galima simuliuoti ir be lango. seed - žaidimo sėkla
+    (None - WORLD_SEED arba atsitiktinė): iš jos generuojamas paviršiaus
+    pasaulis ir visi atsitiktinių skaičių srautai (rng). vectorized ir
+    level_width perduodami UnderwaterGame (None - pagal konstantas).
+    """
+    def __init__(self, assets, sounds, clock=None, seed=None, vectorized=None, level_width=None):
+        self.assets = assets
+        self.sounds = sounds
+        self.clock = clock if clock is not None else SystemClock()
+        self.profiler = NULL_PROFILER
+        # Mažos raiškos pasaulio paviršius (LowResTarget, kai RENDER_SCALE > 1)
+        self.low_res = None
+        
+        # --- UI ---
+        self.ui = UI(assets)
+        
+        # --- Žaidėjas ---
+        self.player = Player(assets['frames'], assets['frames_left'])
+        
+        # --- Sėkla ir atsitiktinių skaičių srautai ---
+        if seed is None:
+            seed = WORLD_SEED if WORLD_SEED is not None else new_seed()
+        self.seed = check_seed(seed)
+        self.rng = RandomStreams(seed)
+        
+        # --- Paviršiaus pasaulis (gabalai su varnomis ir žvejybos taškais) ---
+        self.world = SurfaceWorld(seed)
+        self.varna_anim_frame = 0
+        self.zuvys_anim_frame = 0
+        self.nearest_fish = None
+        self.near_fish = False
+        
+        # --- Press-E animacija ---
+        self.press_e_anim_frame = 0.0
+        self.press_e_draw_idx = 0
+        
+        # --- Casting animacija ---
+        self.casting = False
+        self.uzmesti_anim_frame = 0.0
+        self.uzmesti_draw_idx = None
+        
+        # --- Povandeninis žaidimas ---
+        self.underwater_game = UnderwaterGame(assets, sounds, self.clock, vectorized, level_width, self.rng)
+        self.show_dugnas = False
+        self.current_fishing_spot = None
+        self.show_return_warning = False
+        
+        # --- Žaidėjo būsena ---
+        self.player_lives = 5
+        self.player_invuln_until = 0
+        self.coins_collected = 0
+        self.caught_count = 0
+        
+        # --- Lygių sistema ---
+        self.current_level = 1
+        self.spots_completed = 0  # Kiek telkinių sugauta šiame lygyje
+        self.level_transition_timer = 0  # Laikmatis lygio perėjimui
+        self.show_level_message = False
+        
+        # --- Pasaulio scrolling ---
+        self.scroll_x = 0
+        self.prev_scroll_x = 0
+        
+        # --- Meniu ---
+        self.show_menu = False
+        self.mouse_pos = (0, 0)
+        
+        # --- Game Over ---
+        self.game_over = False
+        
+        self.running = True
+        # Paleidimo laikai (užpildomi po pirmo kadro)
+        self.startup_ms = None
     
-    # --- Pasaulio scrolling ---
-    scroll_x = 0
+    def restart(self):
+        """Pradeda žaidimą iš naujo po Game Over"""
+        self.game_over = False
+        self.player_lives = 5
+        self.coins_collected = 0
+        self.caught_count = 0
+        self.current_level = 1
+        self.spots_completed = 0
+        self.show_dugnas = False
+        self.current_fishing_spot = None
+        self.world.reset(self.current_level)
+        self.reset_scroll()
+        self.ui.invalidate()
     
-    # --- Meniu ---
-    show_menu = False
+    def prefetch(self, keys):
+        """Iš anksto užkrauna išteklius fone (jei ištekliai tingūs - AssetRegistry)"""
+        prefetch = getattr(self.assets, 'prefetch', None)
+        if prefetch is not None:
+            prefetch(keys)
     
-    # --- Game Over ---
-    game_over = False
+    def reset_scroll(self):
+        """Grąžina kamerą ir žaidėją į pasaulio pradžią (be interpoliacijos)"""
+        self.scroll_x = self.prev_scroll_x = 0
+        self.player.x = self.player.prev_x = (WIDTH - FRAME_WIDTH * SCALE) // 2
     
-    # --- Pagrindinis ciklas ---
-    running = True
-    while running:
+    def update(self, frame):
+        """Atnaujina žaidimą vienu kadru pagal įvestį (InputFrame)"""
         # --- Įvykių apdorojimas ---
         e_pressed = False
-        for event in pygame.event.get():
+        click_pos = None  # kairiojo pelės mygtuko paspaudimas (ne laikymas)
+        for event in frame.events:
             if event.type == pygame.QUIT:
-                running = False
+                self.running = False
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                click_pos = event.pos
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_e:
                     e_pressed = True
                 elif event.key == pygame.K_ESCAPE:
-                    show_menu = not show_menu
+                    self.show_menu = not self.show_menu
         
-        # --- GAME OVER ---
-        if game_over:
-            screen.fill((0, 0, 0))
-            
-            # Game Over užrašas
-            game_over_font = pygame.font.SysFont('Arial', 96, bold=True)
-            go_text = game_over_font.render("ŽAIDIMAS BAIGTAS", True, (255, 50, 50))
-            go_rect = go_text.get_rect(center=(WIDTH // 2, HEIGHT // 3))
-            
-            # Šešėlis
-            shadow_text = game_over_font.render("ŽAIDIMAS BAIGTAS", True, (0, 0, 0))
-            shadow_rect = shadow_text.get_rect(center=(WIDTH // 2 + 4, HEIGHT // 3 + 4))
-            screen.blit(shadow_text, shadow_rect)
-            screen.blit(go_text, go_rect)
-            
-            # Statistika
-            stats_font = pygame.font.SysFont('Arial', 36)
-            stats_text = f"Pagauta žuvų: {caught_count}  |  Surinkta monetų: {coins_collected}  |  Lygis: {current_level}"
-            stats_surf = stats_font.render(stats_text, True, (255, 255, 255))
-            stats_rect = stats_surf.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 40))
-            screen.blit(stats_surf, stats_rect)
-            
-            # Mygtukai
-            button_font = pygame.font.SysFont('Arial', 40, bold=True)
-            
-            # "Žaisti iš naujo" mygtukas
-            restart_btn = pygame.Rect(WIDTH // 2 - 250, HEIGHT // 2 + 50, 220, 70)
-            restart_color = (50, 200, 50)
-            if restart_btn.collidepoint(pygame.mouse.get_pos()):
-                restart_color = (80, 255, 80)
-            pygame.draw.rect(screen, restart_color, restart_btn, border_radius=10)
-            pygame.draw.rect(screen, (0, 0, 0), restart_btn, 3, border_radius=10)
-            restart_text = button_font.render("Žaisti iš naujo", True, (0, 0, 0))
-            restart_text_rect = restart_text.get_rect(center=restart_btn.center)
-            screen.blit(restart_text, restart_text_rect)
-            
-            # "Išeiti" mygtukas
-            quit_btn = pygame.Rect(WIDTH // 2 + 30, HEIGHT // 2 + 50, 220, 70)
-            quit_color = (200, 50, 50)
-            if quit_btn.collidepoint(pygame.mouse.get_pos()):
-                quit_color = (255, 80, 80)
-            pygame.draw.rect(screen, quit_color, quit_btn, border_radius=10)
-            pygame.draw.rect(screen, (0, 0, 0), quit_btn, 3, border_radius=10)
-            quit_text = button_font.render("Išeiti", True, (0, 0, 0))
-            quit_text_rect = quit_text.get_rect(center=quit_btn.center)
-            screen.blit(quit_text, quit_text_rect)
-            
-            # Mygtukų logika
-            if pygame.mouse.get_pressed()[0]:
-                mx, my = pygame.mouse.get_pos()
-                if restart_btn.collidepoint(mx, my):
-                    # Reset žaidimas
-                    game_over = False
-                    player_lives = 5
-                    coins_collected = 0
-                    caught_count = 0
-                    current_level = 1
-                    spots_completed = 0
-                    show_dugnas = False
-                    current_fishing_spot = None
-                    fishing_spots.clear()
-                    fishing_spots.append(FishingSpot(WIDTH // 2 - 100, HEIGHT // 2 + 150))
-                    scroll_x = 0
-                    player.x = (WIDTH - FRAME_WIDTH * SCALE) // 2
-                    pygame.time.wait(200)  # Trumpa pauzė, kad nepaspautų du kartus
-                elif quit_btn.collidepoint(mx, my):
-                    running = False
-            
-            pygame.display.flip()
-            clock.tick(60)
-            continue
+        self.mouse_pos = frame.mouse_pos
         
-        # --- MENIU (PAUZĖ) ---
-        if show_menu:
-            screen.fill((0, 0, 0))
-            
-            if show_dugnas:
-                # Povandeninis meniu
-                buy_btn_rect = ui.draw_menu(screen, show_menu, True, player_lives, coins_collected)
+        if self.game_over:
+            self.update_game_over(click_pos)
+        elif self.show_menu:
+            self.update_menu(click_pos)
+        elif self.show_dugnas:
+            self.update_underwater(frame)
+        else:
+            self.update_surface(frame, e_pressed)
+    
+    def update_game_over(self, click_pos):
+        """Game Over mygtukų logika (click_pos - šio kadro paspaudimas arba None)"""
+        if click_pos is not None:
+            restart_btn, quit_btn = self.ui.get_game_over_buttons()
+            if restart_btn.collidepoint(click_pos):
+                # Reset žaidimas (vienas paspaudimas - vienas restart)
+                self.restart()
+            elif quit_btn.collidepoint(click_pos):
+                self.running = False
+    
+    def update_menu(self, click_pos):
+        """Meniu (pauzės) pirkimo logika: vienas paspaudimas - viena gyvybė"""
+        buy_btn_rect = self.ui.get_buy_button(self.player_lives, self.coins_collected)
+        if buy_btn_rect and click_pos is not None:
+            if buy_btn_rect.collidepoint(click_pos):
+                self.player_lives = min(self.player_lives + 1, MAX_LIVES)
+                self.coins_collected -= COST_PER_LIFE
+    
+    def update_underwater(self, frame):
+        """Atnaujina povandeninį žaidimą"""
+        keys = frame.keys
+        self.show_return_warning = False
+        
+        # Atnaujinti povandeninį žaidimą
+        self.underwater_game.update(keys)
+        
+        # Surinkti monetas
+        self.coins_collected += self.underwater_game.collect_coins()
+        
+        # Tikrinti kolizijas su rykliais
+        self.player_lives, self.player_invuln_until, hit = self.underwater_game.check_shark_collision(
+            self.player_lives, self.player_invuln_until
+        )
+        
+        if hit and self.player_lives <= 0:
+            # Žaidėjas mirė - Game Over
+            self.game_over = True
+            self.show_dugnas = False
+            self.current_fishing_spot = None
+            return
+        
+        # Grįžti į paviršių
+        if keys[pygame.K_RETURN]:
+            if not self.underwater_game.can_return():
+                self.show_return_warning = True
             else:
-                # Paviršiaus meniu - naudoti tinkamą foną pagal lygį
-                current_bg, current_bg_width = get_current_background(assets, current_level)
-                draw_bg_tiled(screen, current_bg, current_bg_width, scroll_x)
-                buy_btn_rect = ui.draw_menu(screen, show_menu, False, player_lives, coins_collected)
-            
-            # Pirkimo logika
-            if buy_btn_rect and pygame.mouse.get_pressed()[0]:
-                mx, my = pygame.mouse.get_pos()
-                if buy_btn_rect.collidepoint(mx, my):
-                    player_lives = min(player_lives + 1, MAX_LIVES)
-                    coins_collected -= COST_PER_LIFE
-            
-            pygame.display.flip()
-            clock.tick(60)
-            continue
+                self.return_to_surface()
+    
+    def return_to_surface(self):
+        """Grįžta į paviršių sugavus visas žuvis"""
+        # Pašalinti žvejybos tašką, jei visos žuvys pagautos
+        if self.current_fishing_spot is not None:
+            self.world.complete(self.current_fishing_spot)
+            self.spots_completed += 1  # Skaičiuoti užbaigtus telkinius
         
-        # --- POVANDENINIS ŽAIDIMAS ---
-        if show_dugnas:
-            keys = pygame.key.get_pressed()
-            
-            # Atnaujinti povandeninį žaidimą
-            underwater_game.update(keys)
-            
-            # Surinkti monetas
-            coins_collected += underwater_game.collect_coins()
-            
-            # Tikrinti kolizijas su rykliais
-            player_lives, player_invuln_until, hit = underwater_game.check_shark_collision(
-                player_lives, player_invuln_until
-            )
-            
-            if hit and player_lives <= 0:
-                # Žaidėjas mirė - Game Over
-                game_over = True
-                show_dugnas = False
-                current_fishing_spot = None
-            
-            # Nupiešti povandeninį žaidimą
-            underwater_game.draw(screen)
-            
-            # HUD
-            ui.draw_caught_fish(screen, underwater_game.caught_count)
-            ui.draw_coins(screen, coins_collected)
-            ui.draw_lives(screen, player_lives)
-            
-            # Grįžti į paviršių
-            if keys[pygame.K_RETURN]:
-                if not underwater_game.can_return():
-                    ui.draw_return_warning(screen)
-                else:
-                    # Pašalinti žvejybos tašką, jei visos žuvys pagautos
-                    if current_fishing_spot is not None:
-                        current_fishing_spot.disabled = True
-                        spots_completed += 1  # Skaičiuoti užbaigtus telkinius
-                    
-                    # Atnaujinti bendrą pagautų žuvų skaičių
-                    caught_count = underwater_game.caught_count
-                    
-                    # Tikrinti ar reikia pereiti į kitą lygį
-                    if spots_completed >= SPOTS_PER_LEVEL and current_level == 1:
-                        current_level = 2
-                        spots_completed = 0
-                        show_level_message = True
-                        level_transition_timer = pygame.time.get_ticks()
-                        # Reset fishing spots naujam lygiui
-                        fishing_spots.clear()
-                        fishing_spots.append(FishingSpot(WIDTH // 2 - 100, HEIGHT // 2 + 150))
-                        # Reset scroll poziciją
-                        scroll_x = 0
-                        player.x = (WIDTH - FRAME_WIDTH * SCALE) // 2
-                    
-                    show_dugnas = False
-                    current_fishing_spot = None
-            
-            pygame.display.flip()
-            clock.tick(60)
-            continue
+        # Atnaujinti bendrą pagautų žuvų skaičių
+        self.caught_count = self.underwater_game.caught_count
+        
+        # Tikrinti ar reikia pereiti į kitą lygį
+        if self.spots_completed >= SPOTS_PER_LEVEL and self.current_level == 1:
+            self.current_level = 2
+            self.spots_completed = 0
+            self.show_level_message = True
+            self.level_transition_timer = self.clock.now_ms()
+            # Naujo lygio pasaulis
+            self.world.reset(self.current_level)
+            # Reset scroll poziciją
+            self.reset_scroll()
         
-        # --- PAVIRŠIAUS ŽAIDIMAS ---
-        keys = pygame.key.get_pressed()
+        self.show_dugnas = False
+        self.current_fishing_spot = None
+        # Užbaigto telkinio press-E raginimas nebepiešiamas (iki kito paviršiaus atnaujinimo)
+        self.nearest_fish = None
+        self.near_fish = False
+    
+    def update_surface(self, frame, e_pressed):
+        """Atnaujina paviršiaus sceną"""
+        keys = frame.keys
         
         # Atnaujinti žaidėją
+        self.prev_scroll_x = self.scroll_x
         can_scroll = WORLD_WIDTH > WIDTH
-        scroll_x = player.update(keys, scroll_x, can_scroll)
+        self.scroll_x = self.player.update(keys, self.scroll_x, can_scroll)
         
         # Clamp scroll
         if can_scroll:
-            scroll_x = max(min(scroll_x, 0), -(WORLD_WIDTH - WIDTH))
+            self.scroll_x = max(min(self.scroll_x, 0), -(WORLD_WIDTH - WIDTH))
         else:
-            scroll_x = 0
+            self.scroll_x = 0
+        
+        # Užkrauti gabalus aplink matomą sritį (tolimi pašalinami)
+        self.world.stream(-self.scroll_x)
         
         # Atnaujinti varnas
-        for varna in varnas:
+        for varna in self.world.varnas:
             varna.update()
         
         # Animacijų atnaujinimas
-        varna_anim_frame = (varna_anim_frame + 0.1) % VARNA_NUM_FRAMES
-        zuvys_anim_frame = (zuvys_anim_frame + 0.03) % ZUVYS_NUM_FRAMES
-        
-        # Užtikrinti žvejybos vietą priekyje
-        cat_world_x = player.get_world_x(scroll_x)
-        ensure_surface_spot_ahead(fishing_spots, cat_world_x)
+        self.varna_anim_frame = (self.varna_anim_frame + 0.1) % VARNA_NUM_FRAMES
+        self.zuvys_anim_frame = (self.zuvys_anim_frame + 0.03) % ZUVYS_NUM_FRAMES
         
         # Rasti artimiausią žvejybos tašką
-        cat_center_x, cat_center_y = player.get_center(scroll_x)
-        nearest_fish = None
-        nearest_dist = 99999
+        cat_center_x, cat_center_y = self.player.get_center(self.scroll_x)
+        was_near = self.near_fish
+        self.nearest_fish = self.world.nearest_spot(cat_center_x, cat_center_y, PROXIMITY_THRESHOLD)
+        self.near_fish = self.nearest_fish is not None
+        if self.near_fish and not was_near:
+            self.prefetch(CASTING_KEYS)
         
-        for spot in fishing_spots:
-            if spot.disabled:
-                continue
+        # Pradėti žvejybą
+        if e_pressed and self.near_fish and not self.casting:
+            self.casting = True
+            self.uzmesti_anim_frame = 0.0
             
-            fish_center_x, fish_center_y = spot.get_center()
-            dist = ((cat_center_x - fish_center_x)**2 + (cat_center_y - fish_center_y)**2)**0.5
+            # Kol rodoma užmetimo animacija, povandeniniai ištekliai kraunami fone
+            self.prefetch(UNDERWATER_KEYS)
+            if self.current_level == 1 and self.spots_completed + 1 >= SPOTS_PER_LEVEL:
+                self.prefetch(LEVEL2_KEYS)
+        
+        # Lygio pranešimas rodomas LEVEL_BANNER_MS žaidimo laiko
+        if self.show_level_message:
+            if self.clock.now_ms() - self.level_transition_timer >= LEVEL_BANNER_MS:
+                self.show_level_message = False
+        
+        # Press-E animacija
+        if self.near_fish and not self.casting and self.assets['press_e_frames']:
+            self.press_e_draw_idx = int(self.press_e_anim_frame) % len(self.assets['press_e_frames'])
+            self.press_e_anim_frame = (self.press_e_anim_frame + 0.15) % len(self.assets['press_e_frames'])
+        
+        # Casting animacija
+        self.uzmesti_draw_idx = None
+        if self.casting and self.assets['uzmesti_frames']:
+            idx = int(self.uzmesti_anim_frame)
             
-            if dist < nearest_dist:
-                nearest_dist = dist
-                nearest_fish = spot
+            if idx >= len(self.assets['uzmesti_frames']):
+                # Užbaigta - pradėti povandeninį žaidimą
+                self.casting = False
+                self.uzmesti_anim_frame = 0.0
+                
+                # Inicializuoti povandeninį žaidimą ties kabliuku
+                hand_x, hand_y = get_hand_pos(self.player)
+                self.current_fishing_spot = self.nearest_fish
+                self.underwater_game.initialize(hand_x, hand_y)
+                self.show_dugnas = True
+            else:
+                self.uzmesti_draw_idx = idx
+                self.uzmesti_anim_frame += 0.4
+    
+    def is_on_surface(self):
+        """Ar šiuo metu rodoma paviršiaus scena"""
+        return not (self.game_over or self.show_menu or self.show_dugnas)
+    
+    def draw(self, screen, dirty_renderer=None, alpha=1.0):
+        """Nupiešia dabartinę sceną (alpha - interpoliacija tarp simuliacijos žingsnių)"""
+        # Kitos scenos piešia visą ekraną - grįžus į paviršių perpiešti viską
+        if dirty_renderer is not None and (self.game_over or self.show_menu or self.show_dugnas):
+            dirty_renderer.invalidate()
         
-        near_fish = (nearest_dist <= PROXIMITY_THRESHOLD)
+        if self.game_over:
+            screen.fill((0, 0, 0))
+            self.ui.draw_game_over(
+                screen, self.caught_count, self.coins_collected, self.current_level, self.mouse_pos
+            )
+        elif self.show_menu:
+            self.draw_menu(screen)
+        elif self.show_dugnas:
+            self.draw_underwater(screen, alpha)
+        else:
+            self.draw_surface(screen, dirty_renderer, alpha)
+    
+    def draw_menu(self, screen):
+        """Nupiešia pauzės meniu"""
+        if self.show_dugnas:
+            # Povandeninis meniu
+            self.ui.draw_pause_screen(screen, True, self.player_lives, self.coins_collected)
+        else:
+            # Paviršiaus meniu - naudoti tinkamą foną pagal lygį
+            current_bg, current_bg_width = get_current_background(self.assets, self.current_level)
+            self.ui.draw_pause_screen(
+                screen, False, self.player_lives, self.coins_collected,
+                lambda layer: self.draw_world(
+                    layer, lambda world: draw_bg_tiled(world, current_bg, current_bg_width, self.scroll_x)),
+                bg_key=(self.current_level, self.scroll_x)
+            )
+    
+    def draw_world(self, screen, draw):
+        """draw(world) piešia pasaulį; mažos raiškos paviršius po to padidinamas į screen"""
+        if self.low_res is None:
+            draw(screen)
+        else:
+            draw(self.low_res)
+            self.low_res.present(screen)
+    
+    def draw_underwater(self, screen, alpha=1.0):
+        """Nupiešia povandeninį žaidimą ir HUD"""
+        with self.profiler.section('draw'):
+            self.draw_world(screen, lambda world: self.underwater_game.draw(world, alpha))
         
-        # Pradėti žvejybą
-        if e_pressed and near_fish and not casting:
-            casting = True
-            uzmesti_anim_frame = 0.0
+        # HUD
+        with self.profiler.section('hud'):
+            self.ui.draw_caught_fish(screen, self.underwater_game.caught_count)
+            self.ui.draw_coins(screen, self.coins_collected)
+            self.ui.draw_lives(screen, self.player_lives)
+            
+            if self.show_return_warning:
+                self.ui.draw_return_warning(screen)
+    
+    def draw_surface(self, screen, dirty_renderer=None, alpha=1.0):
+        """Nupiešia paviršiaus sceną"""
+        scroll_x = int(lerp(self.prev_scroll_x, self.scroll_x, alpha))
+        current_bg, current_bg_width = get_current_background(self.assets, self.current_level)
+        if dirty_renderer is not None:
+            # Objektai tik įsimenami, fonas piešiamas present() metu
+            target = dirty_renderer
+        else:
+            target = screen
         
-        # --- PIEŠIMAS ---
-        screen.fill((0, 0, 0))
+        with self.profiler.section('draw'):
+            if dirty_renderer is None:
+                def draw(world):
+                    world.fill((0, 0, 0))
+                    
+                    # Nupiešti tinkamą foną pagal lygį
+                    draw_bg_tiled(world, current_bg, current_bg_width, scroll_x)
+                    self.draw_surface_world(world, scroll_x, alpha)
+                self.draw_world(screen, draw)
+            else:
+                self.draw_surface_world(target, scroll_x, alpha)
         
-        # Nupiešti tinkamą foną pagal lygį
-        current_bg, current_bg_width = get_current_background(assets, current_level)
-        draw_bg_tiled(screen, current_bg, current_bg_width, scroll_x)
+        with self.profiler.section('hud'):
+            self.draw_surface_hud(target, scroll_x)
         
-        # Piešti varnas
-        for varna in varnas:
-            varna_frame = assets['varna_frames'][int(varna_anim_frame)]
-            varna.draw(screen, varna_frame, scroll_x)
+        if dirty_renderer is not None:
+            with self.profiler.section('flip'):
+                dirty_renderer.present(
+                    lambda surf: draw_bg_tiled(surf, current_bg, current_bg_width, scroll_x),
+                    (self.current_level, scroll_x)
+                )
+    
+    def draw_surface_world(self, target, scroll_x, alpha=1.0):
+        """Nupiešia paviršiaus objektus (varnas, telkinius, žaidėją, užmetimą)"""
+        # Piešti varnas (vienas fblits sluoksniui)
+        varna_frame = self.assets['varna_frames'][int(self.varna_anim_frame)]
+        target.fblits([varna.blit_args(varna_frame, scroll_x, alpha) for varna in self.world.varnas])
         
         # Piešti žvejybos taškus
-        for spot in fishing_spots:
-            zuvys_frame = assets['zuvys_frames'][int(zuvys_anim_frame)]
-            spot.draw(screen, zuvys_frame, scroll_x)
+        zuvys_frame = self.assets['zuvys_frames'][int(self.zuvys_anim_frame)]
+        target.fblits([spot.blit_args(zuvys_frame, scroll_x) for spot in self.world.visible_spots(-scroll_x)])
         
         # Piešti žaidėją (išskyrus žvejojant)
-        if not casting:
-            player.draw(screen)
+        if not self.casting:
+            self.player.draw(target, alpha)
         
-        # HUD
-        ui.draw_caught_fish(screen, caught_count)
-        ui.draw_coins(screen, coins_collected)
-        ui.draw_lives(screen, player_lives)
+        # Casting animacija
+        if self.casting and self.uzmesti_draw_idx is not None:
+            uz_frame = oriented(self.assets, 'uzmesti_frames', self.player.facing_left)[self.uzmesti_draw_idx]
+            hand_x, hand_y = get_hand_pos(self.player)
+            uz_w, uz_h = sprite_size(uz_frame)
+            cast_x = hand_x - uz_w // 2
+            cast_y = hand_y - uz_h // 2
+            target.blit(uz_frame, (int(cast_x), int(cast_y)))
+    
+    def draw_surface_hud(self, target, scroll_x):
+        """Nupiešia paviršiaus HUD ir užrašus"""
+        self.ui.draw_caught_fish(target, self.caught_count)
+        self.ui.draw_coins(target, self.coins_collected)
+        self.ui.draw_lives(target, self.player_lives)
         
         # Lygio pranešimas
-        if show_level_message:
-            elapsed = pygame.time.get_ticks() - level_transition_timer
-            if elapsed < 3000:  # Rodyti 3 sekundes
-                level_font = pygame.font.SysFont('Arial', 72, bold=True)
-                level_text = level_font.render(f"LYGIS {current_level}!", True, (255, 255, 0))
-                level_rect = level_text.get_rect(center=(WIDTH // 2, HEIGHT // 2))
-                
-                # Šešėlis
-                shadow_text = level_font.render(f"LYGIS {current_level}!", True, (0, 0, 0))
-                shadow_rect = shadow_text.get_rect(center=(WIDTH // 2 + 4, HEIGHT // 2 + 4))
-                screen.blit(shadow_text, shadow_rect)
-                screen.blit(level_text, level_rect)
-            else:
-                show_level_message = False
+        if self.show_level_message:
+            self.ui.draw_level_banner(target, self.current_level)
         
         # Press-E užrašas
-        if near_fish and not casting and assets['press_e_frames']:
-            press_frame = assets['press_e_frames'][int(press_e_anim_frame) % len(assets['press_e_frames'])]
-            ui.draw_press_e_prompt(screen, (nearest_fish.x, nearest_fish.y), scroll_x, press_frame)
-            press_e_anim_frame = (press_e_anim_frame + 0.15) % len(assets['press_e_frames'])
+        if self.near_fish and not self.casting and self.assets['press_e_frames']:
+            press_frame = self.assets['press_e_frames'][self.press_e_draw_idx]
+            self.ui.draw_press_e_prompt(target, (self.nearest_fish.x, self.nearest_fish.y),
+                                        scroll_x, press_frame)
+
+
+def startup_timings(assets, startup_start):
+    """Paleidimo laikai: iki pirmo kadro ir išteklių krovimas pagrindinėje gijoje"""
+    load_ms = getattr(assets, 'load_ms', {})
+    return {
+        'first_frame_ms': (time.perf_counter() - startup_start) * 1000.0,
+        'lazy_assets': isinstance(assets, AssetRegistry),
+        'assets_loaded': len(load_ms) if load_ms else len(assets),
+        'assets_main_thread_ms': sum(load_ms.values()),
+        'slowest_assets': sorted(load_ms.items(), key=lambda kv: -kv[1])[:5],
+    }
+
+
+def load_with_progress(screen, ui, assets, keys):
+    """Užkrauna išteklius rodydamas progreso juostą"""
+    assets.prefetch(keys)
+    for n, key in enumerate(keys):
+        ui.draw_loading_screen(screen, n / len(keys))
+        pygame.display.flip()
+        pygame.event.pump()
+        assets[key]
+    ui.draw_loading_screen(screen, 1.0)
+    pygame.display.flip()
+
+
+def main(headless=False, input_source=None, clock=None, max_frames=None, render=True,
+         startup_report=False, seed=None, record_path=None, replay_path=None, time_scale=TIME_SCALE):
+    """Pagrindinis žaidimo ciklas
+    
+    Simuliacija vyksta fiksuotu SIM_HZ žingsniu, piešiama iki MAX_RENDER_FPS
+    su interpoliacija tarp žingsnių. headless=True - be lango (SDL dummy
+    tvarkyklės), vienas žingsnis per ciklą, piešiama į atskirą Surface (arba
+    visai nepiešiama, kai render=False); įvestis ir laikrodis gali būti
+    pakeisti (pvz. ScriptedInput ir ManualClock). startup_report=True -
+    po pirmo kadro išveda paleidimo laikus (JSON). record_path - įrašyti
+    sėklą ir kiekvieno kadro įvestį į žurnalą; replay_path - atkurti žurnalą
+    (įvestis, sėkla ir žingsnių skaičius kadre imami iš jo). time_scale -
+    žaidimo laiko greitis su langu (0 - be ribų: žingsnis per ciklą be
+    laukimo); kai jis ne 1, kadrai piešiami ne dažniau nei
+    FAST_FORWARD_RENDER_FPS. Visi laikmačiai skaičiuojami žaidimo laikrodžiu,
+    todėl pagreitinus elgsena nesikeičia.
+    """
+    startup_start = time.perf_counter()
+    if headless:
+        init_headless()
+        screen = pygame.Surface((WIDTH, HEIGHT))
+    else:
+        pygame.init()
+        pygame.font.init()
         
-        # Casting animacija
-        if casting and assets['uzmesti_frames']:
-            idx = int(uzmesti_anim_frame)
-            
-            if idx >= len(assets['uzmesti_frames']):
-                # Užbaigta - pradėti povandeninį žaidimą
-                casting = False
-                uzmesti_anim_frame = 0.0
-                
-                # Kabliuko pozicija
-                HAND_REL_X_RIGHT = 0.5
-                HAND_REL_X_LEFT = 0.5
-                HAND_REL_Y = 0.5
-                
-                if player.facing_left:
-                    hand_x = player.x + int(HAND_REL_X_LEFT * FRAME_WIDTH * SCALE)
-                else:
-                    hand_x = player.x + int(HAND_REL_X_RIGHT * FRAME_WIDTH * SCALE)
-                hand_y = player.y + int(HAND_REL_Y * FRAME_HEIGHT * SCALE)
-                
-                # Inicializuoti povandeninį žaidimą
-                current_fishing_spot = nearest_fish
-                underwater_game.initialize(hand_x, hand_y)
-                show_dugnas = True
+        # --- Lango nustatymai ---
+        screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        pygame.display.set_caption("Katinuko žvejyba")
+    fps_clock = pygame.time.Clock()
+    
+    # --- Ištekliai (tingūs: kraunami pirmą kartą prireikus) ---
+    assets = AssetRegistry() if LAZY_ASSETS else load_assets()
+    sounds = silent_sounds() if headless else load_sounds()
+    
+    # Žaidimo laikas = simuliacijos laikas (stumiamas kiekvienu žingsniu)
+    if clock is None:
+        clock = ManualClock()
+    # --- Įvesties žurnalas (atkūrimas arba įrašymas) ---
+    replay = None
+    vectorized = level_width = None
+    if replay_path is not None:
+        seed, settings, replay_frames = read_input_log(replay_path)
+        check_replay_settings(settings)
+        vectorized, level_width = settings['vectorized'], WIDTH * settings['screens']
+        input_source = replay = ReplayInput(replay_frames)
+    if input_source is None:
+        input_source = KeyboardInput()
+    
+    game = Game(assets, sounds, clock, seed, vectorized, level_width)
+    recorder = None
+    if record_path is not None:
+        underwater_game = game.underwater_game
+        recorder = InputLogWriter(record_path, game.seed,
+                                  log_settings(underwater_game.vector is not None, underwater_game.level_width))
+    if LAZY_ASSETS and not headless:
+        load_with_progress(screen, game.ui, assets, STARTUP_KEYS)
+    timestep = FixedTimestep(scale=time_scale or 1.0)
+    fast_forward = time_scale != 1 and not headless
+    render_interval = 1.0 / FAST_FORWARD_RENDER_FPS
+    last_render = None
+    
+    # --- Profiliuotojas (F3) ---
+    profiler = FrameProfiler(enabled=PROFILE_ENABLED or PROFILE_OUTPUT is not None,
+                             output_path=PROFILE_OUTPUT)
+    game.profiler = profiler
+    game.underwater_game.profiler = profiler
+    
+    # --- Mažos raiškos pasaulis arba pasikeitusių sričių piešimas (pasirinktinai) ---
+    # Kai kadras kaskart padidinamas, pasikeitusių sričių sekimas nieko nesutaupo
+    if RENDER_SCALE > 1:
+        game.low_res = LowResTarget(screen)
+    dirty_renderer = DirtyRectRenderer(screen) if DIRTY_RECTS and RENDER_SCALE == 1 and not headless else None
+    
+    # --- Pagrindinis ciklas ---
+    frames = 0
+    pending_events = []
+    try:
+        while game.running:
+            if headless:
+                steps = 1
+            elif time_scale == 0:
+                fps_clock.tick()
+                steps = 1
             else:
-                # Piešti casting animaciją
-                uz_frame = assets['uzmesti_frames'][idx]
-                
-                if player.facing_left:
-                    uz_frame = pygame.transform.flip(uz_frame, True, False)
-                
-                HAND_REL_X_RIGHT = 0.5
-                HAND_REL_X_LEFT = 0.5
-                HAND_REL_Y = 0.5
-                
-                if player.facing_left:
-                    hand_x = player.x + int(HAND_REL_X_LEFT * FRAME_WIDTH * SCALE)
+                steps = timestep.advance(fps_clock.tick(MAX_RENDER_FPS))
+            frame_start = time.perf_counter()
+            
+            with profiler.section('events'):
+                frame = input_source.poll()
+            if replay is not None:
+                steps = replay.steps
+            if recorder is not None:
+                recorder.write(steps, frame)
+            for event in frame.events:
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    profiler.toggle()
+                    if dirty_renderer is not None:
+                        dirty_renderer.invalidate()
+            
+            # Įvykiai perduodami pirmam žingsniui (arba laukia, jei šį kadrą žingsnių nėra)
+            pending_events.extend(frame.events)
+            with profiler.section('update'):
+                for _ in range(steps):
+                    game.update(InputFrame(pending_events, frame.keys, frame.mouse_pos, frame.mouse_buttons))
+                    pending_events = []
+                    clock.advance(SIM_STEP_MS)
+                    if not game.running:
+                        break
+            
+            # Pagreitintame režime dalis kadrų nepiešiama
+            draw_frame = render
+            if render and fast_forward:
+                if last_render is not None and frame_start - last_render < render_interval:
+                    draw_frame = False
                 else:
-                    hand_x = player.x + int(HAND_REL_X_RIGHT * FRAME_WIDTH * SCALE)
-                hand_y = player.y + int(HAND_REL_Y * FRAME_HEIGHT * SCALE)
-                
-                cast_x = hand_x - uz_frame.get_width() // 2
-                cast_y = hand_y - uz_frame.get_height() // 2
-                
-                screen.blit(uz_frame, (int(cast_x), int(cast_y)))
-                uzmesti_anim_frame += 0.4
-        
-        pygame.display.flip()
-        clock.tick(60)
+                    last_render = frame_start
+            
+            if draw_frame:
+                alpha = 1.0 if headless or time_scale == 0 else timestep.alpha
+                game.draw(screen, dirty_renderer, alpha)
+                overlay_rect = profiler.draw_overlay(screen)
+                if not headless:
+                    with profiler.section('flip'):
+                        if dirty_renderer is None or not game.is_on_surface():
+                            pygame.display.flip()
+                        elif overlay_rect is not None:
+                            pygame.display.update(overlay_rect)
+            
+            profiler.add('frame', (time.perf_counter() - frame_start) * 1000.0)
+            profiler.end_frame()
+            
+            frames += 1
+            if frames == 1:
+                game.startup_ms = startup_timings(assets, startup_start)
+                if startup_report:
+                    print(json.dumps(game.startup_ms))
+            if max_frames is not None and frames >= max_frames:
+                break
+    finally:
+        # Žurnalas uždaromas ir po klaidos, kad ją būtų galima atkurti
+        if recorder is not None:
+            recorder.close()
+        # Nepradėti fono krovimai atšaukiami (išeinant nelaukiama prefetch pabaigos)
+        close_assets = getattr(assets, 'close', None)
+        if close_assets is not None:
+            close_assets()
     
-    pygame.quit()
+    profiler.close()
+    if not headless:
+        pygame.quit()
+    return game
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Katinuko žvejyba")
+    parser.add_argument("--headless", action="store_true", help="paleisti be lango (SDL dummy)")
+    parser.add_argument("--frames", type=int, default=None, help="kiek kadrų simuliuoti")
+    parser.add_argument("--startup-report", action="store_true", help="išvesti paleidimo laikus (JSON)")
+    parser.add_argument("--seed", type=int, default=None, help="žaidimo sėkla (numatyta - atsitiktinė)")
+    parser.add_argument("--record", metavar="FAILAS", help="įrašyti įvestį į žurnalą")
+    parser.add_argument("--replay", metavar="FAILAS", help="atkurti įrašytą žurnalą")
+    parser.add_argument("--speed", type=float, default=TIME_SCALE,
+                        help="žaidimo laiko greitis (pvz. 10; 0 - kiek leidžia kompiuteris)")
+    args = parser.parse_args()
+    if args.seed is not None:
+        try:
+            check_seed(args.seed)
+        except ValueError as e:
+            parser.error(str(e))
+    try:
+        check_time_scale(args.speed)
+    except ValueError as e:
+        parser.error(str(e))
+    main(headless=args.headless, max_frames=args.frames, startup_report=args.startup_report,
+         seed=args.seed, record_path=args.record, replay_path=args.replay, time_scale=args.speed)
@@ -0,0 +1,73 @@
+"""
+Headless režimas: žaidimo simuliacija be lango ir garso (balansavimui, testams)
+"""
+import os
+import pygame
+from constants import *
+from assets import load_assets
+from underwater import UnderwaterGame
+from timing import ManualClock
+
+
+def init_headless():
+    """Inicializuoja pygame su SDL dummy tvarkyklėmis (be lango ir garso)"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    pygame.font.init()
+    # convert()/convert_alpha() reikalauja ekrano režimo
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((1, 1))
+
+
+def silent_sounds():
+    """Garsų žodynas be garsų (UnderwaterGame tikrina None)"""
+    return {'hurt_sound': None, 'reelin_sound': None, 'coin_sound': None}
+
+
+def run_underwater_session(assets, input_source, clock=None, max_steps=3600,
+                           player_lives=5, hook=(WIDTH // 2, HEIGHT // 2 - 100),
+                           render_to=None):
+    """Simuliuoja vieną povandeninę sesiją, grąžina jos statistiką
+    
+    input_source - objektas su poll() (pvz. ScriptedInput), render_to - Surface,
+    į kurį piešiama kiekvienas kadras (None - nepiešti).
+    """
+    clock = clock if clock is not None else ManualClock()
+    game = UnderwaterGame(assets, silent_sounds(), clock)
+    game.initialize(*hook)
+    
+    player_invuln_until = 0
+    coins_collected = 0
+    hits = 0
+    steps = 0
+    while steps < max_steps:
+        frame = input_source.poll()
+        game.update(frame.keys)
+        coins_collected += game.collect_coins()
+        player_lives, player_invuln_until, hit = game.check_shark_collision(
+            player_lives, player_invuln_until
+        )
+        if render_to is not None:
+            game.draw(render_to)
+        
+        clock.advance(SIM_STEP_MS)
+        steps += 1
+        hits += hit
+        if player_lives <= 0 or game.can_return():
+            break
+    
+    return {
+        'steps': steps,
+        'caught': game.caught_count,
+        'coins': coins_collected,
+        'hits': hits,
+        'lives': player_lives,
+        'completed': game.can_return(),
+    }
+
+
+def load_headless_assets():
+    """Inicializuoja headless režimą ir užkrauna išteklius"""
+    init_headless()
+    return load_assets()
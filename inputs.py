@@ -0,0 +1,54 @@
+"""
+Įvesties šaltiniai (klaviatūra/pelė arba iš anksto paruoštas scenarijus)
+"""
+import pygame
+
+
+class KeyState:
+    """Nuspaustų klavišų rinkinys, naudojamas kaip pygame.key.get_pressed()"""
+    def __init__(self, pressed=()):
+        self.pressed = frozenset(pressed)
+    
+    def __getitem__(self, key):
+        return key in self.pressed
+
+
+class InputFrame:
+    """Vieno kadro įvestis: įvykiai, klavišų būsena ir pelė"""
+    def __init__(self, events=(), keys=None, mouse_pos=(0, 0), mouse_buttons=(False, False, False)):
+        self.events = list(events)
+        self.keys = keys if keys is not None else KeyState()
+        self.mouse_pos = mouse_pos
+        self.mouse_buttons = mouse_buttons
+
+
+class KeyboardInput:
+    """Tikra įvestis iš pygame (klaviatūra, pelė, lango įvykiai)"""
+    def poll(self):
+        """Grąžina šio kadro InputFrame"""
+        return InputFrame(
+            pygame.event.get(),
+            pygame.key.get_pressed(),
+            pygame.mouse.get_pos(),
+            pygame.mouse.get_pressed(),
+        )
+
+
+class ScriptedInput:
+    """Scenarijaus įvestis: script(kadro_nr) grąžina InputFrame arba nuspaustų klavišų rinkinį
+    
+    Kai scenarijus baigiasi (grąžina None), siunčiamas pygame.QUIT.
+    """
+    def __init__(self, script):
+        self.script = script
+        self.frame_no = 0
+    
+    def poll(self):
+        """Grąžina šio kadro InputFrame"""
+        frame = self.script(self.frame_no)
+        self.frame_no += 1
+        if frame is None:
+            return InputFrame([pygame.event.Event(pygame.QUIT)])
+        if isinstance(frame, InputFrame):
+            return frame
+        return InputFrame(keys=KeyState(frame))
@@ -0,0 +1,58 @@
+"""
+Objektų telkiniai (pooling) dažnai kuriamiems žaidimo objektams
+"""
+
+
+class ObjectPool:
+    """Iš anksto sukurtų objektų telkinys su O(1) pašalinimu (swap-remove)
+    
+    active - naudojamų objektų sąrašas (tvarka nefiksuota: pašalinant objektą
+    jo vietą užima paskutinis). factory(*args) sukuria naują objektą, o
+    pakartotinai naudojamas objektas nustatomas reset(*args). Telkinys
+    objektams priskiria pool_index - vietą active sąraše.
+    """
+    def __init__(self, factory):
+        self.factory = factory
+        self.active = []
+        self.free = []
+    
+    def __len__(self):
+        return len(self.active)
+    
+    def __iter__(self):
+        return iter(self.active)
+    
+    def reserve(self, n, *args):
+        """Iš anksto sukuria n laisvų objektų"""
+        for _ in range(n):
+            obj = self.factory(*args)
+            obj.pool_index = -1
+            self.free.append(obj)
+    
+    def spawn(self, *args):
+        """Paima laisvą objektą (arba sukuria naują) ir įdeda į active"""
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args)
+        else:
+            obj = self.factory(*args)
+        obj.pool_index = len(self.active)
+        self.active.append(obj)
+        return obj
+    
+    def release(self, obj):
+        """Grąžina objektą į telkinį; jo vietą active sąraše užima paskutinis"""
+        index = obj.pool_index
+        last = self.active.pop()
+        if last is not obj:
+            self.active[index] = last
+            last.pool_index = index
+        obj.pool_index = -1
+        self.free.append(obj)
+    
+    def clear(self):
+        """Grąžina visus naudojamus objektus į telkinį"""
+        for obj in self.active:
+            obj.pool_index = -1
+        self.free.extend(self.active)
+        self.active.clear()
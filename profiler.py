@@ -0,0 +1,167 @@
+"""
+Kadro profiliuotojas: fazių laikai, p50/p95/p99 perdanga ir įrašymas į failą
+"""
+import json
+import time
+import pygame
+from collections import deque
+from constants import *
+
+
+# Fazės, rodomos perdangoje ir rašomos į CSV (tokia tvarka)
+PHASES = ('frame', 'events', 'update', 'update_player', 'update_fish', 'update_sharks',
+          'update_bubbles', 'draw', 'hud', 'flip')
+
+
+class _Section:
+    """Vienos fazės laiko matavimas (with blokas)"""
+    __slots__ = ('profiler', 'name', 'start')
+    
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+    
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.add(self.name, (time.perf_counter() - self.start) * 1000.0)
+        return False
+
+
+class _NullSection:
+    """Išjungto profiliuotojo fazė - nieko nematuoja"""
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SECTION = _NullSection()
+
+
+class FrameProfiler:
+    """Matuoja kiekvienos kadro fazės laiką (ms), skaičiuoja slenkančius procentilius
+    
+    Fazės laikai per kadrą sumuojami (pvz. kelių simuliacijos žingsnių update).
+    """
+    def __init__(self, enabled=False, output_path=None, window=PROFILE_WINDOW):
+        self.enabled = enabled
+        self.overlay_visible = enabled
+        self.window = window
+        self.samples = {}
+        self.current = {}
+        self.frame_no = 0
+        self.font = None
+        self.line_surfs = {}  # (eilutė, spalva) -> Surface; perpiešiamos tik pasikeitusios eilutės
+        
+        self.output = None
+        self.output_csv = False
+        if output_path:
+            self.open_output(output_path)
+    
+    def open_output(self, path):
+        """Pradeda rašyti kadrų laikus į CSV arba JSONL failą (pagal plėtinį)"""
+        self.output = open(path, "w", encoding="utf-8")
+        self.output_csv = path.lower().endswith(".csv")
+        if self.output_csv:
+            self.output.write(",".join(("frame_no",) + PHASES) + "\n")
+    
+    def close(self):
+        """Uždaro išvesties failą"""
+        if self.output is not None:
+            self.output.close()
+            self.output = None
+    
+    def toggle(self):
+        """Įjungia/išjungia matavimą ir perdangą"""
+        self.enabled = not self.enabled
+        self.overlay_visible = self.enabled
+    
+    def section(self, name):
+        """Grąžina with bloką fazės laikui matuoti"""
+        if not self.enabled:
+            return _NULL_SECTION
+        return _Section(self, name)
+    
+    def add(self, name, ms):
+        """Prideda fazės laiką prie dabartinio kadro"""
+        self.current[name] = self.current.get(name, 0.0) + ms
+    
+    def end_frame(self):
+        """Užbaigia kadrą: įsimena laikus ir įrašo juos į failą"""
+        if not self.enabled:
+            return
+        
+        for name, ms in self.current.items():
+            samples = self.samples.get(name)
+            if samples is None:
+                samples = self.samples[name] = deque(maxlen=self.window)
+            samples.append(ms)
+        
+        if self.output is not None:
+            if self.output_csv:
+                row = [str(self.frame_no)] + ["%.3f" % self.current.get(name, 0.0) for name in PHASES]
+                self.output.write(",".join(row) + "\n")
+            else:
+                record = {'frame_no': self.frame_no,
+                          'ms': {name: round(ms, 3) for name, ms in self.current.items()}}
+                self.output.write(json.dumps(record) + "\n")
+        
+        self.current = {}
+        self.frame_no += 1
+    
+    def percentiles(self, name):
+        """Grąžina (p50, p95, p99) fazės laikams slenkančiame lange"""
+        samples = self.samples.get(name)
+        if not samples:
+            return 0.0, 0.0, 0.0
+        ordered = sorted(samples)
+        last = len(ordered) - 1
+        return tuple(ordered[min(last, int(round(q * last)))] for q in (0.5, 0.95, 0.99))
+    
+    def draw_overlay(self, screen):
+        """Nupiešia fazių p50/p95/p99 lentelę viršutiniame kairiajame kampe"""
+        if not self.overlay_visible:
+            return None
+        if self.font is None:
+            self.font = pygame.font.SysFont('Consolas', 16)
+        
+        lines = ["%-15s %6s %6s %6s" % ("ms", "p50", "p95", "p99")]
+        for name in PHASES:
+            if name in self.samples:
+                lines.append("%-15s %6.2f %6.2f %6.2f" % ((name,) + self.percentiles(name)))
+        
+        # Antraštė raudona, kai p95 kadro laikas viršija žingsnio biudžetą
+        budget_bad = self.percentiles('frame')[1] > SIM_STEP_MS
+        keys = [(line, (255, 90, 90) if i == 0 and budget_bad else (255, 255, 255))
+                for i, line in enumerate(lines)]
+        
+        # Atvaizduojamos tik pasikeitusios eilutės (kitos - iš praeito kadro)
+        previous, self.line_surfs = self.line_surfs, {}
+        for key in keys:
+            surf = previous.get(key)
+            if surf is None:
+                surf = self.font.render(key[0], True, key[1])
+            self.line_surfs[key] = surf
+        surfs = [self.line_surfs[key] for key in keys]
+        
+        line_h = self.font.get_linesize()
+        width = max(surf.get_width() for surf in surfs) + 16
+        panel = pygame.Rect(WIDTH - width - 10, HEIGHT - len(surfs) * line_h - 18, width, len(surfs) * line_h + 8)
+        
+        screen.fill((0, 0, 0), panel)
+        y = panel.y + 4
+        for surf in surfs:
+            screen.blit(surf, (panel.x + 8, y))
+            y += line_h
+        return panel
+
+
+# Bendras išjungtas profiliuotojas (naudojamas, kai profiliavimas nereikalingas)
+NULL_PROFILER = FrameProfiler(enabled=False)
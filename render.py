@@ -0,0 +1,114 @@
+"""
+Piešimo pagalbinės priemonės (pasikeitusių sričių atnaujinimas, mažos raiškos pasaulis)
+"""
+import pygame
+from constants import *
+
+
+class DirtyRectRenderer:
+    """Paviršiaus scenos piešimas, atnaujinantis tik pasikeitusias ekrano sritis
+    
+    Piešimo metu naudojamas vietoje screen: blit() tik įsimena (Surface, Rect),
+    o present() palygina su praėjusiu kadru, perpiešia foną ir objektus tik
+    pasikeitusiose srityse ir kviečia pygame.display.update(rects).
+    """
+    def __init__(self, screen):
+        self.screen = screen
+        self.items = []
+        self.prev_items = []
+        self.bg_key = None
+        self.full_redraw = True
+    
+    def blit(self, source, dest):
+        """Įsimena piešiamą paviršių (suderinama su Surface.blit)"""
+        rect = source.get_rect(topleft=(dest[0], dest[1]))
+        self.items.append((source, rect))
+        return rect
+    
+    def fblits(self, blit_sequence):
+        """Įsimena kelis (Surface, pozicija) iš karto (suderinama su Surface.fblits)"""
+        for source, dest in blit_sequence:
+            self.blit(source, dest)
+    
+    def invalidate(self):
+        """Kitame kadre perpiešti visą ekraną"""
+        self.full_redraw = True
+    
+    def present(self, draw_background, bg_key):
+        """Nupiešia įsimintus objektus ir atnaujina ekraną"""
+        items = self.items
+        self.items = []
+        
+        if self.full_redraw or bg_key != self.bg_key:
+            draw_background(self.screen)
+            for surf, rect in items:
+                self.screen.blit(surf, rect)
+            pygame.display.flip()
+        else:
+            dirty = self.collect_dirty(items)
+            if dirty:
+                for region in dirty:
+                    self.screen.set_clip(region)
+                    draw_background(self.screen)
+                    for surf, rect in items:
+                        if rect.colliderect(region):
+                            self.screen.blit(surf, rect)
+                self.screen.set_clip(None)
+                pygame.display.update(dirty)
+        
+        self.prev_items = items
+        self.bg_key = bg_key
+        self.full_redraw = False
+    
+    def collect_dirty(self, items):
+        """Grąžina sritis, kuriose objektai pasikeitė nuo praėjusio kadro"""
+        prev = {(surf, tuple(rect)) for surf, rect in self.prev_items}
+        cur = {(surf, tuple(rect)) for surf, rect in items}
+        screen_rect = self.screen.get_rect()
+        
+        dirty = []
+        for surf, rect in cur.symmetric_difference(prev):
+            region = screen_rect.clip(pygame.Rect(rect))
+            if region.width and region.height:
+                dirty.append(region)
+        
+        # Persidengiančias sritis sujungti, kad tas pats plotas nebūtų piešiamas kelis kartus
+        merged = []
+        for region in dirty:
+            idx = region.collidelist(merged)
+            while idx != -1:
+                region = region.union(merged.pop(idx))
+                idx = region.collidelist(merged)
+            merged.append(region)
+        return merged
+
+
+class LowResTarget:
+    """Mažos raiškos pasaulio paviršius, vienu transform.scale padidinamas iki lango
+    
+    Naudojamas vietoje screen pasaulio piešimui: koordinatės - lango pikseliais,
+    blit() jas padalina iš factor (sprite'ai jau factor kartų mažesni).
+    present() sveiku kartotiniu padidina kadrą į screen (ar kitą to paties
+    dydžio paviršių), po to ant jo piešiamas HUD.
+    """
+    def __init__(self, screen, factor=RENDER_SCALE):
+        self.factor = factor
+        self.size = screen.get_size()
+        self.surface = pygame.Surface((self.size[0] // factor, self.size[1] // factor), 0, screen)
+    
+    def fill(self, color):
+        """Užpildo visą paviršių spalva"""
+        self.surface.fill(color)
+    
+    def blit(self, source, dest):
+        """Nupiešia paviršių (dest - lango pikseliais)"""
+        return self.surface.blit(source, (dest[0] // self.factor, dest[1] // self.factor))
+    
+    def fblits(self, blit_sequence):
+        """Nupiešia kelis (Surface, pozicija) vienu kvietimu (pozicijos - lango pikseliais)"""
+        f = self.factor
+        self.surface.fblits([(source, (dest[0] // f, dest[1] // f)) for source, dest in blit_sequence])
+    
+    def present(self, target):
+        """Padidina kadrą į target (tokio pat dydžio kaip langas)"""
+        pygame.transform.scale(self.surface, self.size, target)
@@ -0,0 +1,148 @@
+"""
+Įvesties įrašymas ir atkūrimas (kompaktiškas dvejetainis žurnalas)
+
+Žurnale - žaidimo sėkla, simuliaciją keičiantys nustatymai (NumPy
+režimas, povandeninio lygio plotis ekranais, RENDER_SCALE - nuo jo
+priklauso kolizijų kaukės) ir kiekvieno kadro įvestis: kiek simuliacijos
+žingsnių atlikta, žaidimo skaitomų klavišų būsena, pelė ir įvykiai (QUIT,
+KEYDOWN, MOUSEBUTTONDOWN). Simuliacijos laikas stumiamas žingsniais, o
+atsitiktiniai skaičiai imami iš sėklos srautų, todėl atkūrimas (su langu
+arba headless) kartoja žaidimą tiksliai. Atkuriant nustatymai imami iš
+žurnalo; jei kurio nors pritaikyti negalima, atkūrimas atsisakomas:
+
+    python game.py --record zaidimas.kzr
+    python game.py --replay zaidimas.kzr
+    python game.py --headless --replay zaidimas.kzr
+"""
+import struct
+import pygame
+from constants import *
+from inputs import InputFrame, KeyState
+from rng import check_seed
+from soa import NUMPY_AVAILABLE
+
+LOG_MAGIC = b"KZIN"
+LOG_VERSION = 2
+HEADER = struct.Struct("<4sBIBHB")     # žymė, versija, sėkla, požymiai, lygio ekranai, RENDER_SCALE
+FRAME = struct.Struct("<IHhhBH")       # žingsniai, klavišai, pelės x, y, mygtukai, įvykių skaičius
+KEY_EVENT = struct.Struct("<i")        # klavišo kodas
+MOUSE_EVENT = struct.Struct("<Bhh")    # mygtukas, x, y
+
+EVENT_QUIT = 0
+EVENT_KEYDOWN = 1
+EVENT_MOUSEBUTTONDOWN = 2
+
+FLAG_VECTORIZED = 1
+
+# Klavišai, kurių būseną skaito žaidimas (bito numeris - vieta sąraše)
+RECORDED_KEYS = (pygame.K_a, pygame.K_d, pygame.K_LEFT, pygame.K_RIGHT, pygame.K_w, pygame.K_UP,
+                 pygame.K_SPACE, pygame.K_f, pygame.K_e, pygame.K_RETURN, pygame.K_ESCAPE)
+
+
+def log_settings(vectorized, level_width):
+    """Simuliaciją keičiantys nustatymai, saugomi žurnalo antraštėje"""
+    return {'vectorized': bool(vectorized), 'screens': level_width // WIDTH, 'render_scale': RENDER_SCALE}
+
+
+def check_replay_settings(settings):
+    """ValueError, jei žurnalo nustatymų šiame paleidime pritaikyti negalima"""
+    if settings['render_scale'] != RENDER_SCALE:
+        raise ValueError("žurnalas įrašytas su KATINUKAS_RENDER_SCALE=%d (dabar %d)"
+                         % (settings['render_scale'], RENDER_SCALE))
+    if settings['vectorized'] and not NUMPY_AVAILABLE:
+        raise ValueError("žurnalas įrašytas su KATINUKAS_NUMPY=1, bet NumPy neįdiegtas")
+
+
+class InputLogWriter:
+    """Rašo įvesties žurnalą kadras po kadro (settings - log_settings())"""
+    def __init__(self, path, seed, settings):
+        flags = FLAG_VECTORIZED if settings['vectorized'] else 0
+        header = HEADER.pack(LOG_MAGIC, LOG_VERSION, check_seed(seed), flags, settings['screens'],
+                             settings['render_scale'])
+        self.file = open(path, "wb")
+        self.file.write(header)
+    
+    def write(self, steps, frame):
+        """Įrašo vieno kadro įvestį (steps - kiek žingsnių kadras atliko)"""
+        keys = frame.keys
+        key_bits = 0
+        for bit, key in enumerate(RECORDED_KEYS):
+            if keys[key]:
+                key_bits |= 1 << bit
+        button_bits = sum(1 << i for i, pressed in enumerate(frame.mouse_buttons[:3]) if pressed)
+        
+        events = []
+        for event in frame.events:
+            if event.type == pygame.QUIT:
+                events.append(bytes((EVENT_QUIT,)))
+            elif event.type == pygame.KEYDOWN:
+                events.append(bytes((EVENT_KEYDOWN,)) + KEY_EVENT.pack(event.key))
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                events.append(bytes((EVENT_MOUSEBUTTONDOWN,)) + MOUSE_EVENT.pack(event.button, *event.pos))
+        
+        mouse_x, mouse_y = frame.mouse_pos
+        self.file.write(FRAME.pack(steps, key_bits, mouse_x, mouse_y, button_bits, len(events)))
+        self.file.write(b"".join(events))
+    
+    def close(self):
+        self.file.close()
+
+
+def read_input_log(path):
+    """Nuskaito žurnalą; grąžina (sėkla, nustatymai, [(žingsniai, InputFrame)])"""
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < 5 or data[:4] != LOG_MAGIC:
+        raise ValueError("ne įvesties žurnalas: %s" % path)
+    if data[4] != LOG_VERSION:
+        raise ValueError("nepalaikoma žurnalo versija %d (palaikoma %d): %s" % (data[4], LOG_VERSION, path))
+    if len(data) < HEADER.size:
+        raise ValueError("sugadinta žurnalo antraštė: %s" % path)
+    _, _, seed, flags, screens, render_scale = HEADER.unpack_from(data)
+    settings = {'vectorized': bool(flags & FLAG_VECTORIZED), 'screens': screens, 'render_scale': render_scale}
+    
+    frames = []
+    pos = HEADER.size
+    while pos + FRAME.size <= len(data):
+        steps, key_bits, mouse_x, mouse_y, button_bits, event_count = FRAME.unpack_from(data, pos)
+        pos += FRAME.size
+        events = []
+        for _ in range(event_count):
+            kind = data[pos]
+            pos += 1
+            if kind == EVENT_QUIT:
+                events.append(pygame.event.Event(pygame.QUIT))
+            elif kind == EVENT_KEYDOWN:
+                key, = KEY_EVENT.unpack_from(data, pos)
+                pos += KEY_EVENT.size
+                events.append(pygame.event.Event(pygame.KEYDOWN, key=key))
+            else:
+                button, x, y = MOUSE_EVENT.unpack_from(data, pos)
+                pos += MOUSE_EVENT.size
+                events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=button, pos=(x, y)))
+        
+        pressed = [key for bit, key in enumerate(RECORDED_KEYS) if key_bits >> bit & 1]
+        buttons = tuple(bool(button_bits >> i & 1) for i in range(3))
+        frames.append((steps, InputFrame(events, KeyState(pressed), (mouse_x, mouse_y), buttons)))
+    return seed, settings, frames
+
+
+class ReplayInput:
+    """Atkuria įrašytą įvestį; steps - kiek žingsnių turi atlikti paskutinis kadras
+    
+    Kai žurnalas baigiasi (arba uždaromas langas), siunčiamas pygame.QUIT.
+    """
+    def __init__(self, frames):
+        self.frames = frames
+        self.frame_no = 0
+        self.steps = 1
+    
+    def poll(self):
+        """Grąžina šio kadro InputFrame"""
+        closed = any(event.type == pygame.QUIT for event in pygame.event.get())
+        if closed or self.frame_no >= len(self.frames):
+            self.steps = 1
+            return InputFrame([pygame.event.Event(pygame.QUIT)])
+        self.steps, frame = self.frames[self.frame_no]
+        self.frame_no += 1
+        return frame
@@ -0,0 +1,38 @@
+"""
+Deterministiniai atsitiktinių skaičių srautai (atskiri kiekvienam posistemiui)
+"""
+import random
+
+
+SEED_BITS = 32  # sėkla saugoma įvesties žurnale kaip uint32
+
+
+def new_seed():
+    """Nauja atsitiktinė 32 bitų sėkla (iš OS entropijos)"""
+    return random.SystemRandom().getrandbits(SEED_BITS)
+
+
+def check_seed(seed):
+    """Grąžina sėklą arba ValueError, jei ji netelpa į SEED_BITS bitų (0..2**32-1)"""
+    if not isinstance(seed, int) or not 0 <= seed < 1 << SEED_BITS:
+        raise ValueError("sėkla turi būti sveikas skaičius 0..%d: %r" % ((1 << SEED_BITS) - 1, seed))
+    return seed
+
+
+class RandomStreams:
+    """Posistemių random.Random srautai, gaunami iš vienos sėklos
+    
+    Srauto sėkla - "sėkla:vardas", todėl vieno posistemio kvietimų skaičius
+    nekeičia kitų sekų (pvz. daugiau ryklių nepakeičia žuvų išdėstymo).
+    Ta pati sėkla ir ta pati įvestis duoda tą patį žaidimą.
+    """
+    def __init__(self, seed):
+        self.seed = seed
+        self.streams = {}
+    
+    def __getitem__(self, name):
+        try:
+            return self.streams[name]
+        except KeyError:
+            stream = self.streams[name] = random.Random(f"{self.seed}:{name}")
+            return stream
@@ -0,0 +1,323 @@
+"""
+Vektorizuotas povandeninių objektų atnaujinimas (NumPy, struct-of-arrays)
+
+NumPy neprivalomas: jei jo nėra, UnderwaterGame naudoja įprastus objektų
+update() metodus. Masyvai yra tiesos šaltinis tarp kadrų, o po kiekvieno
+atnaujinimo reikšmės surašomos atgal į objektus (piešimui ir kolizijoms).
+Pasikeitus objektų sąrašui, saugykla pažymima invalidate() ir perkraunama.
+"""
+import random
+from abc import ABC, abstractmethod
+from constants import *
+
+try:
+    import numpy as np
+except ImportError:  # NumPy neprivalomas
+    np = None
+
+NUMPY_AVAILABLE = np is not None
+
+
+class _Store(ABC):
+    """Bendra saugyklos logika: masyvai perkraunami pasikeitus sąrašui"""
+    def __init__(self):
+        self.objects = None
+        self.n = 0
+    
+    def invalidate(self):
+        """Pažymi, kad objektų sąrašas pasikeitė"""
+        self.objects = None
+    
+    def bind(self, objects):
+        """Užkrauna masyvus iš objektų, jei sąrašas pasikeitė"""
+        if self.objects is not objects or self.n != len(objects):
+            self.objects = objects
+            self.n = len(objects)
+            self.load(objects)
+    
+    @abstractmethod
+    def load(self, objects):
+        """Sukuria masyvus iš objektų sąrašo"""
+
+
+class FishStore(_Store):
+    """Žuvų masyvai (UnderwaterFish.update atitikmuo)"""
+    def load(self, fish):
+        self.index = np.arange(len(fish))
+        self.x = np.array([f.x for f in fish], dtype=np.float64)
+        self.dx = np.array([f.dx for f in fish], dtype=np.float64)
+        self.ry = np.array([f.rect.y for f in fish], dtype=np.int64)
+        self.w = np.array([f.rect.width for f in fish], dtype=np.int64)
+        self.h = np.array([f.rect.height for f in fish], dtype=np.int64)
+        self.frame_idx = np.array([f.frame_idx for f in fish], dtype=np.int64)
+        self.frame_tick = np.array([f.frame_tick for f in fish], dtype=np.int64)
+    
+    def update(self, fish, platforms, zuvis_a_frames, level_width=WIDTH, active_range=None, tick=0,
+               far_interval=UW_FAR_UPDATE_INTERVAL):
+        """Atnaujina žuvis vienu metu; grąžina pajudėjusių sąrašą
+        
+        active_range - (lo, hi), kaip UnderwaterGame.update_fish: už jo esanti
+        žuvis atnaujinama kas far_interval žingsnių (paeiliui pagal indeksą,
+        far_interval žingsnių iš karto). None - visos kiekvieną žingsnį.
+        """
+        self.bind(fish)
+        if not self.n:
+            return []
+        if active_range is None:
+            sel = self.index
+            steps = 1
+        else:
+            lo, hi = active_range
+            near = (self.x >= lo) & (self.x <= hi)
+            far_turn = ~near & (self.index % far_interval == tick % far_interval)
+            sel = np.flatnonzero(near | far_turn)
+            if not len(sel):
+                return []
+            steps = np.where(near[sel], 1, far_interval)
+        
+        prev_x = self.x[sel]
+        dx, w = self.dx[sel], self.w[sel]
+        x = prev_x + dx * steps
+        
+        # Atsimušti nuo lygio kraštų
+        bounce = (x <= 10) | (x >= level_width - w - 10)
+        dx[bounce] *= -1
+        
+        rx = x.astype(np.int64)
+        ry, h = self.ry[sel], self.h[sel]
+        
+        # Kolizija su platformomis (kiekviena žuvis - tik su pirma atitinkančia)
+        pending = np.ones(len(sel), dtype=bool)
+        for plat in platforms:
+            hit = pending & (rx < plat.right) & (rx + w > plat.left) & (ry < plat.bottom) & (ry + h > plat.top)
+            hit &= ry + h // 2 > plat.top + PLATFORM_TOP_COLLIDE_H
+            if not hit.any():
+                continue
+            cx = rx + w // 2
+            left = hit & (cx < plat.centerx) & (rx + w > plat.left)
+            right = hit & (cx >= plat.centerx) & (rx < plat.right)
+            x[left] = plat.left - w[left]
+            x[right] = plat.right
+            dx[hit] *= -1
+            rx[hit] = x[hit].astype(np.int64)
+            pending &= ~hit
+        
+        # Animacija
+        frame_idx, frame_tick = self.frame_idx[sel], self.frame_tick[sel]
+        if zuvis_a_frames:
+            frame_tick += steps
+            wrap = frame_tick >= 8
+            frame_tick[wrap] -= 8
+            frame_idx[wrap] = (frame_idx[wrap] + 1) % len(zuvis_a_frames)
+        
+        self.x[sel], self.dx[sel] = x, dx
+        self.frame_idx[sel], self.frame_tick[sel] = frame_idx, frame_tick
+        
+        moved = [fish[i] for i in sel.tolist()]
+        for f, px, nx, ndx, nrx, idx, ftick in zip(moved, prev_x.tolist(), x.tolist(), dx.tolist(),
+                                                    rx.tolist(), frame_idx.tolist(), frame_tick.tolist()):
+            f.prev_x = px
+            f.x = nx
+            f.dx = ndx
+            f.rect.x = nrx
+            f.frame_idx = idx
+            f.frame_tick = ftick
+        return moved
+
+
+class SharkStore(_Store):
+    """Ryklių masyvai (Shark.update ir SharkScheduler atitikmuo)"""
+    def load(self, sharks):
+        self.index = np.arange(len(sharks))
+        self.x = np.array([s.x for s in sharks], dtype=np.float64)
+        self.y = np.array([s.y for s in sharks], dtype=np.float64)
+        self.dx = np.array([s.dx for s in sharks], dtype=np.float64)
+        self.attack = np.array([s.state == "attack" for s in sharks], dtype=bool)
+        self.lure_dist = np.array([s.lure_dist for s in sharks], dtype=np.float64)
+        self.speed_factor = np.array([s.speed_factor for s in sharks], dtype=np.float64)
+        self.w = np.array([s.rect.width for s in sharks], dtype=np.int64)
+        self.frame_idx = np.array([s.frame_idx for s in sharks], dtype=np.int64)
+        self.frame_tick = np.array([s.frame_tick for s in sharks], dtype=np.int64)
+    
+    def update(self, sharks, player_x, player_y, now_ms, level_width=WIDTH, rng=random, scheduler=None,
+               tick=0, active_range=None):
+        """Atnaujina ryklius vienu metu; grąžina pajudėjusių sąrašą
+        
+        rng - ryklių atsitiktinių skaičių srautas. scheduler (SharkScheduler)
+        ir active_range - tie patys detalumo lygiai kaip objektų kelyje
+        (scheduler.counts užpildomas); None - visi pilnai kiekvieną žingsnį.
+        """
+        self.bind(sharks)
+        if not self.n:
+            return []
+        n, index = self.n, self.index
+        
+        # --- Detalumo lygiai: kas sprendžia (think) ir kas juda (move), kiek žingsnių ---
+        if scheduler is None:
+            thinks = moves = np.ones(n, dtype=bool)
+            think_steps = move_steps = np.ones(n, dtype=np.int64)
+        else:
+            lo, hi = active_range
+            think_interval, far_interval = scheduler.think_interval, scheduler.far_interval
+            active = (self.x >= lo) & (self.x <= hi)
+            far = ~active & (index % far_interval == tick % far_interval)
+            near = active & (self.lure_dist <= scheduler.near_radius)
+            mid = active & ~near
+            thinks = far | near | (mid & (index % think_interval == tick % think_interval))
+            moves = far | active
+            think_steps = np.where(far, far_interval, np.where(mid, think_interval, 1))
+            move_steps = np.where(far, far_interval, 1)
+            counts = scheduler.counts
+            counts['near'], counts['mid'], counts['far'] = int(near.sum()), int(mid.sum()), int(far.sum())
+        
+        x, y, dx = self.x, self.y, self.dx
+        prev_x, prev_y = x.copy(), y.copy()
+        
+        # slow_until keičia burbulai, todėl imamas iš objektų kiekvieną kadrą
+        m = np.flatnonzero(moves)
+        slow_until = np.fromiter((sharks[i].slow_until for i in m.tolist()), dtype=np.float64, count=len(m))
+        slowed = np.full(n, 1.0)
+        slowed[m] = np.where(now_ms < slow_until, 0.5, 1.0)
+        
+        # --- Sprendimas (Shark.think) ---
+        t = np.flatnonzero(thinks)
+        if len(t):
+            steps = think_steps[t]
+            tx, ty, tdx = x[t], y[t], dx[t]
+            speed_factor = slowed[t]
+            self.speed_factor[t] = speed_factor
+            
+            # Atstumas iki žaidėjo
+            dxp = player_x - tx
+            dyp = player_y - ty
+            dist = np.float_power(dxp * dxp + dyp * dyp, 0.5)  # tas pats pow() kaip ** 0.5
+            self.lure_dist[t] = dist
+            
+            # Būsenos sprendimas
+            attack = dist <= SHARK_ATTACK_RANGE
+            patrol = ~attack
+            norm = np.where(dist != 0, dist, 1.0)
+            tdx[attack] = (dxp[attack] / norm[attack]) * (SHARK_ATTACK_SPEED * speed_factor[attack])
+            ty[attack] += (dyp[attack] / norm[attack]) * (0.6 * speed_factor[attack])
+            
+            # Atsitiktiniai skaičiai imami ryklių eilės tvarka, kaip Shark.think
+            patrol_idx = np.flatnonzero(patrol)
+            chance = SHARK_PATROL_TURN_CHANCE * steps
+            entering = patrol & self.attack[t]
+            if entering.any():
+                turn = np.zeros(len(t), dtype=bool)
+                for i in patrol_idx.tolist():
+                    if entering[i]:
+                        tdx[i] = rng.choice([-1, 1]) * (SHARK_PATROL_SPEED * speed_factor[i])
+                    turn[i] = rng.random() < chance[i]
+            else:
+                rnd = rng.random
+                turn = np.zeros(len(t), dtype=bool)
+                turn[patrol_idx] = np.array([rnd() for _ in range(len(patrol_idx))]) < chance[patrol_idx]
+            tdx[turn] = -tdx[turn]
+            
+            ty[patrol] += np.sin(now_ms / 600.0 + tx[patrol]) * 0.2 * steps[patrol]
+            tdx[patrol] = np.copysign(SHARK_PATROL_SPEED * speed_factor[patrol], tdx[patrol])
+            y[t], dx[t] = ty, tdx
+            self.attack[t] = attack
+        
+        # --- Judėjimas ir animacija (Shark.move; sulėtinimas tikrinamas kiekvieną kartą) ---
+        steps = move_steps[m]
+        mdx = dx[m]
+        changed = slowed[m] != self.speed_factor[m]
+        if changed.any():
+            mdx[changed] *= slowed[m][changed] / self.speed_factor[m][changed]
+            self.speed_factor[m] = slowed[m]
+        mx = x[m] + mdx * steps
+        low = mx < 10
+        mx[low] = 10
+        mdx[low] *= -1
+        x_max = level_width - self.w[m] - 10
+        high = mx > x_max
+        mx[high] = x_max[high]
+        mdx[high] *= -1
+        x[m], dx[m] = mx, mdx
+        
+        rx = mx.astype(np.int64)
+        ry = y[m].astype(np.int64)
+        
+        frame_idx, frame_tick = self.frame_idx[m], self.frame_tick[m]
+        frame_tick += steps
+        wrap = frame_tick >= 8
+        frame_tick[wrap] -= 8
+        frame_idx[wrap] = (frame_idx[wrap] + 1) % RIKLYS_SHEET_FRAMES
+        self.frame_idx[m], self.frame_tick[m] = frame_idx, frame_tick
+        
+        moved = [sharks[i] for i in m.tolist()]
+        for s, px, py, nx, ny, ndx, att, dist, sf, nrx, nry, idx, ftick in zip(
+                moved, prev_x[m].tolist(), prev_y[m].tolist(), mx.tolist(), y[m].tolist(), mdx.tolist(),
+                self.attack[m].tolist(), self.lure_dist[m].tolist(), self.speed_factor[m].tolist(),
+                rx.tolist(), ry.tolist(), frame_idx.tolist(), frame_tick.tolist()):
+            s.prev_x, s.prev_y = px, py
+            s.x, s.y = nx, ny
+            s.dx = ndx
+            s.state = "attack" if att else "patrol"
+            s.lure_dist = dist
+            s.speed_factor = sf
+            s.rect.x, s.rect.y = nrx, nry
+            s.frame_idx = idx
+            s.frame_tick = ftick
+        return moved
+
+
+class BubbleStore(_Store):
+    """Burbulų masyvai (Bubble.update ir is_expired atitikmuo)"""
+    def load(self, bubbles):
+        self.x = np.array([b.x for b in bubbles], dtype=np.float64)
+        self.y = np.array([b.y for b in bubbles], dtype=np.float64)
+        self.vx = np.array([b.vx for b in bubbles], dtype=np.float64)
+        self.vy = np.array([b.vy for b in bubbles], dtype=np.float64)
+        self.born_ms = np.array([b.born_ms for b in bubbles], dtype=np.float64)
+        self.frame_idx = np.array([b.frame_idx for b in bubbles], dtype=np.int64)
+        self.frame_tick = np.array([b.frame_tick for b in bubbles], dtype=np.int64)
+    
+    def update(self, bubbles, now_ms):
+        """Atnaujina visus burbulus; grąžina pasenusių burbulų požymių sąrašą"""
+        self.bind(bubbles)
+        if not self.n:
+            return []
+        self.frame_tick += 1
+        wrap = self.frame_tick >= 4
+        self.frame_tick[wrap] = 0
+        self.frame_idx[wrap] += 1
+        
+        prev_x, prev_y = self.x.copy(), self.y.copy()
+        self.x += self.vx
+        self.y += self.vy
+        rx = self.x.astype(np.int64)
+        ry = self.y.astype(np.int64)
+        
+        for b, px, py, nx, ny, nrx, nry, idx, tick in zip(
+                bubbles, prev_x.tolist(), prev_y.tolist(), self.x.tolist(), self.y.tolist(),
+                rx.tolist(), ry.tolist(), self.frame_idx.tolist(), self.frame_tick.tolist()):
+            b.prev_x, b.prev_y = px, py
+            b.x, b.y = nx, ny
+            b.rect.x, b.rect.y = nrx, nry
+            b.frame_idx = idx
+            b.frame_tick = tick
+        
+        return (now_ms - self.born_ms >= BUBBLE_LIFETIME_MS).tolist()
+
+
+class VectorBackend:
+    """Žuvų, ryklių ir burbulų NumPy saugyklos"""
+    def __init__(self):
+        self.stores = {
+            'fish': FishStore(),
+            'sharks': SharkStore(),
+            'bubbles': BubbleStore(),
+        }
+    
+    def __getitem__(self, name):
+        return self.stores[name]
+    
+    def invalidate(self, name=None):
+        """Pažymi, kad objektų sąrašas (arba visi, jei name=None) pasikeitė"""
+        for key, store in self.stores.items():
+            if name is None or key == name:
+                store.invalidate()
@@ -0,0 +1,199 @@
+"""
+Erdviniai indeksai: tinklelis (spatial hash) kolizijoms ir pagal x surikiuotas indeksas
+"""
+from bisect import bisect_left, bisect_right
+from constants import *
+
+
+class SpatialHash:
+    """Tolygus tinklelis: objektas laikomas visuose langeliuose, kuriuos dengia jo Rect
+    
+    Objektai atnaujinami inkrementiškai (sync/move): perkeliami tik tada, kai
+    pasikeičia jų dengiamų langelių ribos. query() grąžina kandidatus iš
+    langelių, kuriuos dengia paieškos Rect, įdėjimo tvarka (kaip sąraše);
+    tikslų colliderect patikrinimą atlieka kviečiantysis.
+    """
+    def __init__(self, cell_size=GRID_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}   # (cx, cy) -> {id(objektas): objektas}
+        self.ranges = {}  # id(objektas) -> (x0, x1, y0, y1)
+        self.order = {}   # id(objektas) -> įdėjimo eilės numeris
+        self.next_order = 0
+        self.pending = None  # objektai, kurių vietos dar nesinchronizuotos
+    
+    def __len__(self):
+        return len(self.ranges)
+    
+    def clear(self):
+        """Išvalo tinklelį"""
+        self.cells.clear()
+        self.ranges.clear()
+        self.order.clear()
+        self.next_order = 0
+        self.pending = None
+    
+    def cell_range(self, rect):
+        """Grąžina langelių ribas (x0, x1, y0, y1), kurias dengia rect"""
+        cs = self.cell_size
+        x, y, w, h = rect
+        return x // cs, (x + w - 1) // cs if w > 0 else x // cs, \
+            y // cs, (y + h - 1) // cs if h > 0 else y // cs
+    
+    def _add(self, key, item, cell_range):
+        x0, x1, y0, y1 = cell_range
+        cells = self.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = {key: item}
+                else:
+                    bucket[key] = item
+    
+    def _discard(self, key, cell_range):
+        x0, x1, y0, y1 = cell_range
+        cells = self.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is not None:
+                    bucket.pop(key, None)
+                    if not bucket:
+                        del cells[(cx, cy)]
+    
+    def insert(self, item, rect):
+        """Įdeda objektą (arba perkelia, jei jau yra)"""
+        self.move(item, rect)
+    
+    def move(self, item, rect):
+        """Atnaujina objekto vietą; langeliai keičiami tik pasikeitus riboms"""
+        key = id(item)
+        new_range = self.cell_range(rect)
+        old_range = self.ranges.get(key)
+        if old_range == new_range:
+            return
+        if old_range is not None:
+            self._discard(key, old_range)
+        else:
+            self.order[key] = self.next_order
+            self.next_order += 1
+        self.ranges[key] = new_range
+        self._add(key, item, new_range)
+    
+    def remove(self, item):
+        """Pašalina objektą iš tinklelio"""
+        if self.pending is not None:
+            items, self.pending = self.pending, None
+            self.sync(items)
+        key = id(item)
+        old_range = self.ranges.pop(key, None)
+        if old_range is not None:
+            self._discard(key, old_range)
+            del self.order[key]
+    
+    def sync(self, items):
+        """Atnaujina visų objektų (su .rect) vietas"""
+        cs = self.cell_size
+        ranges = self.ranges
+        for item in items:
+            x, y, w, h = item.rect
+            new_range = (x // cs, (x + w - 1) // cs, y // cs, (y + h - 1) // cs)
+            key = id(item)
+            old_range = ranges.get(key)
+            if old_range != new_range:
+                if old_range is not None:
+                    self._discard(key, old_range)
+                else:
+                    self.order[key] = self.next_order
+                    self.next_order += 1
+                ranges[key] = new_range
+                self._add(key, item, new_range)
+    
+    def mark_moved(self, items):
+        """Pažymi, kad objektai pajudėjo; sync atidedamas iki kitos užklausos"""
+        if self.pending is not None and self.pending is not items:
+            self.sync(self.pending)
+        self.pending = items
+    
+    def rebuild(self, items):
+        """Perkuria tinklelį iš objektų su .rect"""
+        self.clear()
+        self.sync(items)
+    
+    def query(self, rect):
+        """Grąžina objektus, kurių langeliai persidengia su rect"""
+        if self.pending is not None:
+            items, self.pending = self.pending, None
+            self.sync(items)
+        x0, x1, y0, y1 = self.cell_range(rect)
+        cells = self.cells
+        if x0 == x1 and y0 == y1:
+            bucket = cells.get((x0, y0))
+            if not bucket:
+                return []
+            if len(bucket) == 1:
+                return list(bucket.values())
+            found = bucket
+        else:
+            found = {}
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    bucket = cells.get((cx, cy))
+                    if bucket:
+                        found.update(bucket)
+        order = self.order
+        return [found[key] for key in sorted(found, key=order.__getitem__)]
+
+
+class SortedIndex:
+    """Objektai, surikiuoti pagal x (bisect paieška)
+    
+    point(objektas) -> (x, y); objekto taškas neturi keistis, kol jis yra
+    indekse. Vienodo x objektai laikomi įdėjimo tvarka. range() ir nearest()
+    peržiūri tik x intervale esančius objektus: O(log n + k).
+    """
+    def __init__(self, point):
+        self.point = point
+        self.xs = []
+        self.items = []
+    
+    def __len__(self):
+        return len(self.items)
+    
+    def clear(self):
+        """Išvalo indeksą"""
+        self.xs.clear()
+        self.items.clear()
+    
+    def add(self, item):
+        """Įdeda objektą"""
+        x = self.point(item)[0]
+        i = bisect_right(self.xs, x)
+        self.xs.insert(i, x)
+        self.items.insert(i, item)
+    
+    def discard(self, item):
+        """Pašalina objektą (jei jis yra)"""
+        x = self.point(item)[0]
+        i = bisect_left(self.xs, x)
+        end = bisect_right(self.xs, x, i)
+        for j in range(i, end):
+            if self.items[j] is item:
+                del self.xs[j]
+                del self.items[j]
+                return
+    
+    def range(self, x0, x1):
+        """Objektai, kurių x0 <= x <= x1 (x tvarka)"""
+        return self.items[bisect_left(self.xs, x0):bisect_right(self.xs, x1)]
+    
+    def nearest(self, x, y, max_dist):
+        """Artimiausias objektas ne toliau nei max_dist; grąžina (objektas, atstumas) arba (None, None)"""
+        best, best_dist = None, None
+        point = self.point
+        for item in self.range(x - max_dist, x + max_dist):
+            px, py = point(item)
+            dist = ((x - px)**2 + (y - py)**2)**0.5
+            if dist <= max_dist and (best_dist is None or dist < best_dist):
+                best, best_dist = item, dist
+        return best, best_dist
@@ -0,0 +1,143 @@
+"""
+NumPy ir objektų atnaujinimo palyginimas su numatytomis konstantomis
+
+Ta pati sėkla ir įvestis su vectorized=True ir vectorized=False turi duoti
+tą patį žaidimą (kelių ekranų lygyje, kur veikia ir retesni tolimų objektų
+atnaujinimai). Be NumPy patikrinimas praleidžiamas.
+
+    python -m pytest tests
+    python tests/test_backends.py
+"""
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+from constants import *
+from headless import load_headless_assets, silent_sounds
+from inputs import KeyState
+from rng import RandomStreams
+from soa import NUMPY_AVAILABLE
+from timing import ManualClock
+from underwater import UnderwaterGame
+
+SEED = 1234
+SCREENS = 3
+STEPS = 1500
+
+_assets = None
+
+
+def assets():
+    global _assets
+    if _assets is None:
+        _assets = load_headless_assets()
+    return _assets
+
+
+def scripted_keys(step):
+    """Plaukia per visą lygį į dešinę ir atgal, nyra, gaudo, leidžia burbulus"""
+    pressed = set()
+    pressed.add(pygame.K_d if (step // 500) % 2 == 0 else pygame.K_a)
+    if (step // 120) % 2 == 1 and step % 20 < 3:
+        pressed.add(pygame.K_w)
+    if step % 4 == 0:
+        pressed.add(pygame.K_SPACE)
+    if step % 3 == 0:
+        pressed.add(pygame.K_f)
+    return KeyState(pressed)
+
+
+def fish_state(game):
+    return [(f.x, f.prev_x, f.dx, tuple(f.rect), f.frame_idx, f.frame_tick) for f in game.fish]
+
+
+def shark_state(game):
+    sharks = [(s.x, s.y, s.prev_x, s.prev_y, s.dx, s.state, s.lure_dist, tuple(s.rect), s.frame_idx,
+               s.frame_tick) for s in game.sharks]
+    return sharks, dict(game.shark_ai.counts)
+
+
+def full_state(game):
+    return fish_state(game), shark_state(game), game.player_x, game.player_y, len(game.bubbles)
+
+
+def run(vectorized, state, steps=STEPS):
+    """Simuliuoja povandeninį žaidimą; grąžina state(game) kas žingsnį"""
+    clock = ManualClock()
+    game = UnderwaterGame(assets(), silent_sounds(), clock, vectorized=vectorized,
+                          level_width=WIDTH * SCREENS, rng=RandomStreams(SEED))
+    game.initialize(WIDTH // 2, HEIGHT // 2 - 100)
+    history = []
+    for step in range(steps):
+        game.update(scripted_keys(step))
+        clock.advance(SIM_STEP_MS)
+        history.append((game.caught_count, state(game)))
+    return history
+
+
+def assert_same(expected, actual):
+    for step, (a, b) in enumerate(zip(expected, actual)):
+        assert a == b, "skiriasi po %d žingsnio" % step
+    assert len(expected) == len(actual)
+
+
+def test_fish_backends_match():
+    if not NUMPY_AVAILABLE:
+        return
+    objects = run(False, fish_state)
+    assert objects[-1][0] > 0  # scenarijus tikrai gaudo
+    assert_same(objects, run(True, fish_state))
+
+
+def test_shark_backends_match():
+    if not NUMPY_AVAILABLE:
+        return
+    objects = run(False, shark_state)
+    # Scenarijuje pasitaiko visi detalumo lygiai
+    for tier in ('near', 'mid', 'far'):
+        assert any(counts[tier] for _, (_, counts) in objects)
+    assert_same(objects, run(True, shark_state))
+
+
+def test_full_game_backends_match():
+    if not NUMPY_AVAILABLE:
+        return
+    assert_same(run(False, full_state), run(True, full_state))
+
+
+
+def mid_tier_slowdown(vectorized):
+    """Burbulo pataikytas vidutinio lygio ryklys sulėtėja, nelaukdamas sprendimo"""
+    clock = ManualClock()
+    game = UnderwaterGame(assets(), silent_sounds(), clock, vectorized=vectorized,
+                          level_width=WIDTH * SCREENS, rng=RandomStreams(SEED))
+    game.initialize(WIDTH // 2, HEIGHT // 2 - 100)
+    shark_x = WIDTH // 2 + 3 * SHARK_AI_NEAR_RADIUS
+    game.spawn_sharks(1, x_min=shark_x, x_max=shark_x)
+    shark = game.sharks[0]
+    # 0 žingsnis - pilnas atnaujinimas (atstumas dar nežinomas), 1 - tik judėjimas
+    for step in range(2):
+        if step == 1:
+            assert game.tick % SHARK_AI_THINK_INTERVAL != 0
+            shark.slow_until = clock.now_ms() + SHARK_SLOW_MS
+        x = shark.x
+        game.update(KeyState())
+        clock.advance(SIM_STEP_MS)
+    assert game.shark_ai.counts['mid'] == 1
+    return abs(shark.x - x), abs(shark.dx)
+
+
+def test_bubble_slows_mid_tier_shark():
+    for vectorized in ((False, True) if NUMPY_AVAILABLE else (False,)):
+        assert mid_tier_slowdown(vectorized) == (SHARK_PATROL_SPEED * 0.5, SHARK_PATROL_SPEED * 0.5)
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print("ok", name)
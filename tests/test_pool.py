@@ -0,0 +1,103 @@
+"""
+Objektų telkinio patikrinimai: swap-remove tvarka ir pool_index
+
+    python -m pytest tests
+    python tests/test_pool.py
+"""
+import os
+import random
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from pool import ObjectPool
+
+
+class Item:
+    """Telkinio objektas (kaip burbulai ir monetos: reset(*args))"""
+    created = 0
+    
+    def __init__(self, value):
+        Item.created += 1
+        self.reset(value)
+    
+    def reset(self, value):
+        self.value = value
+
+
+def check_indexes(pool):
+    """Kiekvieno aktyvaus objekto pool_index rodo į jo vietą active sąraše"""
+    for i, obj in enumerate(pool.active):
+        assert obj.pool_index == i
+    for obj in pool.free:
+        assert obj.pool_index == -1
+
+
+def test_release_swaps_last_into_place():
+    pool = ObjectPool(Item)
+    items = [pool.spawn(i) for i in range(5)]
+    pool.release(items[1])
+    # Paskutinis užima pašalinto vietą, kitų tvarka nesikeičia
+    assert [obj.value for obj in pool.active] == [0, 4, 2, 3]
+    pool.release(items[3])
+    assert [obj.value for obj in pool.active] == [0, 4, 2]
+    pool.release(items[2])  # paskutinis - niekas neperkeliamas
+    assert [obj.value for obj in pool.active] == [0, 4]
+    check_indexes(pool)
+
+
+def test_release_matches_list_model():
+    rng = random.Random(1)
+    pool = ObjectPool(Item)
+    model = []
+    for step in range(2000):
+        if model and rng.random() < 0.45:
+            obj = rng.choice(pool.active)
+            pool.release(obj)
+            # Modelis: swap-remove sąraše
+            i = model.index(obj)
+            model[i] = model[-1]
+            model.pop()
+        else:
+            model.append(pool.spawn(step))
+        assert pool.active == model
+        check_indexes(pool)
+
+
+def test_backwards_release_during_iteration():
+    # Kaip UnderwaterGame.update_bubbles: einant nuo galo, pašalinus objektą
+    # jo vietą užima jau apdorotas, todėl kiekvienas aplankomas lygiai kartą
+    rng = random.Random(2)
+    pool = ObjectPool(Item)
+    for i in range(200):
+        pool.spawn(i)
+    seen = []
+    for i in range(len(pool.active) - 1, -1, -1):
+        obj = pool.active[i]
+        seen.append(obj.value)
+        if rng.random() < 0.5:
+            pool.release(obj)
+    assert sorted(seen) == list(range(200))
+    check_indexes(pool)
+
+
+def test_spawn_reuses_released_objects():
+    Item.created = 0
+    pool = ObjectPool(Item)
+    pool.reserve(3, None)
+    objs = [pool.spawn(i) for i in range(3)]
+    assert Item.created == 3
+    assert [obj.value for obj in objs] == [0, 1, 2]
+    pool.clear()
+    assert not pool.active and len(pool.free) == 3
+    check_indexes(pool)
+    again = pool.spawn(7)
+    assert Item.created == 3 and again.value == 7 and again in objs
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print("ok", name)
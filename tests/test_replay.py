@@ -0,0 +1,157 @@
+"""
+Įvesties žurnalo patikrinimai: formatas, nustatymai ir įrašymo-atkūrimo ciklas
+
+    python -m pytest tests
+    python tests/test_replay.py
+"""
+import os
+import struct
+import sys
+import tempfile
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+from constants import *
+from inputs import InputFrame, KeyState, ScriptedInput
+from replay import HEADER, LOG_MAGIC, InputLogWriter, check_replay_settings, log_settings, read_input_log
+from soa import NUMPY_AVAILABLE
+from timing import FixedTimestep
+
+
+def temp_log():
+    fd, path = tempfile.mkstemp(suffix=".kzr")
+    os.close(fd)
+    return path
+
+
+def expect_error(func, *args):
+    try:
+        func(*args)
+    except (ValueError, struct.error):
+        return
+    raise AssertionError("%s%r turėjo mesti klaidą" % (func.__name__, args))
+
+
+def script(frame_no):
+    """Nardo, gaudo, spaudžia meniu; po 600 kadrų - pabaiga"""
+    if frame_no > 600:
+        return None
+    events = []
+    if frame_no in (5, 300):
+        events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_e))
+    if frame_no == 500:
+        events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(frame_no, 100)))
+    keys = {pygame.K_SPACE} if frame_no % 3 == 0 else set()
+    if frame_no % 7 == 0:
+        keys.add(pygame.K_f)
+    if frame_no > 150:
+        keys.add(pygame.K_d if (frame_no // 90) % 2 == 0 else pygame.K_a)
+    if frame_no % 40 < 6:
+        keys.add(pygame.K_w)
+    return InputFrame(events, KeyState(keys), (frame_no % 640, 100), (frame_no % 97 == 0, False, False))
+
+
+def fingerprint(game):
+    uw = game.underwater_game
+    return (game.seed, game.caught_count, game.coins_collected, game.player_lives, game.player.x,
+            game.scroll_x, uw.player_x, uw.player_y, uw.tick,
+            [(s.x, s.y, s.state) for s in uw.sharks], [(f.x, f.dx) for f in uw.fish])
+
+
+def test_frames_round_trip():
+    path = temp_log()
+    try:
+        frames = [(steps, script(frame_no)) for frame_no, steps in enumerate([1, 0, 2, 255, 256, 70000] * 20)]
+        writer = InputLogWriter(path, 4000000000, log_settings(False, WIDTH))
+        for steps, frame in frames:
+            writer.write(steps, frame)
+        writer.close()
+        
+        seed, settings, read = read_input_log(path)
+        assert seed == 4000000000
+        assert settings == log_settings(False, WIDTH)
+        assert len(read) == len(frames)
+        for (steps, frame), (read_steps, read_frame) in zip(frames, read):
+            assert read_steps == steps
+            assert read_frame.mouse_pos == frame.mouse_pos
+            assert read_frame.mouse_buttons == frame.mouse_buttons
+            assert [(e.type, e.dict) for e in read_frame.events] == [(e.type, e.dict) for e in frame.events]
+            for key in (pygame.K_SPACE, pygame.K_f, pygame.K_w, pygame.K_a, pygame.K_d):
+                assert read_frame.keys[key] == frame.keys[key]
+    finally:
+        os.remove(path)
+
+
+def test_fast_forward_hitch_fits_in_log():
+    # Pagreitinus 100 kartų, vienas 60 ms kadras - šimtai žingsnių
+    steps = FixedTimestep(scale=100).advance(60)
+    assert steps > 255
+    path = temp_log()
+    try:
+        writer = InputLogWriter(path, 1, log_settings(False, WIDTH))
+        writer.write(steps, InputFrame())
+        writer.close()
+        assert read_input_log(path)[2][0][0] == steps
+    finally:
+        os.remove(path)
+
+
+def test_rejects_bad_seed_and_version():
+    path = temp_log()
+    try:
+        for seed in (-1, 1 << 32):
+            expect_error(InputLogWriter, path, seed, log_settings(False, WIDTH))
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(LOG_MAGIC, 1, 5, 0, 1, RENDER_SCALE))
+        expect_error(read_input_log, path)
+        with open(path, "wb") as f:
+            f.write(b"not a log")
+        expect_error(read_input_log, path)
+    finally:
+        os.remove(path)
+
+
+def test_replay_settings_checked():
+    check_replay_settings(log_settings(False, WIDTH * 3))
+    other_scale = dict(log_settings(False, WIDTH), render_scale=RENDER_SCALE + 1)
+    expect_error(check_replay_settings, other_scale)
+    if not NUMPY_AVAILABLE:
+        expect_error(check_replay_settings, log_settings(True, WIDTH))
+
+
+def test_record_and_replay_match():
+    import game
+    path = temp_log()
+    try:
+        recorded = game.main(headless=True, input_source=ScriptedInput(script), record_path=path, render=False)
+        replayed = game.main(headless=True, replay_path=path, render=False)
+        assert recorded.underwater_game.tick > 0  # scenarijus tikrai nardo
+        assert fingerprint(replayed) == fingerprint(recorded)
+    finally:
+        os.remove(path)
+
+
+def test_replay_applies_recorded_settings():
+    import game
+    path = temp_log()
+    try:
+        vectorized = NUMPY_AVAILABLE
+        writer = InputLogWriter(path, 7, log_settings(vectorized, WIDTH * 2))
+        writer.write(1, InputFrame())
+        writer.close()
+        replayed = game.main(headless=True, replay_path=path, render=False)
+        assert replayed.seed == 7
+        assert replayed.underwater_game.level_width == WIDTH * 2
+        assert (replayed.underwater_game.vector is not None) == vectorized
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print("ok", name)
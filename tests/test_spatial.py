@@ -0,0 +1,195 @@
+"""
+Erdvinių indeksų patikrinimai: rezultatai lyginami su perrinkimu (brute force)
+
+    python -m pytest tests
+    python tests/test_spatial.py
+"""
+import os
+import random
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import pygame
+from spatial import SortedIndex, SpatialHash
+
+WORLD = (0, 0, 2000, 800)
+
+
+class Box:
+    """Objektas su .rect (kaip žuvys ir rykliai)"""
+    def __init__(self, rng):
+        self.rect = pygame.Rect(rng.randrange(-50, WORLD[2]), rng.randrange(-50, WORLD[3]),
+                                rng.randrange(1, 120), rng.randrange(1, 80))
+    
+    def jump(self, rng):
+        """Mažas poslinkis arba (kartais) peršokimas į kitą vietą"""
+        if rng.random() < 0.1:
+            self.rect.topleft = (rng.randrange(WORLD[2]), rng.randrange(WORLD[3]))
+        else:
+            self.rect.move_ip(rng.randint(-30, 30), rng.randint(-30, 30))
+
+
+def random_query(rng):
+    return pygame.Rect(rng.randrange(-100, WORLD[2]), rng.randrange(-100, WORLD[3]),
+                       rng.randrange(0, 300), rng.randrange(0, 300))
+
+
+def hits(grid, rect):
+    """Tinklelio kandidatai, atrinkti colliderect (kaip žaidime)"""
+    return [item for item in grid.query(rect) if item.rect.colliderect(rect)]
+
+
+def brute(items, rect):
+    return [item for item in items if item.rect.colliderect(rect)]
+
+
+def test_query_matches_brute_force():
+    rng = random.Random(1)
+    boxes = [Box(rng) for _ in range(300)]
+    grid = SpatialHash(cell_size=64)
+    grid.rebuild(boxes)
+    for _ in range(200):
+        rect = random_query(rng)
+        assert hits(grid, rect) == brute(boxes, rect)
+
+
+def test_lazy_resync_after_mark_moved():
+    rng = random.Random(2)
+    boxes = [Box(rng) for _ in range(200)]
+    grid = SpatialHash(cell_size=64)
+    grid.rebuild(boxes)
+    for _ in range(50):
+        # Pajuda tik dalis objektų; tinklelis sinchronizuojamas tik per užklausą
+        moved = rng.sample(boxes, 60)
+        for box in moved:
+            box.jump(rng)
+        grid.mark_moved(moved)
+        for _ in range(5):
+            rect = random_query(rng)
+            assert hits(grid, rect) == brute(boxes, rect)
+
+
+def test_mark_moved_flushes_previous_list():
+    rng = random.Random(3)
+    boxes = [Box(rng) for _ in range(100)]
+    grid = SpatialHash(cell_size=64)
+    grid.rebuild(boxes)
+    first, second = boxes[:50], boxes[50:]
+    for box in boxes:
+        box.jump(rng)
+    # Du skirtingi sąrašai iš eilės: pirmasis neturi būti pamirštas
+    grid.mark_moved(first)
+    grid.mark_moved(second)
+    for _ in range(100):
+        rect = random_query(rng)
+        assert hits(grid, rect) == brute(boxes, rect)
+
+
+def test_remove_with_pending_moves():
+    rng = random.Random(4)
+    boxes = [Box(rng) for _ in range(100)]
+    grid = SpatialHash(cell_size=64)
+    grid.rebuild(boxes)
+    for box in boxes:
+        box.jump(rng)
+    grid.mark_moved(boxes)
+    removed = boxes[::3]
+    for box in removed:
+        grid.remove(box)
+    kept = [box for box in boxes if box not in removed]
+    assert len(grid) == len(kept)
+    for _ in range(100):
+        rect = random_query(rng)
+        assert hits(grid, rect) == brute(kept, rect)
+
+
+def test_query_keeps_insertion_order():
+    rng = random.Random(5)
+    boxes = [Box(rng) for _ in range(100)]
+    grid = SpatialHash(cell_size=64)
+    for box in boxes:
+        grid.insert(box, box.rect)
+    # Perkėlimas nekeičia eilės: tvarka lieka kaip įdėjimo
+    for box in boxes:
+        box.jump(rng)
+        grid.move(box, box.rect)
+    found = grid.query(pygame.Rect(WORLD))
+    assert found == [box for box in boxes if box in found]
+
+
+
+class Spot:
+    """Taškas (kaip FishingSpot.get_center)"""
+    def __init__(self, x, y):
+        self.x, self.y = x, y
+    
+    def get_center(self):
+        return self.x, self.y
+
+
+def random_spots(rng, n):
+    # Sveiki x iš nedidelio intervalo, kad būtų ir vienodų x
+    return [Spot(rng.randrange(0, 500), rng.randrange(0, 300)) for _ in range(n)]
+
+
+def brute_nearest(spots, x, y, max_dist):
+    """Artimiausias perrinkimu; vienodo atstumo - pirmas pagal (x, įdėjimo tvarka)"""
+    best, best_dist = None, None
+    for spot in sorted(spots, key=lambda s: s.x):
+        dist = ((x - spot.x)**2 + (y - spot.y)**2)**0.5
+        if dist <= max_dist and (best_dist is None or dist < best_dist):
+            best, best_dist = spot, dist
+    return best, best_dist
+
+
+def test_sorted_index_range_matches_brute_force():
+    rng = random.Random(6)
+    spots = random_spots(rng, 300)
+    index = SortedIndex(Spot.get_center)
+    for spot in spots:
+        index.add(spot)
+    for _ in range(200):
+        x0 = rng.randrange(-50, 550)
+        x1 = x0 + rng.randrange(0, 200)
+        found = index.range(x0, x1)
+        # x tvarka, vienodo x - įdėjimo tvarka
+        assert found == sorted([s for s in spots if x0 <= s.x <= x1], key=lambda s: s.x)
+
+
+def test_sorted_index_nearest_matches_brute_force():
+    rng = random.Random(7)
+    spots = random_spots(rng, 200)
+    index = SortedIndex(Spot.get_center)
+    for spot in spots:
+        index.add(spot)
+    for _ in range(300):
+        x, y = rng.randrange(-50, 550), rng.randrange(-50, 350)
+        max_dist = rng.choice([5, 20, 80, 1000])
+        assert index.nearest(x, y, max_dist) == brute_nearest(spots, x, y, max_dist)
+
+
+def test_sorted_index_discard():
+    rng = random.Random(8)
+    spots = random_spots(rng, 200)
+    index = SortedIndex(Spot.get_center)
+    for spot in spots:
+        index.add(spot)
+    removed = spots[::2]
+    for spot in removed:
+        index.discard(spot)
+    index.discard(removed[0])  # jau pašalintas - nieko nedaro
+    kept = spots[1::2]
+    assert len(index) == len(kept)
+    assert index.range(-1, 600) == sorted(kept, key=lambda s: s.x)
+    for _ in range(200):
+        x, y = rng.randrange(0, 500), rng.randrange(0, 300)
+        assert index.nearest(x, y, 60) == brute_nearest(kept, x, y, 60)
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print("ok", name)
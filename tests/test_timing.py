@@ -0,0 +1,53 @@
+"""
+Fiksuoto žingsnio ir laiko greičio patikrinimai
+
+    python -m pytest tests
+    python tests/test_timing.py
+"""
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from constants import *
+from timing import FixedTimestep, check_time_scale
+
+
+def rejected(func, *args, **kwargs):
+    try:
+        func(*args, **kwargs)
+    except ValueError:
+        return True
+    return False
+
+
+def test_invalid_time_scales_rejected():
+    for scale in (-1.0, -0.001, float("nan"), float("inf"), float("-inf")):
+        assert rejected(check_time_scale, scale)
+        assert rejected(FixedTimestep, scale=scale)
+    # 0 - režimas be ribų (main() vykdo be akumuliatoriaus)
+    assert check_time_scale(0) == 0
+    assert rejected(FixedTimestep, scale=0)
+
+
+def test_scaled_steps_keep_game_time():
+    for scale in (0.5, 1.0, 2.0, 10.0):
+        timestep = FixedTimestep(scale=scale)
+        steps = sum(timestep.advance(1000.0 / 144) for _ in range(144 * 4))
+        # Per 4 realias sekundes - 4 * scale žaidimo sekundžių (± vienas žingsnis akumuliatoriuje)
+        assert abs(steps - 4 * scale * SIM_HZ) <= 1
+        assert steps > 0
+
+
+def test_step_cap_grows_with_scale():
+    assert FixedTimestep(scale=1).advance(1000) == MAX_SIM_STEPS_PER_FRAME
+    assert FixedTimestep(scale=100).advance(1000) == MAX_SIM_STEPS_PER_FRAME * 100
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print("ok", name)
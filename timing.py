@@ -0,0 +1,85 @@
+"""
+Žaidimo laikrodžiai (tikras laikas arba valdomas rankiniu būdu)
+"""
+import math
+import pygame
+from constants import *
+
+
+class SystemClock:
+    """Tikro laiko laikrodis (pygame.time.get_ticks)"""
+    def now_ms(self):
+        """Grąžina dabartinį laiką milisekundėmis"""
+        return pygame.time.get_ticks()
+    
+    def advance(self, ms):
+        """Tikras laikas bėga pats - nieko nedaro"""
+        pass
+    
+    def wait(self, ms):
+        """Sustabdo žaidimą nurodytam laikui"""
+        pygame.time.wait(ms)
+
+
+class ManualClock:
+    """Rankiniu būdu stumiamas laikrodis (headless simuliacijai, testams)"""
+    def __init__(self, start_ms=0):
+        self.time_ms = float(start_ms)
+    
+    def now_ms(self):
+        """Grąžina dabartinį laiką milisekundėmis"""
+        return int(self.time_ms)
+    
+    def advance(self, ms):
+        """Pastumia laiką į priekį"""
+        self.time_ms += ms
+    
+    def wait(self, ms):
+        """Laukimas tik pastumia laiką"""
+        self.advance(ms)
+
+
+def check_time_scale(scale):
+    """Grąžina laiko greitį arba ValueError, jei jis neigiamas ar nebaigtinis (0 - be ribų)"""
+    if not (math.isfinite(scale) and scale >= 0):
+        raise ValueError("laiko greitis turi būti baigtinis skaičius >= 0: %r" % scale)
+    return scale
+
+
+class FixedTimestep:
+    """Fiksuoto žingsnio akumuliatorius: simuliacija vyksta SIM_HZ dažniu,
+    nepriklausomai nuo piešimo dažnio
+    
+    scale - žaidimo laiko greitis (2 - per realią sekundę praeina dvi žaidimo
+    sekundės); žingsnių per kadrą riba didinama tiek pat kartų. Turi būti
+    teigiamas (režimą be ribų, 0, main() vykdo be akumuliatoriaus).
+    """
+    def __init__(self, step_ms=SIM_STEP_MS, max_steps=MAX_SIM_STEPS_PER_FRAME, scale=1.0):
+        if not check_time_scale(scale):
+            raise ValueError("FixedTimestep laiko greitis turi būti teigiamas: %r" % scale)
+        self.step_ms = step_ms
+        self.scale = scale
+        self.max_steps = max(1, int(max_steps * scale))
+        self.accumulator = 0.0
+    
+    def advance(self, frame_ms):
+        """Prideda praėjusį realų laiką, grąžina kiek simuliacijos žingsnių atlikti"""
+        self.accumulator += frame_ms * self.scale
+        steps = int(self.accumulator // self.step_ms)
+        if steps > self.max_steps:
+            # Per lėtas kompiuteris - geriau sulėtinti žaidimą nei užstrigti
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.step_ms
+        return steps
+    
+    @property
+    def alpha(self):
+        """Interpoliacijos koeficientas (0..1) tarp paskutinių dviejų žingsnių"""
+        return self.accumulator / self.step_ms
+
+
+def lerp(a, b, t):
+    """Tiesinė interpoliacija tarp a ir b"""
+    return a + (b - a) * t
@@ -2,6 +2,7 @@
 Vartotojo sąsajos elementai (HUD, meniu, tekstai)
 """
 import pygame
+from collections import OrderedDict
 from constants import *
 
 
@@ -12,26 +13,87 @@ class UI:
         self.small_font = pygame.font.SysFont('Arial', 24)
         self.menu_font = pygame.font.SysFont('Arial', 32, bold=True)
         self.title_font = pygame.font.SysFont('Arial', 48, bold=True)
+        self.info_font = pygame.font.SysFont('Arial', 24, bold=False)
+        self.level_font = pygame.font.SysFont('Arial', 72, bold=True)
+        self.game_over_font = pygame.font.SysFont('Arial', 96, bold=True)
+        self.stats_font = pygame.font.SysFont('Arial', 36)
+        self.button_font = pygame.font.SysFont('Arial', 40, bold=True)
+        
+        # Atvaizduotų tekstų kešas: (šriftas, tekstas, spalva) -> Surface
+        self.text_cache = OrderedDict()
+        
+        # Sukomponuoti HUD/meniu sluoksniai: vardas -> (raktas, sluoksnis)
+        self.layers = {}
+    
+    def render_text(self, font, text, color):
+        """Grąžina atvaizduotą tekstą iš kešo (LRU), jei reikia - atvaizduoja"""
+        key = (font, text, color)
+        surf = self.text_cache.get(key)
+        if surf is not None:
+            self.text_cache.move_to_end(key)
+            return surf
+        
+        surf = font.render(text, True, color)
+        self.text_cache[key] = surf
+        if len(self.text_cache) > TEXT_CACHE_SIZE:
+            self.text_cache.popitem(last=False)
+        return surf
+    
+    def get_layer(self, name, key, build):
+        """Grąžina sukomponuotą sluoksnį; perpiešia tik pasikeitus raktui"""
+        cached = self.layers.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        layer = build()
+        self.layers[name] = (key, layer)
+        return layer
+    
+    def invalidate(self, name=None):
+        """Pažymi sluoksnį (arba visus) perpiešimui kitame kadre"""
+        if name is None:
+            self.layers.clear()
+        else:
+            self.layers.pop(name, None)
+    
+    def compose(self, parts):
+        """Sujungia [(Surface, (x, y)), ...] į vieną sluoksnį, grąžina (Surface, poslinkis)"""
+        bounds = parts[0][0].get_rect(topleft=parts[0][1])
+        for surf, pos in parts[1:]:
+            bounds.union_ip(surf.get_rect(topleft=pos))
+        layer = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        for surf, (x, y) in parts:
+            layer.blit(surf, (x - bounds.x, y - bounds.y))
+        return layer, bounds.topleft
+    
+    def build_icon_counter(self, icon, text, color):
+        """Sukomponuoja ikoną su skaičiumi šalia"""
+        txt_surf = self.render_text(self.small_font, text, color)
+        return self.compose([
+            (icon, (0, 0)),
+            (txt_surf, (icon.get_width() + 8, (icon.get_height() - txt_surf.get_height()) // 2)),
+        ])
     
     def draw_caught_fish(self, screen, caught_count):
         """Nupiešia pagautų žuvų skaičių"""
         icon_x, icon_y = 20, 50
         if self.assets['dead_img']:
-            screen.blit(self.assets['dead_img'], (icon_x, icon_y))
-            cnt_surf = self.small_font.render(str(caught_count), True, (255, 255, 255))
-            screen.blit(cnt_surf, (icon_x + self.assets['dead_img'].get_width() + 8,
-                                  icon_y + (self.assets['dead_img'].get_height() - cnt_surf.get_height()) // 2))
+            layer, (ox, oy) = self.get_layer(
+                'caught', caught_count,
+                lambda: self.build_icon_counter(self.assets['dead_img'], str(caught_count), (255, 255, 255))
+            )
+            screen.blit(layer, (icon_x + ox, icon_y + oy))
         else:
-            score = self.small_font.render(f"Pagauta žuvų: {caught_count}", True, (255, 255, 255))
+            score = self.render_text(self.small_font, f"Pagauta žuvų: {caught_count}", (255, 255, 255))
             screen.blit(score, (20, 50))
     
     def draw_coins(self, screen, coins_collected):
         """Nupiešia surinktų monetų skaičių"""
         coin_icon_pos = (20, 120)
-        screen.blit(self.assets['pinigas_icon'], coin_icon_pos)
-        coins_text = self.small_font.render(str(coins_collected), True, (255, 230, 120))
-        screen.blit(coins_text, (coin_icon_pos[0] + self.assets['pinigas_icon'].get_width() + 8,
-                                coin_icon_pos[1] + (self.assets['pinigas_icon'].get_height() - coins_text.get_height()) // 2))
+        layer, (ox, oy) = self.get_layer(
+            'coins', coins_collected,
+            lambda: self.build_icon_counter(self.assets['pinigas_icon'], str(coins_collected), (255, 230, 120))
+        )
+        screen.blit(layer, (coin_icon_pos[0] + ox, coin_icon_pos[1] + oy))
     
     def draw_lives(self, screen, player_lives):
         """Nupiešia žaidėjo gyvybes"""
@@ -40,7 +102,7 @@ class UI:
             hp_img = self.assets['hp_images'][hp_idx]
             screen.blit(hp_img, (WIDTH - hp_img.get_width() - 20, 20))
         else:
-            lives_surf = self.small_font.render(f"Gyvybės: {player_lives}", True, (255, 200, 50))
+            lives_surf = self.render_text(self.small_font, f"Gyvybės: {player_lives}", (255, 200, 50))
             screen.blit(lives_surf, (WIDTH - 180, 20))
     
     def draw_press_e_prompt(self, screen, nearest_fish_pos, scroll_x, press_e_frame):
@@ -51,7 +113,7 @@ class UI:
     
     def draw_return_warning(self, screen):
         """Nupiešia įspėjimą, kad negalima grįžti"""
-        warn = self.small_font.render("Negalite grįžti — sugaukite visas žuvis", True, (255, 80, 80))
+        warn = self.render_text(self.small_font, "Negalite grįžti — sugaukite visas žuvis", (255, 80, 80))
         warn_rect = warn.get_rect(center=(WIDTH // 2, HEIGHT - 80))
         screen.blit(warn, warn_rect)
     
@@ -63,12 +125,58 @@ class UI:
         card_w, card_h = self.assets['meniu_img'].get_size()
         card_x = (WIDTH - card_w) // 2
         card_y = (HEIGHT - card_h) // 2
-        screen.blit(self.assets['meniu_img'], (card_x, card_y))
+        
+        buy_btn_rect = self.get_buy_button(player_lives, coins_collected)
+        can_buy = buy_btn_rect is not None
+        
+        # Kortelė perpiešiama tik pasikeitus gyvybėms, monetoms ar scenai
+        card = self.get_layer(
+            'menu', (is_underwater, player_lives, coins_collected),
+            lambda: self.build_menu_card(is_underwater, player_lives, coins_collected, can_buy)
+        )
+        screen.blit(card, (card_x, card_y))
+        
+        return buy_btn_rect
+    
+    def get_buy_button(self, player_lives, coins_collected):
+        """Grąžina pirkimo mygtuko Rect ekrane, jei pirkti galima, kitaip None"""
+        if not self.assets['meniu_img']:
+            return None
+        if player_lives >= MAX_LIVES or coins_collected < COST_PER_LIFE:
+            return None
+        
+        card_w, card_h = self.assets['meniu_img'].get_size()
+        card_x = (WIDTH - card_w) // 2
+        card_y = (HEIGHT - card_h) // 2
+        btn_w, btn_h = 220, 56
+        btn_x = card_x + card_w - btn_w - 40
+        btn_y = card_y + card_h - btn_h - 40
+        return pygame.Rect(btn_x, btn_y, btn_w, btn_h)
+    
+    def draw_pause_screen(self, screen, is_underwater, player_lives, coins_collected,
+                          draw_background=None, bg_key=None):
+        """Nupiešia visą pauzės ekraną (fonas + meniu) vienu blit iš kešo"""
+        def build():
+            layer = pygame.Surface(screen.get_size(), 0, screen)
+            layer.fill((0, 0, 0))
+            if draw_background is not None:
+                draw_background(layer)
+            self.draw_menu(layer, True, is_underwater, player_lives, coins_collected)
+            return layer
+        
+        layer = self.get_layer('pause', (is_underwater, bg_key, player_lives, coins_collected), build)
+        screen.blit(layer, (0, 0))
+        return self.get_buy_button(player_lives, coins_collected)
+    
+    def build_menu_card(self, is_underwater, player_lives, coins_collected, can_buy):
+        """Sukomponuoja meniu kortelę (koordinatės - kortelės viduje)"""
+        card = self.assets['meniu_img'].copy()
+        card_w, card_h = card.get_size()
         
         # Pavadinimas
-        t_surf = self.title_font.render("Katinuko žvejyba", True, (0, 0, 0))
-        t_rect = t_surf.get_rect(midtop=(card_x + card_w // 2, card_y + 18))
-        screen.blit(t_surf, t_rect)
+        t_surf = self.render_text(self.title_font, "Katinuko žvejyba", (0, 0, 0))
+        t_rect = t_surf.get_rect(midtop=(card_w // 2, 18))
+        card.blit(t_surf, t_rect)
         
         # Valdymo instrukcijos
         if is_underwater:
@@ -89,35 +197,103 @@ class UI:
                 "ESC – tęsti"
             ]
         
-        tx = card_x + 40
-        ty = card_y + 90
+        tx = 40
+        ty = 90
         for txt in lines:
-            surf = self.menu_font.render(txt, True, (0, 0, 0))
-            screen.blit(surf, (tx, ty))
+            surf = self.render_text(self.menu_font, txt, (0, 0, 0))
+            card.blit(surf, (tx, ty))
             ty += 40
         
         # Pirkimo mygtukas
         btn_w, btn_h = 220, 56
-        btn_x = card_x + card_w - btn_w - 40
-        btn_y = card_y + card_h - btn_h - 40
-        buy_btn_rect = pygame.Rect(btn_x, btn_y, btn_w, btn_h)
-        
-        can_buy = (player_lives < MAX_LIVES) and (coins_collected >= COST_PER_LIFE)
+        btn_rect = pygame.Rect(card_w - btn_w - 40, card_h - btn_h - 40, btn_w, btn_h)
         bg_color = (60, 200, 80) if can_buy else (150, 150, 150)
         
-        pygame.draw.rect(screen, bg_color, buy_btn_rect, border_radius=8)
-        pygame.draw.rect(screen, (30, 30, 30), buy_btn_rect, 2, border_radius=8)
+        pygame.draw.rect(card, bg_color, btn_rect, border_radius=8)
+        pygame.draw.rect(card, (30, 30, 30), btn_rect, 2, border_radius=8)
         
         # Mygtukas BE kainos
         label = "Pirkti gyvybę"
-        lbl_surf = self.menu_font.render(label, True, (0, 0, 0))
-        lbl_rect = lbl_surf.get_rect(center=buy_btn_rect.center)
-        screen.blit(lbl_surf, lbl_rect)
+        lbl_surf = self.render_text(self.menu_font, label, (0, 0, 0))
+        lbl_rect = lbl_surf.get_rect(center=btn_rect.center)
+        card.blit(lbl_surf, lbl_rect)
         
         # Info tekstas
-        info_font = pygame.font.SysFont('Arial', 24, bold=False)
         info_text = f"Gyvybės: {player_lives}/{MAX_LIVES} | Monetos: {coins_collected} | Kaina: {COST_PER_LIFE} m."
-        info_surf = info_font.render(info_text, True, (0, 0, 0))
-        screen.blit(info_surf, (card_x + 40, card_y + card_h - 40 - info_surf.get_height()))
+        info_surf = self.render_text(self.info_font, info_text, (0, 0, 0))
+        card.blit(info_surf, (40, card_h - 40 - info_surf.get_height()))
+        
+        return card
+    
+    def draw_loading_screen(self, screen, progress):
+        """Nupiešia užkrovimo ekraną su progreso juosta (progress 0..1)"""
+        screen.fill((10, 30, 50))
+        title = self.render_text(self.title_font, "Katinuko žvejyba", (255, 255, 255))
+        screen.blit(title, title.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 60)))
         
-        return buy_btn_rect if can_buy else None
+        bar = pygame.Rect(0, 0, 400, 24)
+        bar.center = (WIDTH // 2, HEIGHT // 2 + 20)
+        pygame.draw.rect(screen, (255, 255, 255), bar, 2)
+        fill = bar.inflate(-6, -6)
+        fill.width = int(fill.width * max(0.0, min(1.0, progress)))
+        pygame.draw.rect(screen, (255, 230, 120), fill)
+    
+    def draw_level_banner(self, screen, current_level):
+        """Nupiešia naujo lygio pranešimą"""
+        label = f"LYGIS {current_level}!"
+        level_text = self.render_text(self.level_font, label, (255, 255, 0))
+        level_rect = level_text.get_rect(center=(WIDTH // 2, HEIGHT // 2))
+        
+        # Šešėlis
+        shadow_text = self.render_text(self.level_font, label, (0, 0, 0))
+        shadow_rect = shadow_text.get_rect(center=(WIDTH // 2 + 4, HEIGHT // 2 + 4))
+        screen.blit(shadow_text, shadow_rect)
+        screen.blit(level_text, level_rect)
+    
+    def draw_game_over(self, screen, caught_count, coins_collected, current_level, mouse_pos):
+        """Nupiešia žaidimo pabaigos ekraną, grąžina (restart, quit) mygtukus"""
+        # Game Over užrašas
+        go_text = self.render_text(self.game_over_font, "ŽAIDIMAS BAIGTAS", (255, 50, 50))
+        go_rect = go_text.get_rect(center=(WIDTH // 2, HEIGHT // 3))
+        
+        # Šešėlis
+        shadow_text = self.render_text(self.game_over_font, "ŽAIDIMAS BAIGTAS", (0, 0, 0))
+        shadow_rect = shadow_text.get_rect(center=(WIDTH // 2 + 4, HEIGHT // 3 + 4))
+        screen.blit(shadow_text, shadow_rect)
+        screen.blit(go_text, go_rect)
+        
+        # Statistika
+        stats_text = f"Pagauta žuvų: {caught_count}  |  Surinkta monetų: {coins_collected}  |  Lygis: {current_level}"
+        stats_surf = self.render_text(self.stats_font, stats_text, (255, 255, 255))
+        stats_rect = stats_surf.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 40))
+        screen.blit(stats_surf, stats_rect)
+        
+        restart_btn, quit_btn = self.get_game_over_buttons()
+        
+        # "Žaisti iš naujo" mygtukas
+        restart_color = (50, 200, 50)
+        if restart_btn.collidepoint(mouse_pos):
+            restart_color = (80, 255, 80)
+        pygame.draw.rect(screen, restart_color, restart_btn, border_radius=10)
+        pygame.draw.rect(screen, (0, 0, 0), restart_btn, 3, border_radius=10)
+        restart_text = self.render_text(self.button_font, "Žaisti iš naujo", (0, 0, 0))
+        restart_text_rect = restart_text.get_rect(center=restart_btn.center)
+        screen.blit(restart_text, restart_text_rect)
+        
+        # "Išeiti" mygtukas
+        quit_color = (200, 50, 50)
+        if quit_btn.collidepoint(mouse_pos):
+            quit_color = (255, 80, 80)
+        pygame.draw.rect(screen, quit_color, quit_btn, border_radius=10)
+        pygame.draw.rect(screen, (0, 0, 0), quit_btn, 3, border_radius=10)
+        quit_text = self.render_text(self.button_font, "Išeiti", (0, 0, 0))
+        quit_text_rect = quit_text.get_rect(center=quit_btn.center)
+        screen.blit(quit_text, quit_text_rect)
+        
+        return restart_btn, quit_btn
+    
+    def get_game_over_buttons(self):
+        """Grąžina žaidimo pabaigos ekrano mygtukus (restart, quit)"""
+        restart_btn = pygame.Rect(WIDTH // 2 - 250, HEIGHT // 2 + 50, 220, 70)
+        quit_btn = pygame.Rect(WIDTH // 2 + 30, HEIGHT // 2 + 50, 220, 70)
+        return restart_btn, quit_btn
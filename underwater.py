@@ -4,31 +4,80 @@ Povandeninis žaidimas (mini-žaidimas žvejybos metu)
 import pygame
 import random
 from constants import *
-from entities import UnderwaterFish, Shark, Bubble, Coin
+from entities import PlayerBody, UnderwaterFish, Shark, Bubble, Coin
+from assets import oriented, sprite_size
+from timing import SystemClock, lerp
+from profiler import NULL_PROFILER
+from spatial import SpatialHash
+from ai import SharkScheduler
+from pool import ObjectPool
+from soa import VectorBackend, NUMPY_AVAILABLE
 
 
 class UnderwaterGame:
-    """Povandeninio žaidimo logika"""
-    def __init__(self, assets, sounds):
+    """Povandeninio žaidimo logika
+    
+    Lygis yra level_width pločio (numatyta UW_LEVEL_WIDTH), kamera seka
+    žaidėją. Piešiami tik matomi objektai; žuvys ir rykliai, esantys toliau
+    nei UW_ACTIVE_MARGIN nuo matomos srities, atnaujinami kas
+    UW_FAR_UPDATE_INTERVAL žingsnių (paeiliui, po dalį kiekvieną žingsnį).
+    Ryklių atnaujinimus pagal atstumą iki žaidėjo skirsto shark_ai.
+    rng - RandomStreams (žuvys ir rykliai - atskiri srautai); None - bendras
+    random modulis.
+    """
+    def __init__(self, assets, sounds, clock=None, vectorized=None, level_width=None, rng=None):
         self.assets = assets
         self.sounds = sounds
+        self.clock = clock if clock is not None else SystemClock()
+        self.profiler = NULL_PROFILER
         
         # Žaidėjo būsena
         self.player_x = WIDTH // 2
         self.player_y = 80
+        self.prev_player_x, self.prev_player_y = self.player_x, self.player_y
         self.player_vy = 0.0
         self.facing_left = False
+        self.body = PlayerBody()  # atnaujinamas kartą per žingsnį, bendras visoms kolizijoms
         
-        # Kameros offset
+        # Lygis ir kamera (scroll_x - kairysis matomos srities kraštas)
+        self.level_width = level_width or UW_LEVEL_WIDTH
+        self.screens = max(1, self.level_width // WIDTH)
         self.scroll_x = 0
+        self.prev_scroll_x = 0
+        self.tick = 0
+        self.now_ms = 0  # vienas laiko momentas visam žingsniui
+        
+        # Atsitiktinių skaičių srautai
+        self.fish_rng = rng['underwater.fish'] if rng is not None else random
+        self.shark_rng = rng['underwater.sharks'] if rng is not None else random
+        
+        # Objektai (žuvys, burbulai ir monetos - iš telkinių; sąrašų tvarka nefiksuota)
+        self.fish_pool = ObjectPool(lambda: UnderwaterFish(assets['zuvis_a_img'], self.level_width, self.fish_rng))
+        self.bubble_pool = ObjectPool(
+            lambda x, y, facing_left, now_ms: Bubble(x, y, facing_left, assets['burbulai_frames'], now_ms))
+        self.coin_pool = ObjectPool(lambda x, y: Coin(x, y, assets['coin_frames']))
+        self.bubble_pool_reserved = False  # užpildomas pirmą kartą nėrus (ištekliai gali būti tingūs)
         
-        # Objektai
-        self.fish = []
+        self.fish = self.fish_pool.active
         self.sharks = []
-        self.bubbles = []
-        self.coins = []
+        self.bubbles = self.bubble_pool.active
+        self.coins = self.coin_pool.active
         self.platforms = []
         
+        # Kolizijų tinkleliai (sinchronizuojami prieš kitą užklausą)
+        self.fish_grid = SpatialHash()
+        self.shark_grid = SpatialHash()
+        self.coin_grid = SpatialHash()
+        self.platform_grid = SpatialHash()
+        
+        # Ryklių AI (pilnai - tik arti žaidėjo)
+        self.shark_ai = SharkScheduler()
+        
+        # NumPy saugyklos (None - objektai atnaujinami po vieną)
+        if vectorized is None:
+            vectorized = VECTORIZED
+        self.vector = VectorBackend() if vectorized and NUMPY_AVAILABLE else None
+        
         # Kabliukas (kur žvejyba prasidėjo)
         self.hook_x = None
         self.hook_y = None
@@ -41,38 +90,52 @@ class UnderwaterGame:
     
     def spawn_fish(self, n=6):
         """Sukuria povandenes žuvis"""
-        self.fish.clear()
+        self.fish_pool.clear()
         for _ in range(n):
-            fish = UnderwaterFish(self.assets['zuvis_a_img'])
-            self.fish.append(fish)
+            self.fish_pool.spawn()
+        self.fish_grid.rebuild(self.fish)
+        self.entities_changed('fish')
     
     def spawn_sharks(self, n=2, x_min=200, x_max=1000):
         """Sukuria ryklius"""
         self.sharks.clear()
+        self.add_sharks(n, x_min, x_max)
+    
+    def add_sharks(self, n, x_min, x_max):
+        """Prideda ryklių prie esamų"""
         for _ in range(n):
-            shark = Shark(self.assets['riklys_a_frames'])
-            shark.x = random.randint(x_min, x_max)
-            shark.y = random.randint(HEIGHT // 2 + 10, HEIGHT - 120)
+            shark = Shark(self.assets['riklys_a_frames'], self.level_width, self.shark_rng)
+            shark.x = self.shark_rng.randint(x_min, x_max)
+            shark.y = self.shark_rng.randint(HEIGHT // 2 + 10, HEIGHT - 120)
+            shark.prev_x, shark.prev_y = shark.x, shark.y
+            shark.rect.topleft = (shark.x, shark.y)
             self.sharks.append(shark)
+        self.shark_grid.rebuild(self.sharks)
+        self.entities_changed('sharks')
     
     def spawn_platforms(self):
         """Sukuria platformas"""
         self.platforms.clear()
-        pw = self.assets['platform_img'].get_width()
-        ph = self.assets['platform_img'].get_height()
-        for px, py in [(300, HEIGHT//2 + 40), (860, HEIGHT//2 + 70)]:
-            self.platforms.append(pygame.Rect(px, py, pw, ph))
+        pw, ph = sprite_size(self.assets['platform_img'])
+        for screen_x in range(0, self.screens * WIDTH, WIDTH):
+            for px, py in [(300, HEIGHT//2 + 40), (860, HEIGHT//2 + 70)]:
+                self.platforms.append(pygame.Rect(screen_x + px, py, pw, ph))
+        
+        self.platform_grid.clear()
+        for plat in self.platforms:
+            self.platform_grid.insert(plat, plat)
     
     def spawn_coins(self):
         """Sukuria monetas"""
-        self.coins.clear()
+        self.coin_pool.clear()
         if self.assets['coin_frames']:
-            cw = self.assets['coin_frames'][0].get_width()
-            ch = self.assets['coin_frames'][0].get_height()
-            for cx, cy in [(300 + self.assets['platform_img'].get_width() // 2, HEIGHT//2 + 10),
-                          (860 + self.assets['platform_img'].get_width() // 2, HEIGHT//2 + 20)]:
-                coin = Coin(cx, cy, self.assets['coin_frames'])
-                self.coins.append(coin)
+            cw, ch = sprite_size(self.assets['coin_frames'][0])
+            pw = sprite_size(self.assets['platform_img'])[0]
+            for screen_x in range(0, self.screens * WIDTH, WIDTH):
+                for cx, cy in [(300 + pw // 2, HEIGHT//2 + 10),
+                              (860 + pw // 2, HEIGHT//2 + 20)]:
+                    self.coin_pool.spawn(screen_x + cx, cy)
+        self.coin_grid.rebuild(self.coins)
     
     def initialize(self, hook_x, hook_y):
         """Inicializuoja povandeninį žaidimą"""
@@ -81,24 +144,38 @@ class UnderwaterGame:
         
         self.player_x = hook_x if hook_x is not None else WIDTH // 2
         self.player_y = max(30, int(hook_y + 10))
+        self.prev_player_x, self.prev_player_y = self.player_x, self.player_y
         self.player_vy = 0.0
+        self.body.set_shape(sprite_size(self.assets['blizge_img']), self.lure_opaque_rect())
+        self.body.place(self.player_x, self.player_y)
         
-        self.spawn_fish(6)
+        if not self.bubble_pool_reserved:
+            self.bubble_pool_reserved = True
+            if self.assets['burbulai_frames']:
+                self.bubble_pool.reserve(BUBBLE_POOL_SIZE, 0, 0, False, 0)
+        
+        self.spawn_fish(6 * self.screens)
         
-        # Rykliai šalia kabliuko
+        # Rykliai šalia kabliuko (ir po du kituose ekranuose)
         sx_min = int(hook_x + 60) if hook_x else 200
         sx_max = int(hook_x + 400) if hook_x else 800
         self.spawn_sharks(n=2, x_min=sx_min, x_max=sx_max)
+        for screen_x in range(WIDTH, self.screens * WIDTH, WIDTH):
+            self.add_sharks(2, screen_x + 200, screen_x + 1000)
         
         self.spawn_platforms()
         self.spawn_coins()
+        
+        self.tick = 0
+        self.update_camera()
+        self.prev_scroll_x = self.scroll_x
     
     def update_player(self, keys):
         """Atnaujina žaidėjo poziciją ir fiziką"""
-        player_w = self.assets['blizge_img'].get_width()
-        player_h = self.assets['blizge_img'].get_height()
-        
-        prev_x, prev_y = self.player_x, self.player_y
+        body = self.body
+        body.begin_step()
+        player_w, player_h = body.hitbox.size
+        self.prev_player_x, self.prev_player_y = self.player_x, self.player_y
         
         # Horizontalus judėjimas
         if keys[pygame.K_a] or keys[pygame.K_LEFT]:
@@ -117,81 +194,144 @@ class UnderwaterGame:
         self.player_y += self.player_vy
         
         # Ribos
-        self.player_x = max(0 + player_w // 2, min(self.player_x, WIDTH - player_w // 2))
+        self.player_x = max(0 + player_w // 2, min(self.player_x, self.level_width - player_w // 2))
         bottom_y = HEIGHT - player_h - 10
         if self.player_y >= bottom_y:
             self.player_y = bottom_y
             self.player_vy = 0.0
         
-        # Kolizija su platformomis
-        p_rect = pygame.Rect(int(self.player_x - player_w // 2), int(self.player_y), player_w, player_h)
-        prev_rect = pygame.Rect(int(prev_x - player_w // 2), int(prev_y), player_w, player_h)
+        # Kolizija su platformomis (tikrinama visa per žingsnį nukeliauta sritis)
+        body.move_to(self.player_x, self.player_y)
+        hitbox, prev_box = body.hitbox, body.prev_box
         
-        for plat in self.platforms:
-            plat_top = pygame.Rect(plat.x, plat.y, plat.width, max(28, PLATFORM_TOP_COLLIDE_H))
-            
-            crossing_top = (
-                self.player_vy > 0 and
-                prev_rect.bottom <= plat_top.top and
-                p_rect.bottom >= plat_top.top and
-                p_rect.centerx >= plat.left and p_rect.centerx <= plat.right
-            )
-            
-            if crossing_top:
-                self.player_y = plat_top.top - player_h
+        for plat in self.platform_grid.query(body.sweep):
+            # Nusileidimas: centras tą akimirką, kai apačia kerta platformos viršų
+            landing_x = body.landing_x(plat.top) if self.player_vy > 0 else None
+            if landing_x is not None and plat.left <= landing_x <= plat.right:
+                self.player_y = plat.top - player_h
                 self.player_vy = 0.0
-                p_rect.y = int(self.player_y)
+                body.move_to(self.player_x, self.player_y)
                 continue
             
-            if p_rect.colliderect(plat) and p_rect.bottom > plat_top.top + 2:
-                if prev_rect.right <= plat.left and p_rect.right > plat.left:
+            if body.sweep.colliderect(plat) and hitbox.bottom > plat.top + 2:
+                if prev_box.right <= plat.left and hitbox.right > plat.left:
                     self.player_x = plat.left - player_w // 2
-                elif prev_rect.left >= plat.right and p_rect.left < plat.right:
+                elif prev_box.left >= plat.right and hitbox.left < plat.right:
                     self.player_x = plat.right + player_w // 2
-                p_rect.x = int(self.player_x - player_w // 2)
+                body.move_to(self.player_x, self.player_y)
+    
+    def lure_opaque_rect(self):
+        """Nepermatoma blizgės dalis (abiem kryptimis) sprite'o koordinatėmis; None, jei kaukė tuščia"""
+        rects = [rect for key in ('mask_blizge_img', 'mask_blizge_img_left')
+                 for rect in self.assets[key].get_bounding_rects()]
+        return rects[0].unionall(rects[1:]) if rects else None
+    
+    def lure_mask(self):
+        """Blizgės kaukė pagal žiūrėjimo kryptį"""
+        return oriented(self.assets, 'mask_blizge_img', self.facing_left)
+    
+    def lure_overlaps(self, lure_mask, rect, mask):
+        """Tikslus patikrinimas (narrowphase): ar blizgės ir objekto kaukės persidengia"""
+        hitbox = self.body.hitbox
+        return lure_mask.overlap(mask, (rect.x - hitbox.x, rect.y - hitbox.y)) is not None
     
     def spawn_bubble(self, keys):
         """Sukuria burbulą"""
-        now_ms = pygame.time.get_ticks()
+        now_ms = self.now_ms
         if keys[pygame.K_f] and (now_ms - self.last_bubble_ms) >= BUBBLE_COOLDOWN_MS:
             if self.assets['burbulai_frames']:
-                player_w = self.assets['blizge_img'].get_width()
-                player_h = self.assets['blizge_img'].get_height()
+                player_w, player_h = self.body.hitbox.size
                 
                 spawn_x = self.player_x + (-player_w // 2 if self.facing_left else player_w // 2)
                 spawn_y = self.player_y + int(player_h * 0.4)
                 
-                bubble = Bubble(spawn_x, spawn_y, self.facing_left, self.assets['burbulai_frames'])
-                self.bubbles.append(bubble)
+                self.bubble_pool.spawn(spawn_x, spawn_y, self.facing_left, now_ms)
+                self.entities_changed('bubbles')
                 self.last_bubble_ms = now_ms
     
+    def update_camera(self):
+        """Kamera seka žaidėją (lygio ribose)"""
+        self.prev_scroll_x = self.scroll_x
+        self.scroll_x = max(0, min(int(self.player_x) - WIDTH // 2, self.level_width - WIDTH))
+    
+    def active_range(self):
+        """x intervalas, kuriame objektai atnaujinami kiekvieną žingsnį"""
+        return self.scroll_x - UW_ACTIVE_MARGIN, self.scroll_x + WIDTH + UW_ACTIVE_MARGIN
+    
+    def is_far_turn(self, index):
+        """Ar šį žingsnį atnaujinamas toli esantis objektas (paeiliui pagal indeksą)"""
+        return index % UW_FAR_UPDATE_INTERVAL == self.tick % UW_FAR_UPDATE_INTERVAL
+    
+    def entities_changed(self, name):
+        """Pažymi, kad objektų sąrašas pasikeitė (NumPy saugykla bus perkrauta)"""
+        if self.vector is not None:
+            self.vector.invalidate(name)
+    
     def update_fish(self):
-        """Atnaujina žuvis"""
-        for fish in self.fish:
-            fish.update(self.platforms, self.assets['zuvis_a_frames'])
+        """Atnaujina žuvis (toli esančias - retiau)"""
+        zuvis_a_frames = self.assets['zuvis_a_frames']
+        if self.vector is not None:
+            moved = self.vector['fish'].update(self.fish, self.platforms, zuvis_a_frames, self.level_width,
+                                               self.active_range(), self.tick)
+            self.fish_grid.mark_moved(moved)
+            return
+        
+        lo, hi = self.active_range()
+        reach = WIDTH // 4  # žuvies plotis ir poslinkis per žingsnį
+        near_platforms = [plat for plat in self.platforms if plat.right >= lo - reach and plat.left <= hi + reach]
+        moved = []
+        for i, fish in enumerate(self.fish):
+            if lo <= fish.x <= hi:
+                fish.update(near_platforms, zuvis_a_frames)
+            elif self.is_far_turn(i):
+                fish.update(self.platform_grid.query(fish.rect.inflate(reach, 0)), zuvis_a_frames,
+                            UW_FAR_UPDATE_INTERVAL)
+            else:
+                continue
+            moved.append(fish)
+        self.fish_grid.mark_moved(moved)
     
     def update_sharks(self):
         """Atnaujina ryklius"""
-        for shark in self.sharks:
-            shark.update(self.player_x, self.player_y, 
-                        self.assets['riklys_a_frames'], 
-                        self.assets['riklys_b_frames'])
+        now_ms = self.now_ms
+        if self.vector is not None:
+            moved = self.vector['sharks'].update(self.sharks, self.player_x, self.player_y, now_ms,
+                                                 self.level_width, self.shark_rng, self.shark_ai, self.tick,
+                                                 self.active_range())
+            self.shark_grid.mark_moved(moved)
+            return
+        
+        moved = self.shark_ai.update(self.sharks, self.tick, self.player_x, self.player_y,
+                                     self.assets['riklys_a_frames'], self.assets['riklys_b_frames'],
+                                     now_ms, self.active_range())
+        self.shark_grid.mark_moved(moved)
     
     def update_bubbles(self):
         """Atnaujina burbulus"""
-        for bubble in self.bubbles[:]:
-            bubble.update()
+        now_ms = self.now_ms
+        if self.vector is not None:
+            expired = self.vector['bubbles'].update(self.bubbles, now_ms)
+        else:
+            expired = []
+            for bubble in self.bubbles:
+                bubble.update()
+                expired.append(bubble.is_expired(now_ms))
+        
+        # Einama nuo galo: pašalinus burbulą jo vietą užima jau apdorotas paskutinis
+        count = len(self.bubbles)
+        for i in range(count - 1, -1, -1):
+            bubble = self.bubbles[i]
             
             # Pašalinti pasenusį
-            if bubble.is_expired():
-                self.bubbles.remove(bubble)
+            if expired[i]:
+                self.bubble_pool.release(bubble)
                 continue
             
             # Kolizija su platformomis
             popped = False
-            for plat in self.platforms:
+            for plat in self.platform_grid.query(bubble.rect):
                 if bubble.rect.colliderect(plat):
-                    self.bubbles.remove(bubble)
+                    self.bubble_pool.release(bubble)
                     popped = True
                     break
             
@@ -199,12 +339,14 @@ class UnderwaterGame:
                 continue
             
             # Kolizija su rykliais - sulėtinti
-            for shark in self.sharks:
+            for shark in self.shark_grid.query(bubble.rect):
                 if shark.rect.colliderect(bubble.rect):
-                    shark.slow_until = pygame.time.get_ticks() + SHARK_SLOW_MS
-                    if bubble in self.bubbles:
-                        self.bubbles.remove(bubble)
+                    shark.slow_until = now_ms + SHARK_SLOW_MS
+                    self.bubble_pool.release(bubble)
                     break
+        
+        if len(self.bubbles) != count:
+            self.entities_changed('bubbles')
     
     def update_coins(self):
         """Atnaujina monetas"""
@@ -214,13 +356,19 @@ class UnderwaterGame:
     def catch_fish(self, keys):
         """Žaidėjas gaudo žuvį"""
         if keys[pygame.K_SPACE]:
-            player_w = self.assets['blizge_img'].get_width()
-            player_h = self.assets['blizge_img'].get_height()
-            p_rect = pygame.Rect(int(self.player_x - player_w // 2), int(self.player_y), player_w, player_h)
+            assets = self.assets
+            lure_mask = self.lure_mask()
+            fish_masks = (assets['mask_zuvis_a_frames'], assets['mask_zuvis_a_img'],
+                          assets['mask_zuvis_a_frames_left'], assets['mask_zuvis_a_img_left'])
             
-            for fish in self.fish[:]:
-                if fish.rect.colliderect(p_rect):
-                    self.fish.remove(fish)
+            hitbox = self.body.hitbox
+            for fish in self.fish_grid.query(hitbox):
+                if (not fish.caught and hitbox.colliderect(fish.rect) and
+                        self.lure_overlaps(lure_mask, fish.rect, fish.frame(*fish_masks))):
+                    fish.caught = True
+                    self.fish_grid.remove(fish)
+                    self.fish_pool.release(fish)
+                    self.entities_changed('fish')
                     self.caught_count += 1
                     
                     # Garsas
@@ -232,14 +380,16 @@ class UnderwaterGame:
     
     def collect_coins(self):
         """Renka monetas"""
-        player_w = self.assets['blizge_img'].get_width()
-        player_h = self.assets['blizge_img'].get_height()
-        p_rect = pygame.Rect(int(self.player_x - player_w // 2), int(self.player_y), player_w, player_h)
+        lure_mask = self.lure_mask()
+        coin_masks = self.assets['mask_coin_frames']
+        
+        hitbox = self.body.hitbox
         
         collected = 0
-        for coin in self.coins[:]:
-            if p_rect.colliderect(coin.rect):
-                self.coins.remove(coin)
+        for coin in self.coin_grid.query(hitbox):
+            if hitbox.colliderect(coin.rect) and self.lure_overlaps(lure_mask, coin.rect, coin.frame(coin_masks)):
+                self.coin_grid.remove(coin)
+                self.coin_pool.release(coin)
                 collected += 1
                 
                 # Garsas
@@ -253,18 +403,18 @@ class UnderwaterGame:
     
     def check_shark_collision(self, player_lives, player_invuln_until):
         """Tikrina kolizijas su rykliais"""
-        now_ms = pygame.time.get_ticks()
+        now_ms = self.clock.now_ms()
         
         if now_ms >= player_invuln_until:
-            player_w = self.assets['blizge_img'].get_width()
-            player_h = self.assets['blizge_img'].get_height()
-            p_rect = pygame.Rect(int(self.player_x - player_w // 2), int(self.player_y), player_w, player_h)
-            p_hit = p_rect.inflate(-int(p_rect.width * 0.4), -int(p_rect.height * 0.4))
+            assets = self.assets
+            lure_mask = self.lure_mask()
+            shark_masks = (assets['mask_riklys_a_frames'], assets['mask_riklys_b_frames'],
+                           assets['mask_riklys_a_frames_left'], assets['mask_riklys_b_frames_left'])
             
-            for shark in self.sharks:
-                s_hit = shark.rect.inflate(-int(shark.rect.width * 0.6), -int(shark.rect.height * 0.6))
-                
-                if s_hit.colliderect(p_hit):
+            hurt_box = self.body.hurt_box
+            for shark in self.shark_grid.query(hurt_box):
+                if (hurt_box.colliderect(shark.rect) and
+                        self.lure_overlaps(lure_mask, shark.rect, shark.frame(*shark_masks))):
                     player_lives -= 1
                     
                     # Garsas
@@ -281,6 +431,7 @@ class UnderwaterGame:
                         self.player_x += 40
                     else:
                         self.player_x -= 40
+                    self.body.move_to(self.player_x, self.player_y)
                     
                     return player_lives, player_invuln_until, True
         
@@ -292,43 +443,61 @@ class UnderwaterGame:
     
     def update(self, keys):
         """Atnaujina visą povandeninį žaidimą"""
-        self.update_player(keys)
+        profiler = self.profiler
+        self.now_ms = self.clock.now_ms()
+        with profiler.section('update_player'):
+            self.update_player(keys)
+            self.update_camera()
         self.spawn_bubble(keys)
-        self.update_fish()
-        self.update_sharks()
-        self.update_bubbles()
+        with profiler.section('update_fish'):
+            self.update_fish()
+        with profiler.section('update_sharks'):
+            self.update_sharks()
+        with profiler.section('update_bubbles'):
+            self.update_bubbles()
         self.update_coins()
         self.catch_fish(keys)
+        self.tick += 1
     
-    def draw(self, screen):
-        """Nupiešia povandeninį žaidimą"""
+    def draw(self, screen, alpha=1.0):
+        """Nupiešia povandeninį žaidimą (alpha - interpoliacija tarp žingsnių)
+        
+        Kiekvienas sluoksnis piešiamas vienu fblits; sluoksnių tvarka - z tvarka.
+        Piešiami tik objektai, patenkantys į matomą sritį.
+        """
+        assets = self.assets
+        cam_x = lerp(self.prev_scroll_x, self.scroll_x, alpha)
+        x0, x1 = cam_x - WIDTH // 4, cam_x + WIDTH  # kairėje - atsarga objekto pločiui
+        
         # Fonas
-        screen.blit(self.assets['dugnas'], (0, 0))
+        screen.blit(assets['dugnas'], (0, 0))
         
         # Platformos
-        for plat in self.platforms:
-            screen.blit(self.assets['platform_img'], plat.topleft)
+        platform_img = assets['platform_img']
+        screen.fblits([(platform_img, (plat.x - cam_x, plat.y)) for plat in self.platforms if x0 <= plat.x < x1])
         
         # Žuvys
-        for fish in self.fish:
-            fish.draw(screen, self.assets['zuvis_a_frames'], self.assets['zuvis_a_img'])
+        fish_frames = (assets['zuvis_a_frames'], assets['zuvis_a_img'],
+                       assets['zuvis_a_frames_left'], assets['zuvis_a_img_left'], cam_x, alpha)
+        screen.fblits([fish.blit_args(*fish_frames) for fish in self.fish if x0 <= fish.x < x1])
         
         # Burbulai
-        for bubble in self.bubbles:
-            bubble.draw(screen, self.assets['burbulai_frames'], self.scroll_x)
+        burbulai_frames = assets['burbulai_frames']
+        screen.fblits([bubble.blit_args(burbulai_frames, cam_x, alpha)
+                       for bubble in self.bubbles if x0 <= bubble.x < x1])
         
         # Monetos
-        for coin in self.coins:
-            coin.draw(screen, self.assets['coin_frames'], self.scroll_x)
+        coin_frames = assets['coin_frames']
+        screen.fblits([coin.blit_args(coin_frames, cam_x) for coin in self.coins if x0 <= coin.x < x1])
         
         # Rykliai
-        for shark in self.sharks:
-            shark.draw(screen, self.assets['riklys_a_frames'], 
-                      self.assets['riklys_b_frames'], self.scroll_x)
+        shark_frames = (assets['riklys_a_frames'], assets['riklys_b_frames'], cam_x,
+                        assets['riklys_a_frames_left'], assets['riklys_b_frames_left'], alpha)
+        screen.fblits([shark.blit_args(*shark_frames) for shark in self.sharks if x0 <= shark.x < x1])
         
         # Žaidėjas
-        player_w = self.assets['blizge_img'].get_width()
-        blizge_draw = self.assets['blizge_img']
-        if self.facing_left:
-            blizge_draw = pygame.transform.flip(self.assets['blizge_img'], True, False)
-        screen.blit(blizge_draw, (int(self.player_x - player_w // 2), int(self.player_y)))
+        player_w = self.body.hitbox.width
+        blizge_draw = oriented(assets, 'blizge_img', self.facing_left)
+        player_x = lerp(self.prev_player_x, self.player_x, alpha)
+        player_y = lerp(self.prev_player_y, self.player_y, alpha)
+        screen.blit(blizge_draw, (int(player_x - player_w // 2 - cam_x), int(player_y)))
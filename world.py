@@ -0,0 +1,110 @@
+"""
+Begalinis paviršiaus pasaulis, skaidomas į vienodo pločio gabalus
+
+Gabalo turinys (žvejybos taškai ir varnos) generuojamas deterministiškai iš
+pasaulio sėklos, lygio ir gabalo numerio, todėl pašalintas ir vėl užkrautas
+gabalas yra toks pat. Laikomi tik gabalai prie matomos srities, todėl
+atmintis ir paieška nepriklauso nuo nuplaukto atstumo. Fonas kartojamas
+pagal scroll_x (draw_bg_tiled), tad jo gabaluose laikyti nereikia.
+"""
+import random
+from constants import *
+from entities import Varna, FishingSpot
+from spatial import SortedIndex
+from rng import new_seed
+
+
+class SurfaceChunk:
+    """Pasaulio gabalas [x, x + SURFACE_CHUNK_WIDTH) su savo telkiniais ir varnomis"""
+    def __init__(self, index, spots, varnas):
+        self.index = index
+        self.x = index * SURFACE_CHUNK_WIDTH
+        self.spots = spots
+        self.varnas = varnas
+
+
+class SurfaceWorld:
+    """Paviršiaus gabalų srautas: užkrauna gabalus priekyje, pašalina už nugaros
+    
+    spots ir varnas - užkrautų gabalų objektai (gabalų tvarka); sąrašai
+    perkuriami tik pasikeitus užkrautiems gabalams. spot_index - neišjungti
+    užkrautų gabalų telkiniai, surikiuoti pagal centro x. Sugauti telkiniai
+    įsimenami pagal raktą, kad vėl užkrautame gabale liktų išjungti.
+    """
+    def __init__(self, seed=None, level=1):
+        self.seed = seed if seed is not None else new_seed()
+        self.chunks = {}
+        self.completed = set()
+        self.spots = []
+        self.varnas = []
+        self.spot_index = SortedIndex(FishingSpot.get_center)
+        self.reset(level)
+    
+    def reset(self, level=1):
+        """Pradeda lygio pasaulį iš naujo (matoma sritis - pasaulio pradžia)"""
+        self.level = level
+        self.chunks.clear()
+        self.completed.clear()
+        self.spot_index.clear()
+        self.loaded_range = None
+        self.stream(0)
+    
+    def generate(self, index):
+        """Sukuria gabalą (tas pats sėklai, lygiui ir numeriui)"""
+        rng = random.Random(f"{self.seed}:{self.level}:{index}")
+        x0 = index * SURFACE_CHUNK_WIDTH
+        
+        # Žvejybos taškas (pirmame gabale - šalia pradinės žaidėjo vietos)
+        spot_w = ZUVYS_FRAME_WIDTH * ZUVYS_SCALE
+        if index == 0:
+            spot_x = WIDTH // 2 - 100
+        else:
+            spot_x = x0 + rng.randint(SURFACE_SPOT_MARGIN, SURFACE_CHUNK_WIDTH - SURFACE_SPOT_MARGIN - spot_w)
+        spot = FishingSpot(spot_x, HEIGHT // 2 + 150, (index, 0))
+        spot.disabled = spot.key in self.completed
+        
+        # Varnos skraido savo gabalo ribose
+        crow_w = VARNA_FRAME_WIDTH * VARNA_SCALE
+        x_range = (x0, x0 + SURFACE_CHUNK_WIDTH - crow_w)
+        varnas = [Varna(rng.randint(*x_range), rng.randint(60, 180), rng, x_range)
+                  for _ in range(SURFACE_CHUNK_CROWS)]
+        return SurfaceChunk(index, [spot], varnas)
+    
+    def stream(self, view_x):
+        """Užkrauna gabalus aplink matomą sritį [view_x, view_x + WIDTH) ir pašalina tolimus"""
+        first = max(0, int(view_x) // SURFACE_CHUNK_WIDTH - SURFACE_CHUNKS_BEHIND)
+        last = int(view_x + WIDTH) // SURFACE_CHUNK_WIDTH + SURFACE_CHUNKS_AHEAD
+        if self.loaded_range == (first, last):
+            return
+        self.loaded_range = (first, last)
+        
+        for index in list(self.chunks):
+            if not first <= index <= last:
+                for spot in self.chunks.pop(index).spots:
+                    self.spot_index.discard(spot)
+        for index in range(first, last + 1):
+            if index not in self.chunks:
+                chunk = self.chunks[index] = self.generate(index)
+                for spot in chunk.spots:
+                    if not spot.disabled:
+                        self.spot_index.add(spot)
+        
+        ordered = [self.chunks[index] for index in range(first, last + 1)]
+        self.spots = [spot for chunk in ordered for spot in chunk.spots]
+        self.varnas = [varna for chunk in ordered for varna in chunk.varnas]
+    
+    def complete(self, spot):
+        """Pažymi telkinį sugautu (išlieka ir vėl užkrovus gabalą)"""
+        spot.disabled = True
+        self.spot_index.discard(spot)
+        if spot.key is not None:
+            self.completed.add(spot.key)
+    
+    def nearest_spot(self, x, y, max_dist=PROXIMITY_THRESHOLD):
+        """Artimiausias neišjungtas telkinys (pagal centrą) ne toliau nei max_dist; arba None"""
+        return self.spot_index.nearest(x, y, max_dist)[0]
+    
+    def visible_spots(self, view_x):
+        """Neišjungti telkiniai, matomi srityje [view_x, view_x + WIDTH)"""
+        half_w = ZUVYS_FRAME_WIDTH * ZUVYS_SCALE / 2
+        return self.spot_index.range(view_x - half_w, view_x + WIDTH + half_w)